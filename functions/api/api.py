@@ -1,4 +1,9 @@
 from mangum import Mangum
 from app.main import app
 
-handler = Mangum(app)
+# Fast-start entry point. Mangum would otherwise run the lifespan (building
+# the council, warming and then closing the pool) on every invocation;
+# instead the council service and its pool are built on the first request
+# and kept warm for the life of the container.
+# Measure with: python -m benchmarks.coldstart --profile
+handler = Mangum(app, lifespan="off")
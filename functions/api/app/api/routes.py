@@ -1,18 +1,158 @@
 
-from fastapi import APIRouter, HTTPException
-import httpx
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 import asyncio
-from app.services.council import CouncilService
-from app.models.schemas import ChatRequest, ChatResponse, ModelInfo
-from typing import List
+import hashlib
+import os
+import time
+from app.api.responses import CompactJSONResponse, dumps, encoded_response
+from app.core.config import settings
+from app.models.schemas import BatchRequest, ChatRequest, ChatResponse, ConversationHistory, JobStatus, JobSubmitResponse, LongInputRequest, ModelInfo
+from app.services.admission import AdmissionController, AdmissionRejected, Ticket, client_id
+from app.services.batch import BATCH_ID_PATTERN
+from app.services.blobs import BlobStore, sniff_media_type
+from app.services.conversations import CONVERSATION_ID_PATTERN, ConversationStore
+from app.services.jobs import JobManager, JobQueueFull
+from app.services.metrics import CLIENT_DISCONNECTS, COUNCIL_SECONDS, collect_request_timings, metrics
+from app.services.registry import is_image_model
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Dict, List, Optional, TypeVar, Union
 
-router = APIRouter()
-council_service = CouncilService()
+if TYPE_CHECKING:
+    from app.services.council import CouncilService
 
-@router.post("/council", response_model=ChatResponse)
-async def conduct_council_meeting(request: ChatRequest):
+router = APIRouter(default_response_class=CompactJSONResponse)
+T = TypeVar("T")
+_council_service: Optional["CouncilService"] = None
+
+def get_council_service() -> "CouncilService":
+    # Built on first use rather than at import: the council module pulls in
+    # httpx and the provider plumbing, which a cold serverless start should
+    # only pay for once a request actually needs it.
+    global _council_service
+    if _council_service is None:
+        from app.services.council import CouncilService
+        settings.check_keys()
+        _council_service = CouncilService()
+        metrics.register_collector(_council_service.metric_samples)
+    return _council_service
+
+_job_manager: Optional[JobManager] = None
+
+def get_job_manager() -> JobManager:
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager.from_settings()
+    return _job_manager
+
+_admission: Optional[AdmissionController] = None
+
+def get_admission_controller() -> AdmissionController:
+    global _admission
+    if _admission is None:
+        _admission = AdmissionController.from_settings()
+        metrics.register_collector(_admission.metric_samples)
+    return _admission
+
+async def _admit(http_request: Request, cost: int) -> Optional[Ticket]:
+    # `cost`: the member calls the request can have in flight at once
+    behind_netlify = "aws.event" in http_request.scope or settings.TRUST_NETLIFY_CLIENT_IP
+    try:
+        return await get_admission_controller().acquire(
+            client_id(http_request.headers, http_request.client.host if http_request.client else None, behind_netlify),
+            cost,
+        )
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+async def _release_after(stream: AsyncIterator[str], ticket: Optional[Ticket]) -> AsyncIterator[str]:
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        get_admission_controller().release(ticket)
+
+async def _wait_for_disconnect(http_request: Request):
+    # The body has already been read, so the next message is the disconnect
+    # (Mangum only sends it once the response is complete)
+    while (await http_request.receive())["type"] != "http.disconnect":
+        pass
+
+async def _unless_disconnected(http_request: Request, work: Awaitable[T], endpoint: str) -> Optional[T]:
+    """
+    Awaits `work`, or cancels it (member calls, Chairman and all) and
+    returns None if the client goes away first. The cancelled upstream calls
+    show up in polymind_upstream_responses_total as status="cancelled".
+    """
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(http_request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+            CLIENT_DISCONNECTS.inc(endpoint=endpoint)
+    return None if task.cancelled() else task.result()
+
+async def _stop_on_disconnect(http_request: Request, stream: AsyncIterator[str], endpoint: str) -> AsyncIterator[str]:
+    """
+    Relays `stream` until it ends or the client goes away. The stream runs in
+    its own task so a disconnect cancels it wherever it is waiting (say, on
+    the Chairman's first token), not only when it next yields.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    async def pump():
+        try:
+            async for chunk in stream:
+                queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(finished)
+
+    def on_disconnect(watcher: asyncio.Future):
+        if not watcher.cancelled() and not task.done():
+            task.cancel()
+            CLIENT_DISCONNECTS.inc(endpoint=endpoint)
+
+    task = asyncio.create_task(pump())
+    watcher = asyncio.ensure_future(_wait_for_disconnect(http_request))
+    watcher.add_done_callback(on_disconnect)
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is finished:
+                break
+            yield chunk
+        if not task.cancelled():
+            # Surfaces an error raised inside the stream
+            task.result()
+    finally:
+        watcher.cancel()
+        task.cancel()
+
+_blob_store: Optional[BlobStore] = None
+
+def get_blob_store() -> Optional[BlobStore]:
+    # Serving images needs only the files, not the council service
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = BlobStore.from_settings()
+    return _blob_store
+
+_conversation_store: Optional[ConversationStore] = None
+
+def get_conversation_store() -> ConversationStore:
+    global _conversation_store
+    if _conversation_store is None:
+        _conversation_store = ConversationStore.from_settings()
+    return _conversation_store
+
+def _clean_prompt(prompt: str) -> str:
     # Sanitize prompt
-    clean_prompt = request.prompt.strip()
+    clean_prompt = prompt.strip()
     if not clean_prompt:
         raise HTTPException(status_code=400, detail="Prompt cannot be empty.")
 
@@ -20,33 +160,430 @@ async def conduct_council_meeting(request: ChatRequest):
     if len(clean_prompt) > 500:
         raise HTTPException(status_code=400, detail="Input limit exceeded. Please limit your prompt to 500 characters.")
 
-    async with httpx.AsyncClient() as client:
-        # 0. Dream Mode Override (use local var to avoid mutating the request)
-        models_to_use = ["or-seed"] if request.dream_mode else request.active_models
+    return clean_prompt
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {dumps(data).decode()}\n\n"
+
+def _check_conversation_id(conversation_id: str):
+    if not CONVERSATION_ID_PATTERN.match(conversation_id):
+        raise HTTPException(status_code=400, detail="conversation_id may only contain letters, digits, '-' and '_' (max 64).")
+
+def _load_history(request: ChatRequest) -> Optional[List[Dict[str, str]]]:
+    # Dream Mode prompts go to an image model, which gets no chat history
+    if request.conversation_id is None or request.dream_mode:
+        return None
+    _check_conversation_id(request.conversation_id)
+    return get_conversation_store().history(request.conversation_id)
+
+def _remember_turn(request: ChatRequest, prompt: str, answer: str, results: List[Dict[str, Any]]):
+    # Failed rounds and image answers would only pollute the next turn's context
+    if request.conversation_id is None or request.dream_mode or not any(r.get("ok") for r in results):
+        return
+    get_conversation_store().append(request.conversation_id, prompt, answer)
+
+def _select_members(request: Union[ChatRequest, BatchRequest]) -> List[Dict[str, Any]]:
+    # Dream Mode Override (use local var to avoid mutating the request)
+    models_to_use = ["or-seed"] if request.dream_mode else request.active_models
+    return get_council_service().get_active_members(models_to_use)
+
+@router.post("/council", response_model=ChatResponse)
+async def conduct_council_meeting(request: ChatRequest, http_request: Request):
+    clean_prompt = _clean_prompt(request.prompt)
+    start = time.perf_counter()
+    timings = collect_request_timings() if request.include_timings else None
+
+    # 1. Select Active Models
+    selected_members = _select_members(request)
+    council_service = get_council_service()
+    history = _load_history(request)
+
+    # 2. Near-duplicate of a prompt this council already answered? (Not for
+    # Dream Mode: image prompts are short enough that "a red cat" and
+    # "a red car" look alike. Nor for follow-ups, whose answer depends on
+    # the earlier turns.)
+    hit = None if request.dream_mode or history else council_service.semantic_lookup(selected_members, clean_prompt)
+    if hit is not None:
+        cached, similarity = hit
+        response = ChatResponse(**cached, cached=True, cache_similarity=similarity)
+    else:
+        # 3. Parallel execution and synthesis, once admission control lets us fan out
+        ticket = await _admit(http_request, len(selected_members))
+        try:
+            deliberation = await _unless_disconnected(
+                http_request,
+                council_service.deliberate(selected_members, clean_prompt, request.dream_mode, history=history),
+                "council",
+            )
+        finally:
+            get_admission_controller().release(ticket)
+        if deliberation is None:
+            # Nobody is listening; 499 is what proxies log for a closed client
+            return Response(status_code=499)
+        if not request.dream_mode and not history:
+            council_service.semantic_store(selected_members, clean_prompt, deliberation)
+        response = ChatResponse(**deliberation)
+    _remember_turn(request, clean_prompt, response.unified_response, response.individual_responses)
+    response.conversation_id = request.conversation_id
+
+    elapsed = time.perf_counter() - start
+    COUNCIL_SECONDS.observe(elapsed, endpoint="council")
+    if timings is not None:
+        timings["total"] = round(elapsed, 4)
+        response.timings = timings
+    # Already validated above; encoded directly instead of through response_model
+    return encoded_response(http_request, dumps(response.model_dump()))
+
+@router.post("/council/jobs", response_model=JobSubmitResponse, status_code=202)
+async def submit_council_job(request: ChatRequest, http_request: Request):
+    """
+    Starts a deliberation in the background and returns its job id at once.
+    Poll GET /council/jobs/{job_id} for member results as they land and for
+    the final /council response body once the job is done.
+    """
+    if "aws.event" in http_request.scope:
+        # Mangum: the event loop is frozen between invocations, so the job would never finish
+        raise HTTPException(
+            status_code=501,
+            detail="Council jobs need a long-running server and are not available on this deployment. Use /api/council/stream instead.",
+        )
+    clean_prompt = _clean_prompt(request.prompt)
+    selected_members = _select_members(request)
+    history = _load_history(request)
+    jobs = get_job_manager()
+
+    async def work(job_id: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        timings = collect_request_timings() if request.include_timings else None
+        response = ChatResponse(**await get_council_service().deliberate(
+            selected_members,
+            clean_prompt,
+            request.dream_mode,
+            on_result=lambda index, result: jobs.store.record_member(job_id, index, result),
+            on_synthesis=lambda: jobs.store.set_status(job_id, "synthesizing"),
+            history=history,
+        ))
+        _remember_turn(request, clean_prompt, response.unified_response, response.individual_responses)
+        response.conversation_id = request.conversation_id
+        elapsed = time.perf_counter() - start
+        COUNCIL_SECONDS.observe(elapsed, endpoint="council_job")
+        if timings is not None:
+            timings["total"] = round(elapsed, 4)
+            response.timings = timings
+        return response.model_dump()
+
+    try:
+        job_id = jobs.submit([{"id": m["id"], "name": m["name"]} for m in selected_members], work)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return JobSubmitResponse(job_id=job_id, status="queued")
+
+@router.post("/council/batch")
+async def run_council_batch(request: BatchRequest, http_request: Request):
+    """
+    Deliberates every prompt with the same council and streams one JSON line
+    per prompt as it finishes (see CouncilService.run_batch), then a final
+    {"type": "summary"} line. Sending the same batch_id again resumes from
+    its checkpoint instead of re-asking the models.
+    """
+    if not request.prompts:
+        raise HTTPException(status_code=400, detail="Batch has no prompts.")
+    if len(request.prompts) > settings.BATCH_MAX_PROMPTS:
+        raise HTTPException(status_code=400, detail=f"Batch limit exceeded. Please send at most {settings.BATCH_MAX_PROMPTS} prompts.")
+    prompts = []
+    for index, prompt in enumerate(request.prompts):
+        try:
+            prompts.append(_clean_prompt(prompt))
+        except HTTPException as e:
+            raise HTTPException(status_code=400, detail=f"Prompt {index}: {e.detail}")
 
-        # 1. Select Active Models
-        selected_members = council_service.get_active_members(models_to_use)
+    checkpoint_path = None
+    if request.batch_id is not None:
+        if not BATCH_ID_PATTERN.match(request.batch_id):
+            raise HTTPException(status_code=400, detail="batch_id may only contain letters, digits, '-' and '_' (max 64).")
+        checkpoint_path = os.path.join(settings.BATCH_CHECKPOINT_DIR, f"{request.batch_id}.jsonl")
 
-        # 2. Parallel Execution
-        tasks = [council_service.fetch_model_response(client, member, clean_prompt) for member in selected_members]
-        results = await asyncio.gather(*tasks)
+    selected_members = _select_members(request)
+    council_service = get_council_service()
+    # Held for the whole batch, sized for the deliberations it runs at once
+    ticket = await _admit(http_request, len(selected_members) * min(len(prompts), settings.BATCH_MAX_CONCURRENT_PROMPTS))
 
-        # 3. Synthesis
+    async def record_stream():
+        start = time.perf_counter()
+        counts = {"ok": 0, "failed": 0, "resumed": 0}
+        async for record in council_service.run_batch(prompts, selected_members, request.dream_mode, checkpoint_path):
+            counts["ok" if record["ok"] else "failed"] += 1
+            counts["resumed"] += bool(record.get("resumed"))
+            yield dumps({"type": "result", **record}) + b"\n"
+        elapsed = time.perf_counter() - start
+        COUNCIL_SECONDS.observe(elapsed, endpoint="council_batch")
+        yield dumps({"type": "summary", "total": len(prompts), **counts, "seconds": round(elapsed, 3)}) + b"\n"
+
+    # A cancelled batch resumes from its checkpoint when sent again
+    return StreamingResponse(
+        _release_after(_stop_on_disconnect(http_request, record_stream(), "council_batch"), ticket),
+        media_type="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},
+        background=BackgroundTask(get_admission_controller().release, ticket)
+    )
+
+@router.get("/council/jobs/{job_id}", response_model=JobStatus)
+async def get_council_job(job_id: str, http_request: Request):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+    return encoded_response(http_request, dumps(job))
+
+@router.post("/council/stream")
+async def stream_council_meeting(request: ChatRequest, http_request: Request):
+    """
+    Server-Sent Events variant of /council.
+
+    Emits `member_delta` / `member_done` events as each member's tokens arrive
+    (and `member_omitted` for stragglers cut off by the quorum policy),
+    then `chairman_delta` events for the synthesis, and finally a `done` event
+    carrying the same body /council would have returned.
+    """
+    clean_prompt = _clean_prompt(request.prompt)
+    history = _load_history(request)
+    council_service = get_council_service()
+    selected_members = _select_members(request)
+    # Admitted before the response starts so a rejection is still a plain 503
+    ticket = await _admit(http_request, len(selected_members))
+
+    async def event_stream():
+        start = time.perf_counter()
+        timings = collect_request_timings() if request.include_timings else None
+
+        # 1. Relay member tokens as they arrive
+        results = [None] * len(selected_members)
+        omitted = []
+        async for index, event in council_service.stream_members(selected_members, clean_prompt, history=history):
+            member = selected_members[index]
+            if event["type"] == "delta":
+                yield _sse("member_delta", {"index": index, "id": member["id"], "kind": event["kind"], "delta": event["delta"]})
+            elif event["type"] == "omitted":
+                omitted.append(member)
+                yield _sse("member_omitted", {"index": index, "id": member["id"], "name": member["name"]})
+            else:
+                results[index] = event["result"]
+                yield _sse("member_done", {"index": index, "id": member["id"], **event["result"]})
+        answered = [(selected_members[i], r) for i, r in enumerate(results) if r is not None]
+        results = [r for _, r in answered]
+
+        # 2. Stream the synthesis, unless the members already agree
+        agreement, learn, vectors = None, False, None
         if request.dream_mode:
-            # In Dream Mode, return the single model's response directly
             unified_answer = results[0]["content"] if results else "Dream generation failed."
             chairman_name = "Seedream Protocol"
         else:
-            unified_answer = await council_service.synthesize_responses(client, clean_prompt, results)
-            chairman_name = "Llama 3.3 70B (Groq)"
+            consensus, agreement, vectors = council_service.check_consensus(results)
+            if consensus is not None:
+                unified_answer, chairman_name = consensus
+                learn = True
+                yield _sse("chairman_delta", {"kind": "content", "delta": unified_answer})
+            else:
+                unified_answer, chairman_name = "", ""
+                async for event in council_service.stream_synthesis(clean_prompt, results, omitted, history=history):
+                    if event["type"] == "delta":
+                        yield _sse("chairman_delta", {"kind": event["kind"], "delta": event["delta"]})
+                    else:
+                        # The candidate that actually answered
+                        unified_answer, chairman_name = event["result"]["content"], event["result"]["name"]
+                        learn = event["result"]["ok"]
+        if learn:
+            council_service.profiles.observe_round(answered, unified_answer, vectors)
 
-        # 4. Format Output
-        return ChatResponse(
+        _remember_turn(request, clean_prompt, unified_answer, results)
+        elapsed = time.perf_counter() - start
+        COUNCIL_SECONDS.observe(elapsed, endpoint="council_stream")
+        if timings is not None:
+            timings["total"] = round(elapsed, 4)
+        yield _sse("done", ChatResponse(
             unified_response=unified_answer,
             individual_responses=results,
-            chairman_model=chairman_name
-        )
+            chairman_model=chairman_name,
+            omitted_members=[m["id"] for m in omitted],
+            timings=timings,
+            conversation_id=request.conversation_id,
+            agreement_score=agreement
+        ).model_dump())
+
+    return StreamingResponse(
+        _release_after(_stop_on_disconnect(http_request, event_stream(), "council_stream"), ticket),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also covers a stream that is never iterated (client gone before the first byte)
+        background=BackgroundTask(get_admission_controller().release, ticket)
+    )
+
+@router.post("/council/long")
+async def long_input_council_meeting(request: LongInputRequest, http_request: Request):
+    """
+    Server-Sent Events council run over a document too long for /council.
+
+    Emits `plan` (chunk count and readers), `chunk_done` as each member's
+    notes on its chunk arrive, `reduce` for each level of Chairman merging,
+    then `chairman_delta` events and a `done` event with the /council body.
+    """
+    clean_prompt = _clean_prompt(request.prompt)
+    document = request.document.strip()
+    if not document:
+        raise HTTPException(status_code=400, detail="Document cannot be empty.")
+    if len(document) > settings.LONG_INPUT_MAX_CHARS:
+        raise HTTPException(status_code=400, detail=f"Document limit exceeded. Please limit it to {settings.LONG_INPUT_MAX_CHARS} characters.")
+
+    council_service = get_council_service()
+    # Image models have nothing to say about a document
+    selected_members = [m for m in council_service.get_active_members(request.active_models) if not is_image_model(m)]
+    # Chunk reads share one LONG_INPUT_MAX_CONCURRENT cap, whatever the council size
+    ticket = await _admit(http_request, settings.LONG_INPUT_MAX_CONCURRENT)
+
+    async def event_stream():
+        start = time.perf_counter()
+        timings = collect_request_timings() if request.include_timings else None
+        unified_answer, chairman_name, individual = "", "", []
+        async for event in council_service.map_reduce(selected_members, clean_prompt, document):
+            if event["type"] == "plan":
+                yield _sse("plan", {"chunks": event["chunks"], "members": event["members"]})
+            elif event["type"] == "chunk":
+                yield _sse("chunk_done", {"index": event["index"], **event["result"]})
+            elif event["type"] == "reduce":
+                yield _sse("reduce", {"level": event["level"], "groups": event["groups"]})
+            elif event["type"] == "delta":
+                yield _sse("chairman_delta", {"kind": event["kind"], "delta": event["delta"]})
+            else:
+                unified_answer, chairman_name = event["result"]["content"], event["result"]["name"]
+                individual = event["individual_responses"]
+
+        elapsed = time.perf_counter() - start
+        COUNCIL_SECONDS.observe(elapsed, endpoint="council_long")
+        if timings is not None:
+            timings["total"] = round(elapsed, 4)
+        yield _sse("done", ChatResponse(
+            unified_response=unified_answer,
+            individual_responses=individual,
+            chairman_model=chairman_name,
+            timings=timings
+        ).model_dump())
+
+    return StreamingResponse(
+        _release_after(_stop_on_disconnect(http_request, event_stream(), "council_long"), ticket),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(get_admission_controller().release, ticket)
+    )
+
+@router.get("/conversations/stats")
+async def get_conversation_stats():
+    return get_conversation_store().stats()
+
+@router.get("/conversations/{conversation_id}", response_model=ConversationHistory)
+async def get_conversation(conversation_id: str):
+    _check_conversation_id(conversation_id)
+    messages = get_conversation_store().history(conversation_id)
+    if not messages:
+        raise HTTPException(status_code=404, detail="Conversation not found or expired.")
+    return ConversationHistory(conversation_id=conversation_id, messages=messages)
+
+@router.delete("/conversations/{conversation_id}", status_code=204)
+async def delete_conversation(conversation_id: str):
+    _check_conversation_id(conversation_id)
+    get_conversation_store().delete(conversation_id)
 
 @router.get("/models", response_model=List[ModelInfo])
-async def get_models():
-    return council_service.get_models()
+async def get_models(request: Request):
+    # The list only changes with the registry file or member health, so
+    # clients revalidate with If-None-Match and usually get an empty 304
+    body = dumps(get_council_service().get_models())
+    etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={settings.MODELS_CACHE_MAX_AGE}"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+@router.get("/images/{digest}")
+async def get_image(digest: str, request: Request):
+    """
+    A Dream Mode image from the blob store. Blobs are content-addressed, so
+    they are cached as immutable; FileResponse streams the file and answers
+    Range requests.
+    """
+    blobs = get_blob_store()
+    path = blobs.open_path(digest) if blobs is not None else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found or expired.")
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    with open(path, "rb") as f:
+        media_type = sniff_media_type(f.read(12))
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+@router.get("/blobs/stats")
+async def get_blob_stats():
+    blobs = get_council_service().blobs
+    if blobs is None:
+        return {"enabled": False}
+    return {"enabled": True, **blobs.stats()}
+
+@router.get("/registry/stats")
+async def get_registry_stats():
+    return get_council_service().registry.stats()
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    cache = get_council_service().cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+@router.get("/semantic-cache/stats")
+async def get_semantic_cache_stats():
+    semantic_cache = get_council_service().semantic_cache
+    if semantic_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **semantic_cache.stats()}
+
+@router.get("/chairman/stats")
+async def get_chairman_stats():
+    council_service = get_council_service()
+    return council_service.chairmen.stats(council_service.chairman_candidates())
+
+@router.get("/consensus/stats")
+async def get_consensus_stats():
+    return get_council_service().consensus.stats()
+
+@router.get("/profiles/stats")
+async def get_profile_stats():
+    return get_council_service().profiles.stats()
+
+@router.get("/coalescing/stats")
+async def get_coalescing_stats():
+    return get_council_service().single_flight.stats()
+
+@router.get("/ratelimit/stats")
+async def get_ratelimit_stats():
+    return get_council_service().scheduler.stats()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    # Prometheus text exposition format
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@router.get("/circuit/stats")
+async def get_circuit_stats():
+    return get_council_service().breakers.stats()
+
+@router.get("/hedging/stats")
+async def get_hedging_stats():
+    return get_council_service().hedge_stats
+
+@router.get("/admission/stats")
+async def get_admission_stats():
+    return get_admission_controller().stats()
+
+@router.get("/jobs/stats")
+async def get_job_stats():
+    return get_job_manager().stats()
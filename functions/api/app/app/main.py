@@ -1,20 +0,0 @@
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
-from app.api.routes import router as api_router
-import os
-
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION)
-
-
-# CORS: Allow all origins to prevent preflight issues during migration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,6 +1,5 @@
 
 import os
-from dotenv import load_dotenv
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -12,8 +11,12 @@ ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 # Locate the .env file in the project root
 # current file is in netlify/functions/app/core/config.py
 # .env is in project root (5 levels up from this file)
+# Deployed functions get their keys from the environment and ship no .env, so
+# only import python-dotenv when there is actually a file to read.
 env_path = Path(__file__).resolve().parent.parent.parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+if env_path.is_file():
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=env_path)
 
 class Settings:
     PROJECT_NAME: str = "PolyMind API"
@@ -25,6 +28,168 @@ class Settings:
     NVIDIA_API_KEY: str = os.getenv("NVIDIA_API_KEY")
     OPENROUTER_API_KEY: str = os.getenv("OPENROUTER_API_KEY")
 
+    # Provider endpoints (overridable to point at a local stub)
+    GROQ_BASE_URL: str = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+    NVIDIA_BASE_URL: str = os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1")
+    OPENROUTER_BASE_URL: str = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+
+    # Upstream connection pool (one per provider, shared across requests)
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+    HTTP_WARM_UP: bool = os.getenv("HTTP_WARM_UP", "true").lower() == "true"
+
+    # Early quorum: when the Chairman may start without the slowest members
+    # QUORUM_MODE is "all" (wait for everyone), "first_k" or "deadline"
+    QUORUM_MODE: str = os.getenv("QUORUM_MODE", "all")
+    QUORUM_MIN_MEMBERS: int = int(os.getenv("QUORUM_MIN_MEMBERS", "0"))
+    QUORUM_DEADLINE: float = float(os.getenv("QUORUM_DEADLINE", "20"))
+    QUORUM_DETACH_STRAGGLERS: bool = os.getenv("QUORUM_DETACH_STRAGGLERS", "false").lower() == "true"
+
+    # Member response cache (in-memory LRU, optionally backed by SQLite so it
+    # survives cold starts; on Netlify point it at /tmp)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_TTL: float = float(os.getenv("CACHE_TTL", "3600"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_SQLITE_PATH: str = os.getenv("CACHE_SQLITE_PATH", "")
+
+    # Per-provider scheduling: token bucket (requests/second + burst) and an
+    # AIMD concurrency limit that adapts to 429s and x-ratelimit-* headers
+    GROQ_RPS: float = float(os.getenv("GROQ_RPS", "5"))
+    GROQ_BURST: int = int(os.getenv("GROQ_BURST", "10"))
+    GROQ_MAX_CONCURRENCY: int = int(os.getenv("GROQ_MAX_CONCURRENCY", "16"))
+    NVIDIA_RPS: float = float(os.getenv("NVIDIA_RPS", "5"))
+    NVIDIA_BURST: int = int(os.getenv("NVIDIA_BURST", "10"))
+    NVIDIA_MAX_CONCURRENCY: int = int(os.getenv("NVIDIA_MAX_CONCURRENCY", "16"))
+    OPENROUTER_RPS: float = float(os.getenv("OPENROUTER_RPS", "5"))
+    OPENROUTER_BURST: int = int(os.getenv("OPENROUTER_BURST", "10"))
+    OPENROUTER_MAX_CONCURRENCY: int = int(os.getenv("OPENROUTER_MAX_CONCURRENCY", "16"))
+    RATE_LIMIT_MAX_WAIT: float = float(os.getenv("RATE_LIMIT_MAX_WAIT", "10"))
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+    RETRY_BACKOFF_BASE: float = float(os.getenv("RETRY_BACKOFF_BASE", "0.5"))
+    RETRY_BACKOFF_CAP: float = float(os.getenv("RETRY_BACKOFF_CAP", "8"))
+
+    # Dream Mode images: with BLOB_DIR set, generated images are written to a
+    # content-addressed store there and responses link to
+    # IMAGE_BASE_URL/<sha256> instead of inlining them. It must be storage
+    # every instance serving /api/images shares and that outlives them (not
+    # /tmp on Netlify, where each container has its own); unset, images stay
+    # inline as data URLs
+    BLOB_DIR: str = os.getenv("BLOB_DIR", "")
+    BLOB_MAX_BYTES: int = int(os.getenv("BLOB_MAX_BYTES", str(512 * 1024 * 1024)))
+    IMAGE_BASE_URL: str = os.getenv("IMAGE_BASE_URL", "/api/images")
+
+    # Model registry: JSON file of council members (bundled app/core/models.json
+    # when empty), re-read when it changes; /api/models may be cached this long
+    MODELS_CONFIG_PATH: str = os.getenv("MODELS_CONFIG_PATH", "")
+    MODELS_RELOAD_INTERVAL: float = float(os.getenv("MODELS_RELOAD_INTERVAL", "2"))
+    MODELS_CACHE_MAX_AGE: int = int(os.getenv("MODELS_CACHE_MAX_AGE", "30"))
+
+    # /council and job responses of at least COMPRESSION_MIN_BYTES are sent
+    # brotli- (when installed) or gzip-compressed to clients that accept it.
+    # Not under Mangum (Netlify), where the edge compresses responses
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+    # Multi-turn conversations: prior turns kept per conversation_id (memory
+    # LRU, optionally SQLite) and fitted into each member's context, using at
+    # most CONVERSATION_HISTORY_TOKENS of history per call
+    CONVERSATION_MAX_ENTRIES: int = int(os.getenv("CONVERSATION_MAX_ENTRIES", "1000"))
+    CONVERSATION_MAX_TURNS: int = int(os.getenv("CONVERSATION_MAX_TURNS", "50"))
+    CONVERSATION_TTL: float = float(os.getenv("CONVERSATION_TTL", "86400"))
+    CONVERSATION_SQLITE_PATH: str = os.getenv("CONVERSATION_SQLITE_PATH", "")
+    CONVERSATION_HISTORY_TOKENS: int = int(os.getenv("CONVERSATION_HISTORY_TOKENS", "4000"))
+    CONVERSATION_CONTEXT_TOKENS: int = int(os.getenv("CONVERSATION_CONTEXT_TOKENS", "8192"))
+
+    # Semantic cache: whole /council responses reused for near-duplicate prompts
+    # (MinHash over character n-grams, in memory). Off by default.
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "100000"))
+    SEMANTIC_CACHE_TTL: float = float(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+
+    # Circuit breakers per provider and per model: open after CIRCUIT_FAILURE_RATE
+    # of the last CIRCUIT_WINDOW calls failed (5xx, connection errors, or
+    # slower than CIRCUIT_SLOW_CALL_SECONDS), retry after CIRCUIT_OPEN_SECONDS
+    # (doubling up to CIRCUIT_MAX_OPEN_SECONDS). Long-running servers also
+    # probe tripped models every CIRCUIT_PROBE_INTERVAL seconds.
+    CIRCUIT_ENABLED: bool = os.getenv("CIRCUIT_ENABLED", "true").lower() == "true"
+    CIRCUIT_WINDOW: int = int(os.getenv("CIRCUIT_WINDOW", "20"))
+    CIRCUIT_MIN_CALLS: int = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+    CIRCUIT_FAILURE_RATE: float = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+    CIRCUIT_SLOW_CALL_SECONDS: float = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "30"))
+    CIRCUIT_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+    CIRCUIT_MAX_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_MAX_OPEN_SECONDS", "300"))
+    CIRCUIT_PROBE_INTERVAL: float = float(os.getenv("CIRCUIT_PROBE_INTERVAL", "15"))
+
+    # Chairman prompt budgeting: member deliberations are compacted to fit
+    DELIBERATION_TOKEN_BUDGET: int = int(os.getenv("DELIBERATION_TOKEN_BUDGET", "3000"))
+    DELIBERATION_DEDUP_THRESHOLD: float = float(os.getenv("DELIBERATION_DEDUP_THRESHOLD", "0.85"))
+
+    # Chairman selection: candidates come from the "chairmen" table of the
+    # models file; each gets CHAIRMAN_TIMEOUT seconds (to its first token when
+    # streaming) before the next is asked. The most preferred candidate whose
+    # expected time is within CHAIRMAN_SWITCH_SLACK of the fastest is chosen;
+    # candidates without measurements are assumed to take CHAIRMAN_DEFAULT_SECONDS,
+    # and a passed-over preferred candidate is retried every CHAIRMAN_RETRY_SECONDS.
+    CHAIRMAN_TIMEOUT: float = float(os.getenv("CHAIRMAN_TIMEOUT", "20"))
+    CHAIRMAN_SWITCH_SLACK: float = float(os.getenv("CHAIRMAN_SWITCH_SLACK", "0.5"))
+    CHAIRMAN_DEFAULT_SECONDS: float = float(os.getenv("CHAIRMAN_DEFAULT_SECONDS", "5"))
+    CHAIRMAN_RETRY_SECONDS: float = float(os.getenv("CHAIRMAN_RETRY_SECONDS", "60"))
+
+    # Consensus fast path: when every pair of member answers is at least
+    # CONSENSUS_THRESHOLD similar (and they state the same numbers), the most
+    # central answer is returned without calling the Chairman
+    CONSENSUS_ENABLED: bool = os.getenv("CONSENSUS_ENABLED", "true").lower() == "true"
+    CONSENSUS_THRESHOLD: float = float(os.getenv("CONSENSUS_THRESHOLD", "0.9"))
+    CONSENSUS_MIN_MEMBERS: int = int(os.getenv("CONSENSUS_MIN_MEMBERS", "2"))
+
+    # "auto" council: members are picked from rolling per-model profiles,
+    # at most AUTO_COUNCIL_MAX_MEMBERS (and at least AUTO_COUNCIL_MIN_MEMBERS)
+    # whose p95 latency fits AUTO_COUNCIL_LATENCY_BUDGET seconds (0 disables
+    # the budget). Models with fewer than AUTO_COUNCIL_MIN_SAMPLES calls are
+    # tried first, and AUTO_COUNCIL_EXPLORE is the chance of trying a random one.
+    AUTO_COUNCIL_MAX_MEMBERS: int = int(os.getenv("AUTO_COUNCIL_MAX_MEMBERS", "3"))
+    AUTO_COUNCIL_MIN_MEMBERS: int = int(os.getenv("AUTO_COUNCIL_MIN_MEMBERS", "2"))
+    AUTO_COUNCIL_LATENCY_BUDGET: float = float(os.getenv("AUTO_COUNCIL_LATENCY_BUDGET", "15"))
+    AUTO_COUNCIL_MIN_SAMPLES: int = int(os.getenv("AUTO_COUNCIL_MIN_SAMPLES", "5"))
+    AUTO_COUNCIL_EXPLORE: float = float(os.getenv("AUTO_COUNCIL_EXPLORE", "0.1"))
+
+    # Admission control for the council endpoints: capacity in concurrent
+    # member calls, fair-queued per client IP; requests that cannot start
+    # within ADMISSION_QUEUE_TIMEOUT get a fast 503. The IP is the socket
+    # peer, or Netlify's x-nf-client-connection-ip header under Mangum or
+    # with TRUST_NETLIFY_CLIENT_IP (only behind a proxy that sets it)
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    ADMISSION_MAX_INFLIGHT: int = int(os.getenv("ADMISSION_MAX_INFLIGHT", "32"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+    ADMISSION_QUEUE_TIMEOUT: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "10"))
+    TRUST_NETLIFY_CLIENT_IP: bool = os.getenv("TRUST_NETLIFY_CLIENT_IP", "false").lower() == "true"
+
+    # Background council jobs (POST /api/council/jobs). Only served by a
+    # long-running ASGI server: under Mangum (Netlify) the event loop stops
+    # between invocations, so the endpoint answers 501 there
+    JOBS_SQLITE_PATH: str = os.getenv("JOBS_SQLITE_PATH", "")
+    JOBS_MAX_CONCURRENT: int = int(os.getenv("JOBS_MAX_CONCURRENT", "4"))
+    JOBS_MAX_PENDING: int = int(os.getenv("JOBS_MAX_PENDING", "32"))
+    JOBS_RETENTION: float = float(os.getenv("JOBS_RETENTION", "3600"))
+
+    # Batch runs (POST /api/council/batch): prompts deliberated at once, member
+    # calls per provider the batch may hold, and where resumable batches keep
+    # their JSONL checkpoints
+    BATCH_MAX_PROMPTS: int = int(os.getenv("BATCH_MAX_PROMPTS", "1000"))
+    BATCH_MAX_CONCURRENT_PROMPTS: int = int(os.getenv("BATCH_MAX_CONCURRENT_PROMPTS", "8"))
+    BATCH_PROVIDER_CONCURRENCY: int = int(os.getenv("BATCH_PROVIDER_CONCURRENCY", "4"))
+    BATCH_CHECKPOINT_DIR: str = os.getenv("BATCH_CHECKPOINT_DIR", "/tmp/polymind-batches")
+
+    # Long-input mode (POST /api/council/long): documents are cut into chunks
+    # of at most LONG_INPUT_CHUNK_TOKENS (less where a model's context is
+    # smaller), read by members in parallel and reduced by the Chairman
+    LONG_INPUT_MAX_CHARS: int = int(os.getenv("LONG_INPUT_MAX_CHARS", "200000"))
+    LONG_INPUT_CHUNK_TOKENS: int = int(os.getenv("LONG_INPUT_CHUNK_TOKENS", "3000"))
+    LONG_INPUT_MAX_CONCURRENT: int = int(os.getenv("LONG_INPUT_MAX_CONCURRENT", "8"))
+
     def check_keys(self):
         missing = []
         if not self.GROQ_API_KEY:
@@ -36,5 +201,5 @@ class Settings:
         if missing:
             print(f"WARNING: Missing API keys: {', '.join(missing)}. Associated models will fail.")
 
+# check_keys() runs when the council service is first built (app/api/routes.py)
 settings = Settings()
-settings.check_keys()
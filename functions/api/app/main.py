@@ -1,11 +1,33 @@
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.routes import router as api_router
+from app.api.routes import router as api_router, get_council_service
 import os
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Long-running servers build the council up front; the Mangum entry point
+    # skips the lifespan and lets the first request do it (see api.py).
+    from app.services.http_pool import ProviderClientPool
+
+    # One pooled client per provider for the lifetime of the worker
+    http_pool = ProviderClientPool.from_settings()
+    council_service = get_council_service()
+    council_service.attach_pool(http_pool)
+    if settings.HTTP_WARM_UP:
+        await http_pool.warm_up()
+    prober = None
+    if settings.CIRCUIT_ENABLED and settings.CIRCUIT_PROBE_INTERVAL > 0:
+        prober = asyncio.create_task(council_service.run_health_prober(settings.CIRCUIT_PROBE_INTERVAL))
+    yield
+    if prober is not None:
+        prober.cancel()
+    await http_pool.close()
+
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
 
 
 # CORS: Allow all origins to prevent preflight issues during migration
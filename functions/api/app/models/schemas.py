@@ -1,17 +1,81 @@
 
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from typing_extensions import NotRequired, TypedDict
 
 class ChatRequest(BaseModel):
     prompt: str
+    # Member ids; "auto" picks them from model profiles (among the listed ids, if any)
     active_models: List[str]
     dream_mode: bool = False
+    include_timings: bool = False
+    # Client-chosen id; earlier turns of the same conversation are sent as context
+    conversation_id: Optional[str] = None
+
+class BatchRequest(BaseModel):
+    prompts: List[str]
+    active_models: List[str]
+    dream_mode: bool = False
+    # Reuse an id to resume a batch from its checkpoint
+    batch_id: Optional[str] = None
+
+class LongInputRequest(BaseModel):
+    # The question stays within the usual prompt limit; the document may be long
+    prompt: str
+    document: str
+    active_models: List[str]
+    include_timings: bool = False
+
+class MemberResult(TypedDict):
+    # One member's answer as it travels from the provider call to the response
+    name: str
+    content: str
+    # False for error placeholders
+    ok: bool
+    # Content is the model's thinking trace, not a final answer
+    reasoning: NotRequired[bool]
+    # The fallback route that answered for the member
+    fallback: NotRequired[str]
 
 class ChatResponse(BaseModel):
     unified_response: str
-    individual_responses: List[Dict[str, Any]]
+    individual_responses: List[MemberResult]
     chairman_model: str
+    omitted_members: List[str] = []
+    timings: Optional[Dict[str, Any]] = None
+    # Served from the semantic cache, and how similar the cached prompt was
+    cached: bool = False
+    cache_similarity: Optional[float] = None
+    conversation_id: Optional[str] = None
+    # Lowest pairwise similarity of the member answers; at or above
+    # CONSENSUS_THRESHOLD the Chairman was skipped
+    agreement_score: Optional[float] = None
 
 class ModelInfo(BaseModel):
     id: str
     name: str
+    # "healthy", "degraded" or "down" according to the circuit breakers
+    health: str = "healthy"
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+class JobMember(BaseModel):
+    index: int
+    id: str
+    name: str
+    result: Optional[MemberResult] = None
+
+class JobStatus(BaseModel):
+    id: str
+    status: str
+    members: List[JobMember]
+    result: Optional[ChatResponse] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+class ConversationHistory(BaseModel):
+    conversation_id: str
+    messages: List[Dict[str, str]]
@@ -0,0 +1,245 @@
+import asyncio
+import heapq
+import math
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from app.core.config import settings
+from app.services.metrics import metrics
+
+ADMISSION_WAIT_SECONDS = metrics.histogram(
+    "polymind_admission_wait_seconds",
+    "Time council requests spent queued for admission.",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0),
+)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted in time; `retry_after` is in whole seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__({
+            "queue_full": "The Council is at capacity. Please try again shortly.",
+            "deadline": "The Council is busy and could not take this request in time. Please try again shortly.",
+        }[reason])
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def client_id(headers: Mapping[str, str], host: Optional[str], behind_netlify: bool = False) -> str:
+    """
+    Fair-queuing identity: the client IP as Netlify's edge saw it when the
+    request came through Netlify (`behind_netlify`), otherwise the socket
+    peer. Only values the caller cannot choose count: an API key nobody
+    checks, an X-Forwarded-For hop, or x-nf-client-connection-ip sent
+    straight to a server Netlify does not front would let one client mint a
+    fresh identity per request and jump the queue.
+    """
+    ip = headers.get("x-nf-client-connection-ip") if behind_netlify else None
+    return "ip:" + (ip or host or "unknown")
+
+
+class Ticket:
+    __slots__ = ("client", "cost", "start_tag", "seq", "enqueued_at", "granted_at", "future", "granted", "released")
+
+    def __init__(self, client: str, cost: int, start_tag: float, seq: int):
+        self.client = client
+        self.cost = cost
+        self.start_tag = start_tag
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.granted_at = 0.0
+        self.future: Optional[asyncio.Future] = None
+        self.granted = False
+        self.released = False
+
+
+class AdmissionController:
+    """
+    Admission control in front of council fan-out.
+
+    Capacity is `max_inflight` member calls; a request costs one unit per
+    member it asks for. Waiting requests are ordered by start-time fair
+    queuing: each client's requests get virtual start tags spaced by their
+    cost, so a client asking for eight members is served a quarter as often
+    as one asking for two, and no client can starve the others. Requests are
+    turned away at once (queue_full / deadline) when the queue holds
+    `max_queue` requests that are all ahead of them or the predicted wait
+    exceeds `queue_timeout`; a full queue otherwise pushes out its last
+    request, and a request still queued at its deadline gives up.
+    """
+
+    def __init__(self, max_inflight: int = 32, max_queue: int = 64, queue_timeout: float = 10.0, enabled: bool = True):
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.enabled = enabled
+        self.inflight = 0
+        self.queued = 0
+        self.queued_cost = 0
+        self._heap: List[Tuple[float, int, Ticket]] = []
+        self._finish_tags: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._seq = 0
+        # Smoothed duration of an admitted request, for wait predictions
+        # (unknown until the first one finishes)
+        self._service_seconds: Optional[float] = None
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "deadline": 0}
+
+    @classmethod
+    def from_settings(cls) -> "AdmissionController":
+        return cls(
+            max_inflight=settings.ADMISSION_MAX_INFLIGHT,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            enabled=settings.ADMISSION_ENABLED,
+        )
+
+    def _start_tag(self, client: str) -> float:
+        return max(self._virtual_time, self._finish_tags.get(client, 0.0))
+
+    def predicted_wait(self, cost: int, start_tag: float) -> float:
+        """
+        Seconds until a request of `cost` with `start_tag` would be admitted:
+        only queued requests with earlier tags are ahead of it, and capacity
+        is assumed to drain in waves of one average request duration.
+        """
+        if self._service_seconds is None:
+            return 0.0
+        ahead = sum(t.cost for tag, _, t in self._heap if tag <= start_tag and not (t.released or t.future.done()))
+        backlog = self.inflight + ahead + cost - self.max_inflight
+        if backlog <= 0:
+            return 0.0
+        return math.ceil(backlog / self.max_inflight) * self._service_seconds
+
+    def _ticket(self, client: str, cost: int) -> Ticket:
+        start = self._start_tag(client)
+        self._finish_tags[client] = start + cost
+        self._seq += 1
+        return Ticket(client, cost, start, self._seq)
+
+    def _grant(self, ticket: Ticket):
+        ticket.granted = True
+        ticket.granted_at = time.monotonic()
+        self._virtual_time = max(self._virtual_time, ticket.start_tag)
+        self.inflight += ticket.cost
+        self.admitted += 1
+        ADMISSION_WAIT_SECONDS.observe(ticket.granted_at - ticket.enqueued_at)
+
+    def _reject(self, reason: str, wait: float):
+        self.rejected[reason] += 1
+        raise AdmissionRejected(reason, max(1, math.ceil(wait)))
+
+    async def acquire(self, client: str, cost: int) -> Optional[Ticket]:
+        """Waits for capacity; returns a ticket to release() or raises AdmissionRejected."""
+        if not self.enabled:
+            return None
+        # A request larger than the whole capacity still runs, alone
+        cost = max(1, min(cost, self.max_inflight))
+        if not self.queued and self.inflight + cost <= self.max_inflight:
+            ticket = self._ticket(client, cost)
+            self._grant(ticket)
+            return ticket
+
+        start_tag = self._start_tag(client)
+        wait = self.predicted_wait(cost, start_tag)
+        if self.queued >= self.max_queue and not self._push_out(start_tag, wait):
+            self._reject("queue_full", wait)
+        if wait > self.queue_timeout:
+            self._reject("deadline", wait - self.queue_timeout)
+
+        ticket = self._ticket(client, cost)
+        ticket.future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (ticket.start_tag, ticket.seq, ticket))
+        self.queued += 1
+        self.queued_cost += cost
+        try:
+            await asyncio.wait_for(ticket.future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._dequeue(ticket)
+            self._reject("deadline", self.predicted_wait(cost, ticket.start_tag))
+        except BaseException:
+            # Cancelled while queued, or right after being granted
+            if ticket.granted:
+                self.release(ticket, record=False)
+            else:
+                self._dequeue(ticket)
+            raise
+        return ticket
+
+    def _push_out(self, start_tag: float, wait: float) -> bool:
+        """
+        Full queue: evicts the queued request with the latest tag if it is
+        behind `start_tag`, so a client over its share cannot hold every
+        queue slot against newcomers. Returns whether a slot was freed.
+        """
+        waiting = [entry for entry in self._heap if not (entry[2].released or entry[2].future.done())]
+        if not waiting:
+            return False
+        tag, _, victim = max(waiting, key=lambda entry: (entry[0], entry[1]))
+        if tag <= start_tag:
+            return False
+        self._dequeue(victim)
+        self.rejected["queue_full"] += 1
+        victim.future.set_exception(AdmissionRejected("queue_full", max(1, math.ceil(wait))))
+        return True
+
+    def _dequeue(self, ticket: Ticket):
+        # Left in the heap and skipped by _dispatch
+        if not ticket.granted and not ticket.released:
+            ticket.released = True
+            self.queued -= 1
+            self.queued_cost -= ticket.cost
+            # It may have been the head holding back requests that fit now
+            self._dispatch()
+
+    def release(self, ticket: Optional[Ticket], record: bool = True):
+        """Returns the ticket's capacity; safe to call more than once."""
+        if ticket is None or ticket.released:
+            return
+        ticket.released = True
+        self.inflight -= ticket.cost
+        if record:
+            seconds = time.monotonic() - ticket.granted_at
+            previous = self._service_seconds
+            self._service_seconds = seconds if previous is None else previous + 0.2 * (seconds - previous)
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._heap:
+            _, _, ticket = self._heap[0]
+            if ticket.released or ticket.future.done():
+                heapq.heappop(self._heap)
+                continue
+            # Strict tag order: a large request at the head waits for room
+            # rather than being overtaken by smaller ones forever
+            if self.inflight and self.inflight + ticket.cost > self.max_inflight:
+                return
+            heapq.heappop(self._heap)
+            self.queued -= 1
+            self.queued_cost -= ticket.cost
+            self._grant(ticket)
+            ticket.future.set_result(None)
+        if not self.queued:
+            # Idle: forget finish tags so returning clients start level
+            self._finish_tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "inflight": self.inflight,
+            "max_inflight": self.max_inflight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "service_seconds": round(self._service_seconds, 3) if self._service_seconds is not None else None,
+        }
+
+    def metric_samples(self):
+        return [
+            ("polymind_admission_queue_depth", "gauge", "Council requests waiting for admission.", [({}, self.queued)]),
+            ("polymind_admission_inflight", "gauge", "Member calls admitted and not yet finished.", [({}, self.inflight)]),
+            ("polymind_admission_rejections_total", "counter", "Council requests turned away by admission control.",
+             [({"reason": reason}, count) for reason, count in self.rejected.items()]),
+        ]
@@ -0,0 +1,46 @@
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List
+
+# Batch ids become checkpoint file names, so keep them to a safe alphabet
+BATCH_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class BatchCheckpoint:
+    """
+    Append-only JSONL record of finished batch items. Re-running a batch with
+    the same checkpoint skips every prompt already answered; a torn last line
+    from a crash is ignored and that prompt simply runs again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def load(self, prompts: List[str]) -> Dict[int, Dict[str, Any]]:
+        """Finished records by index, keeping only those whose prompt still matches."""
+        done: Dict[int, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                index = record.get("index")
+                if isinstance(index, int) and 0 <= index < len(prompts) and record.get("prompt") == prompts[index]:
+                    done[index] = record
+        return done
+
+    def append(self, record: Dict[str, Any]):
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
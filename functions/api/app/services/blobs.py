@@ -0,0 +1,135 @@
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from typing import Dict, Optional, Tuple
+from app.core.config import settings
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_DATA_URL = re.compile(r"^data:([\w.+-]+/[\w.+-]+)?(;[^,]*)?,")
+
+# Magic numbers of the formats image models return
+_SIGNATURES = (
+    (b"\x89PNG", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def sniff_media_type(head: bytes) -> str:
+    for signature, media_type in _SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def decode_data_url(url: str) -> Optional[bytes]:
+    """The payload of a base64 `data:` URL, or None for anything else."""
+    match = _DATA_URL.match(url)
+    if match is None or ";base64" not in (match.group(2) or ""):
+        return None
+    try:
+        return binascii.a2b_base64(url[match.end():])
+    except binascii.Error:
+        return None
+
+
+class BlobStore:
+    """
+    Content-addressed files under `root`, named by their SHA-256. Writes go
+    through a temporary file and a rename, so a blob is either absent or
+    complete; the least recently written blobs are deleted once the store
+    holds more than `max_bytes`.
+    """
+
+    def __init__(self, root: str, max_bytes: int = 512 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._sizes: Optional[Dict[str, Tuple[float, int]]] = None  # digest -> (mtime, size), scanned lazily
+        self.writes = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls) -> Optional["BlobStore"]:
+        if not settings.BLOB_DIR:
+            return None
+        return cls(settings.BLOB_DIR, settings.BLOB_MAX_BYTES)
+
+    def links_to_blob(self, content: str) -> bool:
+        """Whether `content` links to an image in this store."""
+        return f"]({settings.IMAGE_BASE_URL.rstrip('/')}/" in content
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _index(self) -> Dict[str, Tuple[float, int]]:
+        if self._sizes is None:
+            self._sizes = {}
+            if os.path.isdir(self.root):
+                for shard in os.scandir(self.root):
+                    if shard.is_dir():
+                        for entry in os.scandir(shard.path):
+                            if DIGEST_PATTERN.match(entry.name):
+                                stat = entry.stat()
+                                self._sizes[entry.name] = (stat.st_mtime, stat.st_size)
+        return self._sizes
+
+    def put(self, data: bytes) -> str:
+        """Stores `data` (once) and returns its digest. Raises OSError if the disk write fails."""
+        digest = hashlib.sha256(data).hexdigest()
+        index = self._index()
+        path = self.path(digest)
+        if digest in index and os.path.exists(path):
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        index[digest] = (os.path.getmtime(path), len(data))
+        self.writes += 1
+        self._evict(keep=digest)
+        return digest
+
+    def _evict(self, keep: str):
+        index = self._index()
+        total = sum(size for _, size in index.values())
+        for digest, (_, size) in sorted(index.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            try:
+                os.unlink(self.path(digest))
+            except FileNotFoundError:
+                pass
+            del index[digest]
+            total -= size
+            self.evictions += 1
+
+    def open_path(self, digest: str) -> Optional[str]:
+        """The blob's file path if it is stored here, else None."""
+        if not DIGEST_PATTERN.match(digest):
+            return None
+        path = self.path(digest)
+        return path if os.path.isfile(path) else None
+
+    def stats(self):
+        index = self._index()
+        return {
+            "root": self.root,
+            "blobs": len(index),
+            "bytes": sum(size for _, size in index.values()),
+            "max_bytes": self.max_bytes,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,117 @@
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple
+from app.core.config import settings
+from app.services.stats import RollingWindow
+
+
+class ChairmanSelector:
+    """
+    Picks the Chairman for each synthesis from an ordered candidate list.
+
+    A candidate's expected time to an answer is its median recent synthesis
+    time (`default_seconds` until it has one), stretched by the backlog at its
+    provider's rate limiter, plus its recent failure rate times `timeout`,
+    since a failed attempt costs up to that long before the next candidate is
+    asked. The most preferred candidate within `slack` of the fastest is
+    chosen, so a healthy primary keeps the job; the rest follow as failovers,
+    fastest first.
+
+    A candidate is only measured when it is asked, so a more preferred one
+    that was passed over gets a trial synthesis every `retry_seconds`; if it
+    answers, its old history is dropped and it competes afresh.
+    """
+
+    def __init__(self, timeout: float = 20.0, slack: float = 0.5, default_seconds: float = 5.0, retry_seconds: float = 60.0, window: int = 50):
+        self.timeout = timeout
+        self.slack = slack
+        self.default_seconds = default_seconds
+        self.retry_seconds = retry_seconds
+        self.window = window
+        self._latency: Dict[str, RollingWindow] = {}
+        self._outcomes: Dict[str, Deque[bool]] = {}
+        self._tried_at: Dict[str, float] = {}
+        self._trials: Set[str] = set()
+        self.selected: Dict[str, int] = {}
+        self.failovers = 0
+
+    @classmethod
+    def from_settings(cls) -> "ChairmanSelector":
+        return cls(settings.CHAIRMAN_TIMEOUT, settings.CHAIRMAN_SWITCH_SLACK, settings.CHAIRMAN_DEFAULT_SECONDS, settings.CHAIRMAN_RETRY_SECONDS)
+
+    def _failure_rate(self, candidate_id: str) -> float:
+        outcomes = self._outcomes.get(candidate_id)
+        return outcomes.count(False) / len(outcomes) if outcomes else 0.0
+
+    def expected_seconds(self, candidate: Dict[str, Any], blocked: float = 0.0, backlog: float = 0.0) -> float:
+        """
+        `blocked`: seconds until the provider accepts requests again;
+        `backlog`: calls queued at its limiter per concurrency slot.
+        """
+        window = self._latency.get(candidate["id"])
+        median = window.percentile(50) if window is not None else None
+        base = self.default_seconds if median is None else median
+        return blocked + base * (1 + backlog) + self._failure_rate(candidate["id"]) * self.timeout
+
+    def order(
+        self,
+        candidates: List[Dict[str, Any]],
+        available: Callable[[Dict[str, Any]], bool],
+        load: Callable[[Dict[str, Any]], Tuple[float, float]],
+    ) -> List[Dict[str, Any]]:
+        """
+        The candidates to try, in order. `available` rules a candidate out
+        (open circuit breaker, no API key) unless none is left; `load` gives
+        its provider's (blocked, backlog).
+        """
+        usable = [c for c in candidates if available(c)] or list(candidates)
+        expected = {c["id"]: self.expected_seconds(c, *load(c)) for c in usable}
+        fastest = min(expected.values())
+        chosen = next(c for c in usable if expected[c["id"]] <= fastest * (1 + self.slack))
+        now = time.monotonic()
+        for candidate in usable[:usable.index(chosen)]:
+            if candidate["id"] in self._tried_at and now - self._tried_at[candidate["id"]] >= self.retry_seconds:
+                chosen = candidate
+                self._trials.add(candidate["id"])
+                break
+        return [chosen] + sorted((c for c in usable if c is not chosen), key=lambda c: expected[c["id"]])
+
+    def record(self, candidate: Dict[str, Any], seconds: float, ok: bool):
+        """Feeds one attempt; a timed-out attempt is recorded as failed after `seconds`."""
+        candidate_id = candidate["id"]
+        self._tried_at[candidate_id] = time.monotonic()
+        if candidate_id in self._trials:
+            self._trials.discard(candidate_id)
+            if ok:
+                # Recovered: its old timeouts say nothing about it any more
+                self._latency.pop(candidate_id, None)
+                self._outcomes.pop(candidate_id, None)
+        self._latency.setdefault(candidate_id, RollingWindow(self.window)).add(seconds)
+        self._outcomes.setdefault(candidate_id, deque(maxlen=self.window)).append(ok)
+        if ok:
+            self.selected[candidate_id] = self.selected.get(candidate_id, 0) + 1
+
+    def stats(self, candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "failovers": self.failovers,
+            "candidates": [
+                {
+                    "id": c["id"],
+                    "name": c["name"],
+                    "provider": c["provider"],
+                    "median_seconds": self._latency[c["id"]].percentile(50) if c["id"] in self._latency else None,
+                    "failure_rate": round(self._failure_rate(c["id"]), 3),
+                    "answered": self.selected.get(c["id"], 0),
+                }
+                for c in candidates
+            ],
+        }
+
+    def metric_samples(self):
+        return [
+            ("polymind_chairman_answers_total", "counter", "Syntheses answered by each Chairman candidate.",
+             [({"chairman": candidate_id}, count) for candidate_id, count in self.selected.items()]),
+            ("polymind_chairman_failovers_total", "counter", "Syntheses handed to the next Chairman candidate after a timeout or failure.",
+             [({}, self.failovers)]),
+        ]
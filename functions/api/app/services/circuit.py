@@ -0,0 +1,201 @@
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from app.core.config import settings
+
+# Statuses that say the model or provider is unusable, whatever the prompt
+DEAD_STATUSES = {"401", "403", "404", "408", "model_not_found", "error", "stream_error"}
+# ...of which these concern one model id (retired or misspelled), not its provider
+MODEL_STATUSES = {"404", "model_not_found"}
+
+# How OpenAI-style APIs word a 400 for a model id they do not serve
+_MODEL_NOT_FOUND = re.compile(r"model[^.\n]{0,80}?(not found|does not exist|not available)|(not a valid|unknown|invalid|no such) model\b", re.I)
+
+
+def http_status(code: int, body: str) -> str:
+    """The CallTrace status of an HTTP error: its code, or "model_not_found" for a 400-style error naming the model."""
+    if code in (400, 422) and _MODEL_NOT_FOUND.search(body[:2000]):
+        return "model_not_found"
+    return str(code)
+
+
+def classify(status: str, seconds: float, slow_call_seconds: float) -> Optional[bool]:
+    """
+    Maps a CallTrace status to True (healthy), False (failure) or None when
+    the call says nothing about health: cancellations, 429s and local queue
+    timeouts belong to the rate limiter, other 4xx to the request itself.
+    """
+    if status in DEAD_STATUSES:
+        return False
+    if status.isdigit():
+        code = int(status)
+        if code >= 500:
+            return False
+        if code >= 400:
+            return None
+        # A success that takes longer than the slow-call threshold still counts against the breaker
+        return seconds <= slow_call_seconds
+    return None
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker over the outcomes of the last `window`
+    calls. Opens once at least `min_calls` were seen and the failure rate
+    reaches `failure_rate`; after `open_seconds` one trial call is let
+    through (half-open), and its outcome either closes the breaker or opens
+    it again for twice as long, up to `max_open_seconds`.
+    """
+
+    def __init__(self, window: int = 20, min_calls: int = 5, failure_rate: float = 0.5, open_seconds: float = 30, max_open_seconds: float = 300):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state = "closed"
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.cooldown = open_seconds
+        self.retry_at = 0.0
+        self.trials = 0
+        self.opened = 0
+
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """Whether a call would be let through, without taking the trial slot."""
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            return (now or time.monotonic()) >= self.retry_at
+        return self.trials == 0
+
+    def acquire(self, now: Optional[float] = None) -> bool:
+        now = now or time.monotonic()
+        if not self.available(now):
+            return False
+        if self.state != "closed":
+            self.state = "half_open"
+            self.trials += 1
+        return True
+
+    def record(self, healthy: Optional[bool], now: Optional[float] = None):
+        """`healthy` is a classify() verdict; None only releases a trial slot."""
+        now = now or time.monotonic()
+        if self.state == "half_open":
+            self.trials = max(0, self.trials - 1)
+            if healthy is True:
+                self.state = "closed"
+                self.cooldown = self.open_seconds
+                self.outcomes.clear()
+            elif healthy is False:
+                self._open(now, min(self.cooldown * 2, self.max_open_seconds))
+            return
+        if healthy is None:
+            return
+        self.outcomes.append(healthy)
+        if self.state == "closed" and len(self.outcomes) >= self.min_calls and self.error_rate() >= self.failure_rate:
+            self._open(now, self.open_seconds)
+
+    def _open(self, now: float, cooldown: float):
+        self.state = "open"
+        self.cooldown = cooldown
+        self.retry_at = now + cooldown
+        self.opened += 1
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = now or time.monotonic()
+        return {
+            "state": self.state,
+            "failure_rate": round(self.error_rate(), 3),
+            "calls": len(self.outcomes),
+            "opened": self.opened,
+            "retry_in": round(max(0.0, self.retry_at - now), 1) if self.state == "open" else 0.0,
+        }
+
+
+class CircuitBreakers:
+    """
+    One breaker per provider and one per model id. A call needs both to be
+    available, and its outcome is recorded on both, so a provider outage
+    trips every model at once while one broken model leaves its siblings alone.
+    Statuses that only concern the model (MODEL_STATUSES) are recorded on the
+    model's breaker alone: a retired model id says nothing about its provider.
+    """
+
+    def __init__(self, enabled: bool = True, slow_call_seconds: float = 30, **breaker_options):
+        self.enabled = enabled
+        self.slow_call_seconds = slow_call_seconds
+        self.breaker_options = breaker_options
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.rejected = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_settings(cls) -> "CircuitBreakers":
+        return cls(
+            enabled=settings.CIRCUIT_ENABLED,
+            slow_call_seconds=settings.CIRCUIT_SLOW_CALL_SECONDS,
+            window=settings.CIRCUIT_WINDOW,
+            min_calls=settings.CIRCUIT_MIN_CALLS,
+            failure_rate=settings.CIRCUIT_FAILURE_RATE,
+            open_seconds=settings.CIRCUIT_OPEN_SECONDS,
+            max_open_seconds=settings.CIRCUIT_MAX_OPEN_SECONDS,
+        )
+
+    def _pair(self, member: Dict[str, Any]) -> List[CircuitBreaker]:
+        keys = (f"provider:{member.get('provider')}", f"model:{member.get('id', member['model'])}")
+        return [self.breakers.setdefault(key, CircuitBreaker(**self.breaker_options)) for key in keys]
+
+    def available(self, member: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return True
+        now = time.monotonic()
+        return all(breaker.available(now) for breaker in self._pair(member))
+
+    def acquire(self, member: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return True
+        now = time.monotonic()
+        pair = self._pair(member)
+        # Check both first so a refused call never holds the other's trial slot
+        if not all(breaker.available(now) for breaker in pair):
+            self.rejected += 1
+            return False
+        for breaker in pair:
+            breaker.acquire(now)
+        return True
+
+    def record(self, member: Dict[str, Any], status: str, seconds: float):
+        if not self.enabled:
+            return
+        healthy = classify(status, seconds, self.slow_call_seconds)
+        provider, model = self._pair(member)
+        # None still releases a half-open trial slot the call held
+        provider.record(None if status in MODEL_STATUSES else healthy)
+        model.record(healthy)
+
+    def health(self, member: Dict[str, Any]) -> str:
+        """Returns "healthy", "degraded" (recovering or failing often) or "down"."""
+        if not self.enabled:
+            return "healthy"
+        pair = self._pair(member)
+        if not self.available(member):
+            return "down"
+        if any(b.state != "closed" or b.error_rate() >= b.failure_rate / 2 for b in pair):
+            return "degraded"
+        return "healthy"
+
+    def needs_probe(self, member: Dict[str, Any]) -> bool:
+        """True when the member is tripped but due for a trial call."""
+        return self.enabled and self.available(member) and any(b.state != "closed" for b in self._pair(member))
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "enabled": self.enabled,
+            "rejected": self.rejected,
+            "skipped": self.skipped,
+            "breakers": {key: breaker.snapshot(now) for key, breaker in sorted(self.breakers.items())},
+        }
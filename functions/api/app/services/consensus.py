@@ -0,0 +1,116 @@
+import math
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.core.config import settings
+from app.services.deliberation import strip_reasoning
+from app.services.semantic_cache import normalize, shingles
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional: the pure-Python path computes the same scores
+    np = None
+
+# Answers are compared as binary vectors of hashed character 4-grams
+FEATURE_BITS = 16
+_FEATURE_MASK = (1 << FEATURE_BITS) - 1
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def features(text: str, n: int = 4) -> Set[int]:
+    """Hashed n-grams of the normalized answer, reasoning blocks removed."""
+    return {zlib.crc32(shingle.encode()) & _FEATURE_MASK for shingle in shingles(normalize(strip_reasoning(text)), n)}
+
+
+def answer_features(results: List[Dict[str, Any]]) -> List[Optional[Set[int]]]:
+    """features() of each result that answered, None for the failures."""
+    return [features(r["content"]) if r["ok"] else None for r in results]
+
+
+def similarity_matrix(vectors: List[Set[int]]) -> List[List[float]]:
+    """Pairwise cosine similarity of the feature vectors (1.0 on the diagonal)."""
+    n = len(vectors)
+    if np is not None:
+        # Only the columns some answer uses, so the matrix stays small
+        columns = {feature: i for i, feature in enumerate(set().union(*vectors))}
+        matrix = np.zeros((n, max(1, len(columns))), dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            matrix[row, [columns[f] for f in vector]] = 1.0
+        norms = np.sqrt(matrix.sum(axis=1))
+        norms[norms == 0] = 1.0
+        unit = matrix / norms[:, None]
+        return (unit @ unit.T).tolist()
+    scores = [[1.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            denominator = math.sqrt(len(vectors[i]) * len(vectors[j]))
+            scores[i][j] = scores[j][i] = len(vectors[i] & vectors[j]) / denominator if denominator else 0.0
+    return scores
+
+
+class ConsensusDetector:
+    """
+    Decides whether the council already agrees, so the Chairman round trip
+    can be skipped.
+
+    The agreement score is the lowest pairwise similarity among the members
+    that answered: every pair has to agree, not just most of them. When it
+    reaches `threshold` and the answers state the same numbers ("42" and
+    "41" differ by one character but are not the same answer), the answer
+    closest to all the others (highest mean similarity) stands in for the
+    synthesis. Results flagged `reasoning` (a thinking model's trace rather
+    than its answer) count towards agreement but are never chosen; if only
+    traces agree, the Chairman writes the answer. Answers a `fallback` model
+    gave for a member are left out: they may repeat another seat's model.
+    """
+
+    def __init__(self, threshold: float = 0.9, min_members: int = 2, enabled: bool = True):
+        self.threshold = threshold
+        self.min_members = min_members
+        self.enabled = enabled
+        self.checked = 0
+        self.reached = 0
+
+    @classmethod
+    def from_settings(cls) -> "ConsensusDetector":
+        return cls(settings.CONSENSUS_THRESHOLD, settings.CONSENSUS_MIN_MEMBERS, settings.CONSENSUS_ENABLED)
+
+    def evaluate(self, results: List[Dict[str, Any]], vectors: Optional[List[Optional[Set[int]]]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """
+        (result to answer with, agreement score). The result is None when the
+        members disagree or too few answered; the score is None when it was not
+        computed (disabled, or fewer than two answers). `vectors` are the
+        results' answer_features(), when the caller already has them.
+        """
+        counted = [r["ok"] and "fallback" not in r for r in results]
+        answers = [r for r, count in zip(results, counted) if count]
+        if not self.enabled or len(answers) < 2:
+            return None, None
+        self.checked += 1
+        if vectors is None:
+            vectors = answer_features(results)
+        scores = similarity_matrix([v for v, count in zip(vectors, counted) if count])
+        n = len(answers)
+        agreement = min(scores[i][j] for i in range(n) for j in range(i + 1, n))
+        agreement = round(max(0.0, min(1.0, agreement)), 4)
+        numbers = {frozenset(_NUMBER.findall(strip_reasoning(r["content"]))) for r in answers}
+        if n < self.min_members or agreement < self.threshold or len(numbers) > 1:
+            return None, agreement
+        # A member that only returned its thinking trace still has to agree,
+        # but never speaks for the council
+        final = [i for i in range(n) if not answers[i].get("reasoning")]
+        if not final:
+            return None, agreement
+        self.reached += 1
+        best = max(final, key=lambda i: sum(scores[i]))
+        return answers[best], agreement
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "threshold": self.threshold,
+            "vectorized": np is not None,
+            "checked": self.checked,
+            "reached": self.reached,
+        }
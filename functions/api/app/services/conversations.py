@@ -0,0 +1,158 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.services.deliberation import estimate_tokens
+
+# Conversation ids come from clients; keep them to a safe alphabet
+CONVERSATION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Per-message overhead of the chat template (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def fit_history(turns: List[Dict[str, str]], budget: int, block: int = 4) -> List[Dict[str, str]]:
+    """
+    The most recent turns (user/assistant message pairs, oldest first) that fit
+    in `budget` estimated tokens.
+
+    Old turns are dropped `block` turns at a time from fixed boundaries rather
+    than one by one, so consecutive follow-ups keep sending a byte-identical
+    message prefix and providers with prompt caching can keep reusing it.
+    Within the most recent block turns go one at a time, so a short
+    conversation with long answers still keeps its latest turns.
+    """
+    if budget <= 0 or not turns:
+        return []
+    costs = [sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in turn) for turn in _pairs(turns)]
+    total = sum(costs)
+    start = 0
+    while start + block < len(costs) and total > budget:
+        total -= sum(costs[start:start + block])
+        start += block
+    while start < len(costs) and total > budget:
+        total -= costs[start]
+        start += 1
+    return [message for turn in _pairs(turns)[start:] for message in turn]
+
+
+def _pairs(turns: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+    return [turns[i:i + 2] for i in range(0, len(turns), 2)]
+
+
+class SQLiteConversations:
+    """Conversation turns persisted to a local SQLite file, one JSON row per conversation."""
+
+    def __init__(self, path: str):
+        import sqlite3  # only paid for when a persistent store is configured
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS conversations ("
+            "id TEXT PRIMARY KEY, turns TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def get(self, conversation_id: str, max_age: float) -> Optional[List[Dict[str, str]]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT turns, updated_at FROM conversations WHERE id = ?", (conversation_id,)
+            ).fetchone()
+        if row is None or row[1] < time.time() - max_age:
+            return None
+        return json.loads(row[0])
+
+    def set(self, conversation_id: str, turns: List[Dict[str, str]]):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO conversations (id, turns, updated_at) VALUES (?, ?, ?)",
+                (conversation_id, json.dumps(turns), time.time()),
+            )
+
+    def delete(self, conversation_id: str):
+        with self._lock:
+            self._db.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
+
+    def purge(self, max_age: float):
+        with self._lock:
+            self._db.execute("DELETE FROM conversations WHERE updated_at < ?", (time.time() - max_age,))
+
+
+class ConversationStore:
+    """
+    Prior turns per conversation id: an in-memory LRU of recent conversations,
+    optionally backed by SQLite so a follow-up after a cold start still has
+    its history. Conversations idle for `ttl` seconds are forgotten and each
+    keeps at most `max_turns` turns.
+    """
+
+    def __init__(self, max_conversations: int = 1000, max_turns: int = 50, ttl: float = 86400, disk: Optional[SQLiteConversations] = None):
+        self.max_conversations = max_conversations
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self.disk = disk
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()  # id -> (expires_at, turns)
+        self.loads = 0
+        self.disk_loads = 0
+        self.appends = 0
+
+    @classmethod
+    def from_settings(cls) -> "ConversationStore":
+        disk = None
+        if settings.CONVERSATION_SQLITE_PATH:
+            disk = SQLiteConversations(settings.CONVERSATION_SQLITE_PATH)
+            disk.purge(settings.CONVERSATION_TTL)
+        return cls(settings.CONVERSATION_MAX_ENTRIES, settings.CONVERSATION_MAX_TURNS, settings.CONVERSATION_TTL, disk)
+
+    def history(self, conversation_id: str) -> List[Dict[str, str]]:
+        """All stored messages of the conversation, oldest first (empty if unknown)."""
+        self.loads += 1
+        entry = self._memory.get(conversation_id)
+        if entry is not None and entry[0] >= time.time():
+            self._memory.move_to_end(conversation_id)
+            return list(entry[1])
+        turns = self.disk.get(conversation_id, self.ttl) if self.disk is not None else None
+        if turns is None:
+            self._memory.pop(conversation_id, None)
+            return []
+        self.disk_loads += 1
+        self._remember(conversation_id, turns)
+        return list(turns)
+
+    def append(self, conversation_id: str, prompt: str, answer: str):
+        turns = self.history(conversation_id) + [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": answer},
+        ]
+        if len(turns) > 2 * self.max_turns:
+            # Trim half the conversation at once, not a turn per append, so
+            # fit_history's block boundaries (and cached prefixes) stay put
+            turns = turns[-2 * max(1, self.max_turns // 2):]
+        self.appends += 1
+        self._remember(conversation_id, turns)
+        if self.disk is not None:
+            self.disk.set(conversation_id, turns)
+
+    def delete(self, conversation_id: str):
+        self._memory.pop(conversation_id, None)
+        if self.disk is not None:
+            self.disk.delete(conversation_id)
+
+    def _remember(self, conversation_id: str, turns: List[Dict[str, str]]):
+        self._memory[conversation_id] = (time.time() + self.ttl, turns)
+        self._memory.move_to_end(conversation_id)
+        while len(self._memory) > self.max_conversations:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "conversations": len(self._memory),
+            "loads": self.loads,
+            "disk_loads": self.disk_loads,
+            "appends": self.appends,
+            "persistent": self.disk is not None,
+        }
@@ -1,212 +1,727 @@
 import os
 import httpx
 import json
-from typing import List, Dict, Any
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Set, Tuple, Union
+from app.services.http_pool import ProviderClientPool
+from app.services.quorum import QuorumPolicy, gather_with_quorum
+from app.services.cache import ResponseCache, member_cache_key
+from app.services.singleflight import SingleFlight
+from app.services.ratelimit import RETRYABLE_ERRORS, RateLimitScheduler, RateLimitTimeout
+from app.services.stats import RollingWindow
+from app.services.deliberation import compact_deliberations, estimate_tokens, split_document, strip_reasoning
+from app.services.conversations import MESSAGE_OVERHEAD_TOKENS, fit_history
+from app.services.metrics import SYNTHESIS_SECONDS, CallTrace, record_request_timing
+from app.services.batch import BatchCheckpoint
+from app.services.circuit import CircuitBreakers, http_status
+from app.services.semantic_cache import SemanticCache
+from app.services.registry import ModelRegistry, is_image_model, payload_template
+from app.services.blobs import BlobStore, decode_data_url
+from app.services.consensus import ConsensusDetector, answer_features
+from app.services.chairman import ChairmanSelector
+from app.services.profiles import AUTO_COUNCIL, ModelProfiles
+from app.core.config import settings
+from app.models.schemas import MemberResult
+
+# Chairman when the models file has no "chairmen" table: Groq Llama 3.3 70B (Versatile)
+CHAIRMAN_CONFIG = {
+    "id": "chairman",
+    "name": "Llama 3.3 70B (Groq)",
+    "provider": "groq",
+    "model": "llama-3.3-70b-versatile",
+    "params": {"temperature": 0.7, "max_completion_tokens": 1024}
+}
+CHAIRMAN_CONFIG["payload"] = payload_template(CHAIRMAN_CONFIG)
+
+# A single user prompt, or a conversation as OpenAI-style messages ending in one
+Prompt = Union[str, List[Dict[str, str]]]
 
 class CouncilService:
-    def __init__(self):
+    def __init__(self, http_pool: Optional[ProviderClientPool] = None, quorum: Optional[QuorumPolicy] = None, cache: Optional[ResponseCache] = None):
+        self.http_pool = http_pool
+        self.quorum = quorum or QuorumPolicy.from_settings()
+        self.cache = cache if cache is not None else ResponseCache.from_settings()
+        self.single_flight = SingleFlight()
+        self.scheduler = RateLimitScheduler.from_settings()
+        self.breakers = CircuitBreakers.from_settings()
+        self.semantic_cache = SemanticCache.from_settings()
+        self.blobs = BlobStore.from_settings()
+        self.consensus = ConsensusDetector.from_settings()
+        self.chairmen = ChairmanSelector.from_settings()
+        self.profiles = ModelProfiles.from_settings()
+        self.latency: Dict[str, RollingWindow] = {}
+        self.hedge_stats = {"hedged": 0, "failovers": 0, "fallback_wins": 0}
         self.groq_key = os.getenv("GROQ_API_KEY")
         self.nvidia_key = os.getenv("NVIDIA_API_KEY")
         self.openrouter_key = os.getenv("OPENROUTER_API_KEY")
         
-        # Exact model mapping from user request
-        self.models_config = {
-            "groq-qwen": {
-                "name": "Qwen 3 32B (Groq)", 
-                "provider": "groq", 
-                "model": "qwen/qwen3-32b",
-                "params": {
-                    "temperature": 0.6,
-                    "max_completion_tokens": 1024,
-                    "top_p": 0.95,
-                    "reasoning_effort": "default"
-                }
-            },
-            "groq-gptoss": {
-                "name": "GPT OSS 20B (Groq)", 
-                "provider": "groq", 
-                "model": "openai/gpt-oss-20b",
-                "params": {
-                    "temperature": 1,
-                    "max_completion_tokens": 1024,
-                    "top_p": 1,
-                    "reasoning_effort": "medium"
-                }
-            },
-            "groq-versatile": {
-                "name": "Llama 3.3 70B (Groq)", 
-                "provider": "groq", 
-                "model": "llama-3.3-70b-versatile",
-                "params": {
-                    "temperature": 1,
-                    "max_completion_tokens": 1024,
-                    "top_p": 1
-                }
-            },
-            "or-aurora": {
-                "name": "Liquid LFM 2.5 (OpenRouter)", 
-                "provider": "openrouter", 
-                "model": "liquid/lfm-2.5-1.2b-thinking:free",
-                "params": { "max_tokens": 1024 }
-            },
-            "or-trinity": {
-                "name": "Trinity Large Preview (OpenRouter)", 
-                "provider": "openrouter", 
-                "model": "arcee-ai/trinity-large-preview:free",
-                "params": { "max_tokens": 512 },
-                "extra_body": { "reasoning": { "enabled": True } }
-            },
-            "or-liquid": {
-                "name": "Liquid LFM 2.5 (OpenRouter)", 
-                "provider": "openrouter", 
-                "model": "liquid/lfm-2.5-1.2b-thinking:free",
-                "params": { "max_tokens": 512 }
-            },
-            "or-seed": {
-                "name": "Seedream 4.5 (OpenRouter)", 
-                "provider": "openrouter", 
-                "model": "bytedance-seed/seedream-4.5",
-                "extra_body": { "modalities": ["image"] }
-            },
-            "nvidia-deepseek": {
-                "name": "DeepSeek V3.1 (Nvidia)", 
-                "provider": "nvidia", 
-                "model": "deepseek-ai/deepseek-v3.1",
-                "params": {
-                    "temperature": 0.2,
-                    "top_p": 0.7,
-                    "max_tokens": 1024,
-                    "seed": 42
-                },
-                "extra_body": {
-                    "chat_template_kwargs": { "thinking": True }
-                }
-            }
-        }
+        # Model table from the JSON registry (app/core/models.json by default)
+        self.registry = ModelRegistry.from_settings()
+        self._provider_keys = {"groq": self.groq_key, "nvidia": self.nvidia_key, "openrouter": self.openrouter_key}
+        self._routes: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._header_cache: Dict[Tuple[Optional[str], bool], Dict[str, str]] = {}
+
+    @property
+    def models_config(self) -> Dict[str, Dict[str, Any]]:
+        return self.registry.members
 
     def get_models(self):
-        return [{"id": k, "name": v["name"]} for k, v in self.models_config.items()]
+        self.registry.refresh()
+        return [{"id": m["id"], "name": m["name"], "health": self.breakers.health(m)} for m in self.models_config.values()]
+
+    def _reachable(self, member: Dict[str, Any]) -> bool:
+        """False when the member and all of its fallbacks are behind open breakers."""
+        return any(self.breakers.available(route) for route in [member] + self._fallback_members(member))
 
     def get_active_members(self, active_model_ids: List[str]):
-        return [self.models_config[mid] for mid in active_model_ids if mid in self.models_config]
+        """
+        The requested members. "auto" lets the model profiles pick them: from
+        every text model, or only from the ids listed alongside it.
+        """
+        self.registry.refresh()
+        if AUTO_COUNCIL not in active_model_ids:
+            return self.registry.get(active_model_ids)
+        pool = [model_id for model_id in active_model_ids if model_id != AUTO_COUNCIL] or list(self.models_config)
+        candidates = [m for m in self.registry.get(pool) if not is_image_model(m)]
+        return self.profiles.select([m for m in candidates if self._reachable(m)] or candidates)
+
+    def chairman_candidates(self) -> List[Dict[str, Any]]:
+        return self.registry.chairmen or [CHAIRMAN_CONFIG]
+
+    def _chairman_order(self) -> List[Dict[str, Any]]:
+        """Chairman candidates for one synthesis, the chosen one first."""
+        now = time.monotonic()
+
+        def load(candidate: Dict[str, Any]) -> Tuple[float, float]:
+            limiter = self.scheduler.limiter(candidate["provider"])
+            return max(0.0, limiter.blocked_until - now), limiter.waiting / max(1, int(limiter.limit))
+
+        return self.chairmen.order(
+            self.chairman_candidates(),
+            lambda candidate: bool(self._provider_keys.get(candidate["provider"])) and self.breakers.available(candidate),
+            load,
+        )
+
+    def attach_pool(self, http_pool: ProviderClientPool):
+        self._routes.clear()
+        self.http_pool = http_pool
+
+    def _pool(self) -> ProviderClientPool:
+        # Lazily created when no lifespan injected one (e.g. the Mangum handler)
+        if self.http_pool is None:
+            self.http_pool = ProviderClientPool.from_settings()
+        return self.http_pool
+
+    def _provider_route(self, provider: str):
+        """Returns the (client, url, key) triple for a provider, or None if unsupported."""
+        route = self._routes.get(provider)
+        if route is None:
+            if provider not in self._provider_keys:
+                return None
+            route = self._routes[provider] = (self._pool().url(provider), self._provider_keys[provider])
+        url, key = route
+        return self._pool().get(provider), url, key
+
+    def _build_payload(self, member_config: Dict[str, Any], prompt: Prompt, stream: bool = False):
+        # Model, params and extra body come precomputed from the registry
+        # (a conversation arrives as ready-made messages)
+        template = member_config.get("payload") or payload_template(member_config)
+        return {
+            **template,
+            "messages": prompt if isinstance(prompt, list) else [{"role": "user", "content": prompt}],
+            "stream": stream
+        }
+
+    def _input_budget(self, member: Dict[str, Any], prompt: str) -> int:
+        """Estimated tokens left in the member's context after `prompt` and its reply."""
+        params = member.get("params", {})
+        reply_tokens = params.get("max_completion_tokens") or params.get("max_tokens") or 1024
+        context_tokens = member.get("context_tokens", settings.CONVERSATION_CONTEXT_TOKENS)
+        return context_tokens - reply_tokens - estimate_tokens(prompt) - MESSAGE_OVERHEAD_TOKENS
+
+    def _with_history(self, member: Dict[str, Any], prompt: str, history: Optional[List[Dict[str, str]]] = None) -> Prompt:
+        """The member's prompt behind as much of the conversation as its context budget allows."""
+        if not history:
+            return prompt
+        budget = min(settings.CONVERSATION_HISTORY_TOKENS, self._input_budget(member, prompt))
+        messages = fit_history(history, budget)
+        if not messages:
+            return prompt
+        return messages + [{"role": "user", "content": prompt}]
+
+    def _cache_lookup(self, member: Dict[str, Any], prompt: Prompt):
+        """Returns (key, cached result or None). Each member is cached on its own."""
+        if self.cache is None:
+            return None, None
+        key = member_cache_key(member, prompt)
+        cached = self.cache.get(key)
+        # The display name is not part of the key, so always report the current one
+        return key, ({**cached, "name": member["name"]} if cached else None)
+
+    def _cache_store(self, key: Optional[str], result: Dict[str, Any]):
+        # Error placeholders and fallback answers are never cached under the
+        # member's key, so the next request tries the member itself again.
+        # Neither are image links: the blob can be evicted while the cache
+        # entry lives on, and the image would 404
+        if key is not None and result["ok"] and "fallback" not in result:
+            if self.blobs is not None and self.blobs.links_to_blob(result["content"]):
+                return
+            self.cache.set(key, result)
 
-    async def fetch_model_response(self, client: httpx.AsyncClient, member: Dict[str, Any], prompt: str):
+    async def fetch_model_response(self, member: Dict[str, Any], prompt: Prompt, on_upstream: Optional[Callable[[], None]] = None) -> MemberResult:
+        """
+        A member's answer, from the cache, an identical call already in
+        flight, or upstream; `on_upstream()` is called only in the last case.
+        """
+        key, cached = self._cache_lookup(member, prompt)
+        if cached:
+            return cached
+
+        async def fetch():
+            if on_upstream is not None:
+                on_upstream()
+            result = await self._fetch_routed(member, prompt)
+            self._cache_store(key, result)
+            return result
+
+        # Concurrent identical (model, payload) calls share one upstream request
+        result = await self.single_flight.do(key or member_cache_key(member, prompt), fetch)
+        return {**result, "name": member["name"]}
+
+    async def _fetch_fallback(self, route: Dict[str, Any], prompt: Prompt):
+        """
+        A hedge or failover call. It goes through the cache and single-flight
+        like a member call, so it joins an identical call already in flight
+        (the same model asked by another council) instead of repeating it,
+        but it does not route on to fallbacks of its own.
+        """
+        key, cached = self._cache_lookup(route, prompt)
+        if cached:
+            return cached
+
+        async def fetch():
+            result = await self._timed_fetch(route, prompt)
+            self._cache_store(key, result)
+            return result
+
+        return await self.single_flight.do(key or member_cache_key(route, prompt), fetch)
+
+    def _fallback_members(self, member: Dict[str, Any]) -> List[Dict[str, Any]]:
+        fallbacks = []
+        for route in member.get("fallbacks", []):
+            if isinstance(route, str):
+                if route in self.models_config:
+                    fallbacks.append(self.models_config[route])
+            else:
+                fallbacks.append({"name": member["name"], **route})
+        return fallbacks
+
+    def _without_fallbacks(self, member: Dict[str, Any], ids: Set[str]) -> Dict[str, Any]:
+        """The member with the fallbacks that name one of `ids` dropped."""
+        fallbacks = [route for route in member.get("fallbacks", []) if not (isinstance(route, str) and route in ids)]
+        if len(fallbacks) == len(member.get("fallbacks", [])):
+            return member
+        routed = {**member, "fallbacks": fallbacks}
+        if not fallbacks:
+            # Nothing left to race
+            routed.pop("hedge", None)
+        return routed
+
+    def _hedge_delay(self, member: Dict[str, Any]) -> Optional[float]:
+        """Seconds to wait on a member before racing its first fallback, or None to only fail over."""
+        hedge = member.get("hedge")
+        if not hedge:
+            return None
+        window = self.latency.get(member.get("id", member["model"]))
+        if window is None or len(window) < 20:
+            return hedge.get("initial_delay", 10.0)
+        return max(hedge.get("min_delay", 1.0), window.percentile(hedge.get("percentile", 95)))
+
+    async def _timed_fetch(self, member: Dict[str, Any], prompt: Prompt):
+        window = self.latency.setdefault(member.get("id", member["model"]), RollingWindow())
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         try:
-            if member["provider"] == "groq":
-                return await self._call_provider(
-                    client, 
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    self.groq_key,
-                    member,
-                    prompt
-                )
-            elif member["provider"] == "nvidia":
-                return await self._call_provider(
-                    client,
-                    "https://integrate.api.nvidia.com/v1/chat/completions",
-                    self.nvidia_key,
-                    member,
-                    prompt
-                )
-            elif member["provider"] == "openrouter":
-                return await self._call_provider(
-                    client,
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    self.openrouter_key,
-                    member,
-                    prompt
+            result = await self._fetch_uncached(member, prompt)
+        except asyncio.CancelledError:
+            # A hedge loser is a censored sample: it took at least this long.
+            # Dropping it would bias the percentile low and make hedging ever more eager.
+            window.add(loop.time() - start)
+            raise
+        if result["ok"]:
+            window.add(loop.time() - start)
+        return result
+
+    async def _fetch_routed(self, member: Dict[str, Any], prompt: Prompt):
+        """
+        Fetches a member, failing over to its fallbacks on error and, if it has
+        a hedge policy, racing the next fallback once the member runs slow.
+        The first successful answer wins and the losers are cancelled.
+        """
+        routes = [member] + self._fallback_members(member)
+        if len(routes) == 1:
+            return await self._timed_fetch(member, prompt)
+
+        delay = self._hedge_delay(member)
+        launched = {asyncio.create_task(self._timed_fetch(member, prompt)): member}
+        pending = set(launched)
+        first_failure = None
+        try:
+            while pending:
+                can_launch = len(launched) < len(routes)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_launch else None,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-            return {"name": member["name"], "content": "Provider not supported."}
+                failed = False
+                for task in done:
+                    result = task.result()
+                    if result["ok"]:
+                        route = launched[task]
+                        if route is not member:
+                            self.hedge_stats["fallback_wins"] += 1
+                            result = {**result, "name": member["name"], "fallback": route["name"]}
+                        return result
+                    failed = True
+                    first_failure = first_failure or result
+                if can_launch and (failed or not done):
+                    self.hedge_stats["failovers" if failed else "hedged"] += 1
+                    route = routes[len(launched)]
+                    task = asyncio.create_task(self._fetch_fallback(route, prompt))
+                    launched[task] = route
+                    pending.add(task)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return first_failure
+
+    async def _fetch_uncached(self, member: Dict[str, Any], prompt: Prompt):
+        try:
+            route = self._provider_route(member["provider"])
+            if route:
+                client, url, key = route
+                return await self._call_provider(client, url, key, member, prompt)
+            return self._result(member, "Provider not supported.", ok=False)
         except Exception as e:
             print(f"Error fetching response from {member['name']}: {e}")
-            return {"name": member["name"], "content": f"Model '{member['name']}' encountered an error. Please try again."}
+            return self._result(member, f"Model '{member['name']}' encountered an error. Please try again.", ok=False)
+
+    async def _capped_fetch(self, member: Dict[str, Any], prompt: Prompt, provider_caps: Optional[Dict[str, asyncio.Semaphore]] = None, on_upstream: Optional[Callable[[], None]] = None):
+        cap = provider_caps.get(member.get("provider")) if provider_caps else None
+        if cap is None:
+            return await self.fetch_model_response(member, prompt, on_upstream)
+        async with cap:
+            return await self.fetch_model_response(member, prompt, on_upstream)
+
+    async def gather_responses(
+        self,
+        members: List[Dict[str, Any]],
+        prompt: str,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        provider_caps: Optional[Dict[str, asyncio.Semaphore]] = None,
+        history: Optional[List[Dict[str, str]]] = None,
+    ) -> Tuple[List[MemberResult], List[Dict[str, Any]]]:
+        """
+        Queries all members in parallel under the quorum policy.
+        Returns (results, omitted): the answers that made it, and the members left behind.
+        `on_result(index, result)` is called as each member finishes;
+        `provider_caps` optionally bounds calls per provider (used by batches);
+        `history` holds earlier conversation messages, fitted to each member.
+        """
+        async def fetch(index: int, member: Dict[str, Any]):
+            result = await self._capped_fetch(member, self._with_history(member, prompt, history), provider_caps)
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        # A fallback that already has a seat would only ask the same model
+        # twice and count its answer twice
+        seated = {m["id"] for m in members if "id" in m}
+        members = [self._without_fallbacks(m, seated) for m in members]
+
+        # Members behind open circuit breakers are left out up front rather
+        # than waited on, and reported to the Chairman like stragglers
+        live = [i for i, member in enumerate(members) if self._reachable(member)]
+        skipped = [members[i] for i in range(len(members)) if i not in live]
+        if skipped:
+            self.breakers.skipped += len(skipped)
+            print(f"Skipping unavailable members: {', '.join(m['name'] for m in skipped)}")
+
+        results, stragglers = await gather_with_quorum(
+            [fetch(i, members[i]) for i in live],
+            self.quorum,
+            is_answer=lambda r: r["ok"],
+        )
+        omitted = [members[live[i]] for i in stragglers]
+        if omitted:
+            print(f"Quorum reached without: {', '.join(m['name'] for m in omitted)}")
+        return [r for r in results if r is not None], skipped + omitted
+
+    def _result(self, member_config: Dict[str, Any], content: str, ok: bool = True, reasoning: bool = False) -> MemberResult:
+        # `ok` separates real answers from error placeholders for quorum/caching decisions
+        result: MemberResult = {"name": member_config["name"], "content": content, "ok": ok}
+        if reasoning:
+            # Content is the model's thinking trace, not a final answer
+            result["reasoning"] = True
+        return result
+
+    def _extract_content(self, member_config: Dict[str, Any], choice: Dict[str, Any]):
+        """Returns (content, from_reasoning) for an OpenAI-style choice."""
+        message = choice.get("message", {})
+        content = message.get("content", "") or ""
+
+        # Fallback 1: reasoning_content (thinking models)
+        if not content.strip():
+            content = message.get("reasoning_content", "") or ""
+
+        # Fallback 2: reasoning field (some OpenRouter models)
+        if not content.strip():
+            content = message.get("reasoning", "") or ""
+
+        from_reasoning = bool(content.strip()) and not (message.get("content") or "").strip()
+
+        # Fallback 3: text field at choice level
+        if not content.strip():
+            content = choice.get("text", "") or ""
+
+        # Handle Seedream/OpenRouter image generation response format
+        if not content.strip() and "images" in message:
+            try:
+                images = message["images"]
+                if images and len(images) > 0:
+                    image_url = images[0].get("image_url", {}).get("url")
+                    if image_url:
+                        content = f"![Dream Generated]({self._image_link(image_url)})"
+            except Exception as e:
+                print(f"Error parsing image response: {e}")
+                content = "Error generating image."
+
+        # Debug: log the full response structure when all fallbacks fail
+        if not content.strip():
+            print(f"[DEBUG] Empty content for {member_config['name']}. Full choice: {json.dumps(choice, default=str)[:2000]}")
+
+        return (content.strip() if content.strip() else "No response generated."), from_reasoning
+
+    def _image_link(self, url: str) -> str:
+        """
+        Moves a base64 data URL into the blob store and returns the short
+        /api/images link instead, so multi-megabyte images never travel
+        through response validation, JSON encoding or the caches. Remote
+        URLs, and data URLs that cannot be stored (or with no store
+        configured), are returned unchanged.
+        """
+        if self.blobs is None:
+            return url
+        data = decode_data_url(url) if url.startswith("data:") else None
+        if data is None:
+            return url
+        try:
+            digest = self.blobs.put(data)
+        except OSError as e:
+            print(f"Could not store generated image, inlining it: {e}")
+            return url
+        return f"{settings.IMAGE_BASE_URL.rstrip('/')}/{digest}"
+
+    def _headers(self, key: str, stream: bool = False):
+        headers = self._header_cache.get((key, stream))
+        if headers is None:
+            headers = {
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json"
+            }
+            if stream:
+                headers["Accept"] = "text/event-stream"
+            self._header_cache[(key, stream)] = headers
+        return headers
 
-    async def _call_provider(self, client: httpx.AsyncClient, url: str, key: str, member_config: Dict[str, Any], prompt: str):
+    def _record_call(self, member_config: Dict[str, Any], trace: CallTrace):
+        # Timed from the last attempt's send: local queueing and backoff are
+        # congestion here, not slowness upstream
+        elapsed = trace.upstream_seconds()
+        self.breakers.record(member_config, trace.status, elapsed or 0.0)
+        if elapsed is not None:
+            self.profiles.observe_call(member_config, trace.status, elapsed)
+
+    async def _post(self, client: httpx.AsyncClient, url: str, key: str, member_config: Dict[str, Any], payload: Dict[str, Any], trace: Optional[CallTrace] = None):
+        """POSTs under the provider's rate limiter, retrying 429/5xx and connect failures with jittered backoff."""
+        provider = member_config["provider"]
+        extensions = {"trace": trace} if trace else None
+        attempt = 0
+        while True:
+            if trace:
+                trace.retries = attempt
+            try:
+                async with self.scheduler.slot(provider):
+                    if trace:
+                        trace.sent = time.perf_counter()
+                    response = await client.post(url, headers=self._headers(key), json=payload, timeout=60.0, extensions=extensions)
+                delay = self.scheduler.retry_delay(provider, response.status_code, response.headers, attempt)
+                if delay is None:
+                    return response
+                print(f"Retrying {member_config['name']} in {delay:.1f}s (status {response.status_code})")
+            except RETRYABLE_ERRORS as e:
+                delay = self.scheduler.error_retry_delay(attempt)
+                if delay is None:
+                    raise
+                print(f"Retrying {member_config['name']} in {delay:.1f}s ({e.__class__.__name__})")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def _open_stream(self, client: httpx.AsyncClient, url: str, key: str, member_config: Dict[str, Any], payload: Dict[str, Any], trace: Optional[CallTrace] = None):
+        """
+        Streaming counterpart of _post. Retries only happen before the first
+        byte; the provider slot is held until the stream is fully consumed.
+        """
+        provider = member_config["provider"]
+        extensions = {"trace": trace} if trace else None
+        attempt = 0
+        opened = False
+        while True:
+            if trace:
+                trace.retries = attempt
+            try:
+                async with self.scheduler.slot(provider):
+                    if trace:
+                        trace.sent = time.perf_counter()
+                    async with client.stream("POST", url, headers=self._headers(key, stream=True), json=payload, timeout=60.0, extensions=extensions) as response:
+                        delay = self.scheduler.retry_delay(provider, response.status_code, response.headers, attempt)
+                        if delay is None:
+                            opened = True
+                            yield response
+                            return
+                print(f"Retrying {member_config['name']} in {delay:.1f}s (status {response.status_code})")
+            except RETRYABLE_ERRORS as e:
+                delay = None if opened else self.scheduler.error_retry_delay(attempt)
+                if delay is None:
+                    raise
+                print(f"Retrying {member_config['name']} in {delay:.1f}s ({e.__class__.__name__})")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _call_provider(self, client: httpx.AsyncClient, url: str, key: str, member_config: Dict[str, Any], prompt: Prompt) -> MemberResult:
         if not key:
-             return {"name": member_config["name"], "content": "API Key missing."}
-        
-        # Base payload
-        payload = {
-            "model": member_config["model"],
-            "messages": [{"role": "user", "content": prompt}],
-            "stream": False # We are not streaming in this backend implementation yet
-        }
+             return self._result(member_config, "API Key missing.", ok=False)
 
-        # Merge specific params (temperature, max_tokens, etc.)
-        if "params" in member_config:
-            payload.update(member_config["params"])
+        if not self.breakers.acquire(member_config):
+            return self._result(member_config, "Model is temporarily unavailable.", ok=False)
 
-        # Merge extra body vars (reasoning, modalities, etc.)
-        if "extra_body" in member_config:
-            payload.update(member_config["extra_body"])
+        payload = self._build_payload(member_config, prompt)
+        trace = CallTrace(member_config.get("id", member_config["model"]))
 
         try:
-            response = await client.post(
-                url,
-                headers={
-                    "Authorization": f"Bearer {key}",
-                    "Content-Type": "application/json"
-                },
-                json=payload,
-                timeout=60.0
-            )
+            response = await self._post(client, url, key, member_config, payload, trace)
+            trace.status = str(response.status_code)
             response.raise_for_status()
             data = response.json()
+            trace.usage = data.get("usage")
             
             # Handle standard OpenAI format choices
             if "choices" in data and len(data["choices"]) > 0:
-                choice = data["choices"][0]
-                message = choice.get("message", {})
-                content = message.get("content", "") or ""
-                
-                # Fallback 1: reasoning_content (thinking models)
-                if not content.strip():
-                    content = message.get("reasoning_content", "") or ""
-                
-                # Fallback 2: reasoning field (some OpenRouter models)
-                if not content.strip():
-                    content = message.get("reasoning", "") or ""
-
-                # Fallback 3: text field at choice level
-                if not content.strip():
-                    content = choice.get("text", "") or ""
-                
-                # Debug: log the full response structure when all fallbacks fail
-                if not content.strip():
-                    print(f"[DEBUG] Empty content for {member_config['name']}. Full choice: {json.dumps(choice, default=str)[:2000]}")
-                
-                # Handle Seedream/OpenRouter image generation response format
-                if not content.strip() and "images" in message:
-                    try:
-                        images = message["images"]
-                        if images and len(images) > 0:
-                            image_url = images[0].get("image_url", {}).get("url")
-                            if image_url:
-                                content = f"![Dream Generated]({image_url})"
-                    except Exception as e:
-                        print(f"Error parsing image response: {e}")
-                        content = "Error generating image."
-
-                return {"name": member_config["name"], "content": content.strip() if content.strip() else "No response generated."}
+                content, reasoning = self._extract_content(member_config, data["choices"][0])
+                return self._result(member_config, content, reasoning=reasoning)
             else:
-                 print(f"[DEBUG] No choices for {member_config['name']}. Full response: {json.dumps(data, indent=2)}")
-                 return {"name": member_config["name"], "content": f"Error: {data.get('error', {}).get('message', 'No content returned.')}"}
+                 print(f"[DEBUG] No choices for {member_config['name']}. Full response: {json.dumps(data, default=str)[:2000]}")
+                 return self._result(member_config, f"Error: {data.get('error', {}).get('message', 'No content returned.')}", ok=False)
 
         except httpx.HTTPStatusError as e:
+            trace.status = http_status(e.response.status_code, e.response.text)
             print(f"API Error for {member_config['name']}: {e.response.status_code} - {e.response.text}")
-            return {"name": member_config["name"], "content": f"API returned an error (status {e.response.status_code}). Please try again later."}
+            return self._result(member_config, f"API returned an error (status {e.response.status_code}). Please try again later.", ok=False)
+        except RateLimitTimeout as e:
+            trace.status = "queue_timeout"
+            print(f"Rate limited locally for {member_config['name']}: {e}")
+            return self._result(member_config, "Provider is at its rate limit. Please try again shortly.", ok=False)
+        except asyncio.CancelledError:
+            trace.status = "cancelled"
+            raise
         except Exception as e:
             print(f"Connection Error for {member_config['name']}: {e}")
-            return {"name": member_config["name"], "content": "Connection error. Please check your network and try again."}
+            return self._result(member_config, "Connection error. Please check your network and try again.", ok=False)
+        finally:
+            trace.finish()
+            self._record_call(member_config, trace)
 
-    async def synthesize_responses(self, client: httpx.AsyncClient, prompt: str, results: List[Dict[str, Any]]):
-        if not results:
-            return "No active council members available to deliberate."
+    async def stream_model_response(self, member: Dict[str, Any], prompt: Prompt, on_upstream: Optional[Callable[[], None]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams a member's answer as it is generated.
+
+        Yields {"type": "delta", "kind": "content" | "reasoning", "delta": str}
+        events, then a single {"type": "done", "result": {...}} event whose
+        result matches what fetch_model_response would have returned.
+        `on_upstream()` is called unless the answer comes from the cache.
+        """
+        cache_key, cached = self._cache_lookup(member, prompt)
+        if cached:
+            yield {"type": "delta", "kind": "content", "delta": cached["content"]}
+            yield {"type": "done", "result": cached}
+            return
+        if on_upstream is not None:
+            on_upstream()
+
+        route = self._provider_route(member["provider"])
+        if not route:
+            yield {"type": "done", "result": self._result(member, "Provider not supported.", ok=False)}
+            return
+
+        client, url, key = route
+        async for event in self._stream_provider(client, url, key, member, prompt):
+            if event["type"] == "done":
+                self._cache_store(cache_key, event["result"])
+            yield event
+
+    async def _stream_provider(self, client: httpx.AsyncClient, url: str, key: str, member_config: Dict[str, Any], prompt: Prompt) -> AsyncIterator[Dict[str, Any]]:
+        if not key:
+            yield {"type": "done", "result": self._result(member_config, "API Key missing.", ok=False)}
+            return
+
+        if not self.breakers.acquire(member_config):
+            yield {"type": "done", "result": self._result(member_config, "Model is temporarily unavailable.", ok=False)}
+            return
+
+        payload = self._build_payload(member_config, prompt, stream=True)
 
-        # Format the deliberations for the chairman
-        deliberation_text = "\n\n".join([f"=== {r['name']} ===\n{r['content']}" for r in results])
+        # Deltas are accumulated into a synthetic non-streaming choice so the
+        # final answer goes through the same fallbacks as _call_provider.
+        parts = {"content": [], "reasoning_content": [], "reasoning": [], "text": []}
+        images = []
+        trace = CallTrace(member_config.get("id", member_config["model"]))
+
+        try:
+            async with self._open_stream(client, url, key, member_config, payload, trace) as response:
+                trace.status = str(response.status_code)
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Skip blank separators and SSE comments (e.g. ": OPENROUTER PROCESSING")
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = json.loads(data)
+                    if chunk.get("usage"):
+                        # Sent on the final chunk by providers that report streaming usage
+                        trace.usage = chunk["usage"]
+                    if "error" in chunk:
+                        trace.status = "stream_error"
+                        message = chunk["error"].get("message", "Stream interrupted.")
+                        print(f"Stream Error for {member_config['name']}: {message}")
+                        yield {"type": "done", "result": self._result(member_config, f"Error: {message}", ok=False)}
+                        return
+
+                    for choice in chunk.get("choices") or []:
+                        delta = choice.get("delta") or {}
+                        for field in ("content", "reasoning_content", "reasoning"):
+                            text = delta.get(field)
+                            if text:
+                                parts[field].append(text)
+                                yield {"type": "delta", "kind": "content" if field == "content" else "reasoning", "delta": text}
+                        if choice.get("text"):
+                            parts["text"].append(choice["text"])
+                            yield {"type": "delta", "kind": "content", "delta": choice["text"]}
+                        if delta.get("images"):
+                            images.extend(delta["images"])
+
+        except httpx.HTTPStatusError as e:
+            trace.status = http_status(e.response.status_code, e.response.text)
+            print(f"API Error for {member_config['name']}: {e.response.status_code} - {e.response.text}")
+            yield {"type": "done", "result": self._result(member_config, f"API returned an error (status {e.response.status_code}). Please try again later.", ok=False)}
+            return
+        except RateLimitTimeout as e:
+            trace.status = "queue_timeout"
+            print(f"Rate limited locally for {member_config['name']}: {e}")
+            yield {"type": "done", "result": self._result(member_config, "Provider is at its rate limit. Please try again shortly.", ok=False)}
+            return
+        except (asyncio.CancelledError, GeneratorExit):
+            trace.status = "cancelled"
+            raise
+        except Exception as e:
+            trace.status = "error"
+            print(f"Connection Error for {member_config['name']}: {e}")
+            yield {"type": "done", "result": self._result(member_config, "Connection error. Please check your network and try again.", ok=False)}
+            return
+        finally:
+            trace.finish()
+            self._record_call(member_config, trace)
+
+        message = {field: "".join(chunks) for field, chunks in parts.items() if field != "text"}
+        if images:
+            message["images"] = images
+        choice = {"message": message, "text": "".join(parts["text"])}
+        content, reasoning = self._extract_content(member_config, choice)
+        yield {"type": "done", "result": self._result(member_config, content, reasoning=reasoning)}
+
+    async def stream_members(self, members: List[Dict[str, Any]], prompt: str, history: Optional[List[Dict[str, str]]] = None) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Runs every member stream concurrently and yields (index, event) pairs
+        in arrival order, so the fastest provider's tokens go out first.
+
+        Stops once the quorum policy is met, yielding a final
+        {"type": "omitted"} event for each member that was cut off. Members
+        behind open circuit breakers are reported as omitted straight away.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        live = [i for i, member in enumerate(members) if self._reachable(member)]
+        for index in range(len(members)):
+            if index not in live:
+                self.breakers.skipped += 1
+                yield index, {"type": "omitted"}
+
+        async def pump(index: int, member: Dict[str, Any]):
+            try:
+                async for event in self.stream_model_response(member, self._with_history(member, prompt, history)):
+                    await queue.put((index, event))
+            except Exception as e:
+                print(f"Error streaming response from {member['name']}: {e}")
+                await queue.put((index, {"type": "done", "result": self._result(member, f"Model '{member['name']}' encountered an error. Please try again.", ok=False)}))
+            finally:
+                await queue.put((index, finished))
+
+        tasks = [asyncio.create_task(pump(i, members[i])) for i in live]
+        unfinished = set(live)
+        answered = 0
+        try:
+            while not self.quorum.is_met(answered, len(unfinished), len(tasks), loop.time() - start):
+                try:
+                    index, event = await asyncio.wait_for(queue.get(), timeout=self.quorum.time_left(loop.time() - start))
+                except asyncio.TimeoutError:
+                    continue
+                if event is finished:
+                    unfinished.discard(index)
+                    continue
+                if event["type"] == "done":
+                    # Counted at "done" so a member that already answered is not reported as omitted
+                    unfinished.discard(index)
+                    answered += event["result"]["ok"]
+                yield index, event
+
+            for index in sorted(unfinished):
+                yield index, {"type": "omitted"}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _build_synthesis_prompt(self, prompt: str, results: List[Dict[str, Any]], omitted: Optional[List[Dict[str, Any]]] = None):
+        # Format the deliberations for the chairman, compacted to the synthesis token budget
+        deliberations = compact_deliberations(results)
+        deliberation_text = "\n\n".join([f"=== {' / '.join(d['names'])} ===\n{d['content']}" for d in deliberations])
+        unavailable = [m["name"] for m in omitted or []] + [r["name"] for r in results if not r["ok"]]
+        if unavailable:
+            deliberation_text += "\n\n(Unavailable or not heard from in time: " + ", ".join(unavailable) + ")"
         
-        synthesis_prompt = f"""
+        return f"""
         You are the Chairman of the AI Council.
         
         The user asked: "{prompt}"
@@ -218,20 +733,443 @@ class CouncilService:
         Acknowledge reliable points, resolve conflicts, and give a unified conclusion.
         Do not just summarize; provide the best possible answer.
         """
-        
-        # Use Groq Llama 3.3 70B as the Chairman (Versatile)
-        chairman_config = {
-            "name": "Chairman",
-            "model": "llama-3.3-70b-versatile",
-            "params": {"temperature": 0.7, "max_completion_tokens": 1024}
+
+    def _hand_over(self, chairman: Dict[str, Any], successor: Dict[str, Any], timed_out: bool):
+        self.chairmen.failovers += 1
+        print(f"Chairman {chairman['name']} {'timed out' if timed_out else 'failed'}, handing over to {successor['name']}")
+
+    async def synthesize_responses(
+        self,
+        prompt: str,
+        results: List[Dict[str, Any]],
+        omitted: Optional[List[Dict[str, Any]]] = None,
+        provider_caps: Optional[Dict[str, asyncio.Semaphore]] = None,
+        history: Optional[List[Dict[str, str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        The Chairman's answer as a member result whose "name" is the candidate
+        that gave it. Candidates are tried in the selector's order; each but
+        the last gets CHAIRMAN_TIMEOUT seconds before the next is asked.
+        """
+        if not results:
+            return self._result(self.chairman_candidates()[0], "No active council members available to deliberate.", ok=False)
+
+        synthesis_prompt = self._build_synthesis_prompt(prompt, results, omitted)
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        candidates = self._chairman_order()
+        for position, chairman in enumerate(candidates):
+            last = position == len(candidates) - 1
+            start = loop.time()
+            upstream: List[bool] = []
+            # Goes through the member path so identical deliberations hit the cache too
+            fetch = self._capped_fetch(chairman, self._with_history(chairman, synthesis_prompt, history), provider_caps, lambda: upstream.append(True))
+            try:
+                result = await (fetch if last else asyncio.wait_for(fetch, self.chairmen.timeout))
+            except asyncio.TimeoutError:
+                result = None
+            seconds = loop.time() - start
+            ok = result is not None and result["ok"]
+            # A cached or shared answer took ~0s and says nothing about the
+            # Chairman's speed; a timeout does, whoever made the call
+            if upstream or result is None:
+                self.chairmen.record(chairman, seconds, ok)
+            if ok or last:
+                self._record_synthesis(chairman, loop.time() - began)
+                return result
+            self._hand_over(chairman, candidates[position + 1], timed_out=result is None)
+
+    async def _pump_stream(self, member: Dict[str, Any], prompt: Prompt, queue: asyncio.Queue, on_upstream: Optional[Callable[[], None]] = None):
+        try:
+            async for event in self.stream_model_response(member, prompt, on_upstream):
+                queue.put_nowait(event)
+        except Exception as e:
+            print(f"Error streaming response from {member['name']}: {e}")
+            queue.put_nowait({"type": "done", "result": self._result(member, f"Model '{member['name']}' encountered an error. Please try again.", ok=False)})
+
+    async def stream_synthesis(self, prompt: str, results: List[Dict[str, Any]], omitted: Optional[List[Dict[str, Any]]] = None, history: Optional[List[Dict[str, str]]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming counterpart of synthesize_responses, same event shape as
+        stream_model_response. A candidate is replaced by the next one if it
+        sends nothing within CHAIRMAN_TIMEOUT or fails before its first token;
+        once it has streamed, it finishes the answer.
+        """
+        if not results:
+            yield {"type": "done", "result": self._result(self.chairman_candidates()[0], "No active council members available to deliberate.", ok=False)}
+            return
+
+        synthesis_prompt = self._build_synthesis_prompt(prompt, results, omitted)
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        candidates = self._chairman_order()
+        for position, chairman in enumerate(candidates):
+            last = position == len(candidates) - 1
+            start = loop.time()
+            # Pumped from its own task so waiting for the first token can time out
+            queue: asyncio.Queue = asyncio.Queue()
+            upstream: List[bool] = []
+            task = asyncio.create_task(self._pump_stream(chairman, self._with_history(chairman, synthesis_prompt, history), queue, lambda: upstream.append(True)))
+            started = timed_out = False
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), None if started or last else self.chairmen.timeout)
+                    except asyncio.TimeoutError:
+                        timed_out = True
+                        break
+                    if event["type"] == "done":
+                        if not (event["result"]["ok"] or started or last):
+                            break
+                        if upstream:
+                            self.chairmen.record(chairman, loop.time() - start, event["result"]["ok"])
+                        self._record_synthesis(chairman, loop.time() - began)
+                        yield event
+                        return
+                    started = True
+                    yield event
+            finally:
+                task.cancel()
+            self.chairmen.record(chairman, loop.time() - start, False)
+            self._hand_over(chairman, candidates[position + 1], timed_out)
+
+    async def deliberate(
+        self,
+        members: List[Dict[str, Any]],
+        prompt: str,
+        dream_mode: bool = False,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        on_synthesis: Optional[Callable[[], None]] = None,
+        provider_caps: Optional[Dict[str, asyncio.Semaphore]] = None,
+        history: Optional[List[Dict[str, str]]] = None,
+        on_outcome: Optional[Callable[[bool], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        One full council run; returns the fields of a /council response.
+        Failures come back as placeholder text, so `on_outcome(ok)` reports
+        whether the answer is real (a member answered and the consensus or
+        the Chairman produced the unified response).
+        """
+        answered: Dict[int, Dict[str, Any]] = {}
+
+        def collect(index: int, result: Dict[str, Any]):
+            answered[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+        # Parallel Execution (returns early once the quorum policy is met)
+        results, omitted = await self.gather_responses(members, prompt, collect, provider_caps, history)
+
+        # Synthesis
+        agreement = None
+        if dream_mode:
+            # In Dream Mode, return the single model's response directly
+            unified_answer = results[0]["content"] if results else "Dream generation failed."
+            chairman_name = "Seedream Protocol"
+            ok = bool(results) and results[0]["ok"]
+        else:
+            consensus, agreement, vectors = self.check_consensus(results)
+            if consensus is not None:
+                unified_answer, chairman_name = consensus
+            else:
+                if on_synthesis is not None:
+                    on_synthesis()
+                synthesis = await self.synthesize_responses(prompt, results, omitted, provider_caps, history)
+                unified_answer, chairman_name = synthesis["content"], synthesis["name"]
+            ok = consensus is not None or (synthesis["ok"] and any(r["ok"] for r in results))
+            if consensus is not None or synthesis["ok"]:
+                member_of = {id(r): members[i] for i, r in answered.items()}
+                self.profiles.observe_round([(member_of[id(r)], r) for r in results], unified_answer, vectors)
+        if on_outcome is not None:
+            on_outcome(ok)
+
+        return {
+            "unified_response": unified_answer,
+            "individual_responses": results,
+            "chairman_model": chairman_name,
+            "omitted_members": [m["id"] for m in omitted],
+            "agreement_score": agreement,
         }
-        
-        chairman_response = await self._call_provider(
-            client,
-            "https://api.groq.com/openai/v1/chat/completions",
-            self.groq_key,
-            chairman_config,
-            synthesis_prompt
-        )
-        
-        return chairman_response["content"]
+
+    def check_consensus(self, results: List[Dict[str, Any]]) -> Tuple[Optional[Tuple[str, str]], Optional[float], List[Optional[Set[int]]]]:
+        """
+        ((answer, chairman name), agreement score, answer features) when the
+        members already agree and the Chairman can be skipped, else (None,
+        score, features). The features are handed on to the model profiles,
+        so each answer is only shingled once.
+        """
+        start = time.perf_counter()
+        vectors = answer_features(results)
+        best, agreement = self.consensus.evaluate(results, vectors)
+        if agreement is not None:
+            record_request_timing("consensus", round(time.perf_counter() - start, 4))
+        if best is None:
+            return None, agreement, vectors
+        return (strip_reasoning(best["content"]), f"{best['name']} (consensus)"), agreement, vectors
+
+    def _semantic_namespace(self, members: List[Dict[str, Any]]) -> str:
+        # Only the same council may answer a near-duplicate
+        return ",".join(sorted(m["id"] for m in members))
+
+    def semantic_lookup(self, members: List[Dict[str, Any]], prompt: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(response fields, similarity) of a cached deliberation on a near-identical prompt."""
+        if self.semantic_cache is None:
+            return None
+        return self.semantic_cache.lookup(self._semantic_namespace(members), prompt)
+
+    def semantic_store(self, members: List[Dict[str, Any]], prompt: str, response: Dict[str, Any]):
+        # Only complete deliberations are worth replaying to someone else
+        if self.semantic_cache is None or response["omitted_members"]:
+            return
+        if not all(r["ok"] and "fallback" not in r for r in response["individual_responses"]):
+            return
+        self.semantic_cache.store(self._semantic_namespace(members), prompt, response)
+
+    async def run_batch(
+        self,
+        prompts: List[str],
+        members: List[Dict[str, Any]],
+        dream_mode: bool = False,
+        checkpoint_path: Optional[str] = None,
+        max_concurrent_prompts: Optional[int] = None,
+        provider_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Runs many prompts through the same council and yields one record per
+        prompt as it finishes (not in input order):
+        {"index", "prompt", "ok", "response"} or {"index", "prompt", "ok": False, "error"}.
+
+        At most `max_concurrent_prompts` deliberations run at once, and member
+        calls from all of them share one semaphore per provider on top of the
+        usual rate-limit scheduler, so a large batch cannot take every slot
+        from interactive traffic. With `checkpoint_path`, successful records
+        are appended there and a rerun replays them (marked "resumed") instead
+        of calling the models again. A prompt no member answered, or whose
+        synthesis failed, is a failed record and is not checkpointed, so a
+        rerun after an outage asks again.
+        """
+        max_concurrent_prompts = max_concurrent_prompts or settings.BATCH_MAX_CONCURRENT_PROMPTS
+        provider_concurrency = provider_concurrency or settings.BATCH_PROVIDER_CONCURRENCY
+        checkpoint = BatchCheckpoint(checkpoint_path) if checkpoint_path else None
+        finished = checkpoint.load(prompts) if checkpoint is not None else {}
+        for index in sorted(finished):
+            yield {**finished[index], "resumed": True}
+
+        providers = {m.get("provider") for m in members} | {c["provider"] for c in self.chairman_candidates()}
+        provider_caps = {provider: asyncio.Semaphore(provider_concurrency) for provider in providers}
+        pending = iter([i for i in range(len(prompts)) if i not in finished])
+        records: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            for index in pending:
+                prompt = prompts[index]
+                outcome: Dict[str, bool] = {}
+                try:
+                    response = await self.deliberate(members, prompt, dream_mode, provider_caps=provider_caps, on_outcome=lambda ok: outcome.update(ok=ok))
+                    if outcome.get("ok"):
+                        record = {"index": index, "prompt": prompt, "ok": True, "response": response}
+                    else:
+                        error = response["unified_response"] if any(r["ok"] for r in response["individual_responses"]) else "No council member answered."
+                        record = {"index": index, "prompt": prompt, "ok": False, "error": error}
+                except Exception as e:
+                    print(f"Batch item {index} failed: {e}")
+                    record = {"index": index, "prompt": prompt, "ok": False, "error": str(e)}
+                if checkpoint is not None and record["ok"]:
+                    try:
+                        checkpoint.append(record)
+                    except OSError as e:
+                        print(f"Could not checkpoint batch item {index}: {e}")
+                await records.put(record)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrent_prompts, len(prompts) - len(finished)))]
+        try:
+            for _ in range(len(prompts) - len(finished)):
+                yield await records.get()
+        finally:
+            # Stop scheduling if the consumer goes away mid-batch
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _build_chunk_prompt(self, question: str, chunk: str, part: int, parts: int) -> str:
+        return f"""
+        You are a member of the AI Council, reading part {part} of {parts} of a long document.
+
+        The user asked: "{question}"
+
+        Document part {part}/{parts}:
+        {chunk}
+
+        Write concise notes on everything in this part that bears on the question,
+        keeping key facts, figures and quotes. If nothing here is relevant, say so in one line.
+        """
+
+    def _reduction_groups(self, notes: List[Dict[str, Any]]) -> List[List[int]]:
+        """Indices of consecutive notes packed so the Chairman reads each group uncompacted (at least two per group)."""
+        groups, current, used = [], [], 0
+        for index, note in enumerate(notes):
+            cost = estimate_tokens(strip_reasoning(note["content"])) if note["ok"] else 0
+            if len(current) >= 2 and used + cost > settings.DELIBERATION_TOKEN_BUDGET:
+                groups.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += cost
+        if current:
+            groups.append(current)
+        return groups
+
+    async def map_reduce(
+        self,
+        members: List[Dict[str, Any]],
+        question: str,
+        document: str,
+        max_concurrent: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Long-input council run. The document is cut into chunks sized to the
+        member that will read each one (dealt round-robin), the chunks are read
+        in parallel with at most `max_concurrent` calls in flight, and the
+        Chairman merges the notes level by level through synthesize_responses
+        until one group is left, which is synthesized as a stream.
+
+        Yields {"type": "plan"}, one {"type": "chunk"} per note as it lands,
+        {"type": "reduce"} per reduction level, then the Chairman's "delta"
+        events and a "done" event that also carries the chunk notes.
+        """
+        readers = [m for m in members if self._reachable(m)]
+        template_tokens = estimate_tokens(self._build_chunk_prompt(question, "", 0, 0))
+        budgets = [max(1, min(settings.LONG_INPUT_CHUNK_TOKENS, self._input_budget(m, "") - template_tokens)) for m in readers]
+        chunks = split_document(document, budgets) if readers else []
+        yield {"type": "plan", "chunks": len(chunks), "members": [m["id"] for m in readers]}
+        if not chunks:
+            yield {"type": "done", "result": self._result(self.chairman_candidates()[0], "No active council members available to deliberate.", ok=False), "individual_responses": []}
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrent or settings.LONG_INPUT_MAX_CONCURRENT)
+
+        async def read(index: int) -> Tuple[int, Dict[str, Any]]:
+            member = readers[index % len(readers)]
+            async with semaphore:
+                result = await self.fetch_model_response(member, self._build_chunk_prompt(question, chunks[index], index + 1, len(chunks)))
+            return index, {**result, "name": f"{result['name']} (part {index + 1}/{len(chunks)})"}
+
+        async def reduce(group: List[Dict[str, Any]], first: int, last: int) -> Dict[str, Any]:
+            scope = (
+                f"{question}\n\n(These notes cover parts {first}-{last} of {len(chunks)} of a long document. "
+                "Merge them into one set of notes that keeps every relevant detail; a later step combines all parts.)"
+            )
+            async with semaphore:
+                result = await self.synthesize_responses(scope, group)
+            return {**result, "name": f"Chairman (parts {first}-{last})"}
+
+        tasks = [asyncio.create_task(read(i)) for i in range(len(chunks))]
+        try:
+            notes: List[Dict[str, Any]] = [{}] * len(chunks)
+            for next_done in asyncio.as_completed(tasks):
+                index, note = await next_done
+                notes[index] = note
+                yield {"type": "chunk", "index": index, "result": note}
+            individual = notes
+
+            # Parts (1-based, inclusive) each note covers
+            spans = [(i + 1, i + 1) for i in range(len(chunks))]
+            groups = self._reduction_groups(notes)
+            level = 0
+            while len(groups) > 1:
+                level += 1
+                yield {"type": "reduce", "level": level, "groups": len(groups)}
+                spans = [(spans[group[0]][0], spans[group[-1]][1]) for group in groups]
+                tasks = [asyncio.create_task(reduce([notes[i] for i in group], *span)) for group, span in zip(groups, spans)]
+                notes = list(await asyncio.gather(*tasks))
+                groups = self._reduction_groups(notes)
+
+            async for event in self.stream_synthesis(question, [notes[i] for i in groups[0]]):
+                if event["type"] == "done":
+                    event = {**event, "individual_responses": individual}
+                yield event
+        finally:
+            # Stop reading if the consumer goes away mid-document
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def probe_unhealthy(self) -> int:
+        """
+        Sends a tiny request to every tripped model that is due for a trial
+        call, so breakers close again without real traffic paying for the
+        test. Image models are left to recover on real traffic. Returns the
+        number of probes sent.
+        """
+        probes = []
+        for member in list(self.models_config.values()) + self.chairman_candidates():
+            params = member.get("params", {})
+            token_caps = [name for name in ("max_tokens", "max_completion_tokens") if name in params]
+            if token_caps and self.breakers.needs_probe(member):
+                probe = {**member, "params": {**params, **{name: 16 for name in token_caps}}}
+                probes.append({**probe, "payload": payload_template(probe)})
+        await asyncio.gather(*(self._fetch_uncached(member, "Reply with OK.") for member in probes))
+        return len(probes)
+
+    async def run_health_prober(self, interval: float):
+        """Background loop for long-running servers; started from the app lifespan."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                probed = await self.probe_unhealthy()
+                if probed:
+                    print(f"Health probe sent to {probed} degraded model(s)")
+            except Exception as e:
+                print(f"Health probe failed: {e}")
+
+    def _record_synthesis(self, chairman: Dict[str, Any], seconds: float):
+        SYNTHESIS_SECONDS.observe(seconds, chairman=chairman["id"])
+        record_request_timing("synthesis", round(seconds, 4))
+        record_request_timing("chairman", chairman["id"])
+
+    def metric_samples(self):
+        """Component counters and gauges for the /api/metrics scrape."""
+        families = []
+        if self.cache is not None:
+            cache = self.cache.stats()
+            families += [
+                ("polymind_cache_lookups_total", "counter", "Member cache lookups by result.",
+                 [({"result": "hit"}, cache["hits"]), ({"result": "miss"}, cache["misses"])]),
+                ("polymind_cache_entries", "gauge", "Entries held by each cache tier.",
+                 [({"tier": "memory"}, cache["memory_entries"]), ({"tier": "disk"}, cache["disk_entries"])]),
+            ]
+        flights = self.single_flight.stats()
+        families.append(("polymind_coalesced_calls_total", "counter", "Upstream calls by whether they were deduplicated.",
+                         [({"result": "executed"}, flights["executed"]), ({"result": "deduplicated"}, flights["deduplicated"])]))
+        families += self.chairmen.metric_samples()
+        families.append(("polymind_hedge_events_total", "counter", "Hedged launches, failovers and fallback wins.",
+                         [({"event": name}, value) for name, value in self.hedge_stats.items()]))
+        families.append(("polymind_auto_council_selections_total", "counter", "Auto council selections by whether a random member was explored.",
+                         [({"result": "profiled"}, self.profiles.selections - self.profiles.explorations),
+                          ({"result": "explored"}, self.profiles.explorations)]))
+        consensus = self.consensus.stats()
+        families.append(("polymind_consensus_checks_total", "counter", "Agreement checks by whether the Chairman was skipped.",
+                         [({"result": "skipped"}, consensus["reached"]),
+                          ({"result": "synthesized"}, consensus["checked"] - consensus["reached"])]))
+        if self.semantic_cache is not None:
+            semantic = self.semantic_cache.stats()
+            families += [
+                ("polymind_semantic_cache_lookups_total", "counter", "Semantic cache lookups by result.",
+                 [({"result": "hit"}, semantic["hits"]), ({"result": "miss"}, semantic["misses"])]),
+                ("polymind_semantic_cache_entries", "gauge", "Deliberations held by the semantic cache.",
+                 [({}, semantic["entries"])]),
+            ]
+        breakers = self.breakers.stats()
+        families.append(("polymind_circuit_open", "gauge", "1 while a provider or model circuit breaker is open.",
+                         [({"breaker": key}, int(b["state"] == "open")) for key, b in breakers["breakers"].items()]))
+        families.append(("polymind_circuit_refusals_total", "counter", "Members refused by open circuit breakers, mid-call or skipped up front.",
+                         [({"kind": "rejected"}, breakers["rejected"]), ({"kind": "skipped"}, breakers["skipped"])]))
+        limits = self.scheduler.stats()
+        for field, kind, help in (
+            ("concurrency_limit", "gauge", "Adaptive concurrency limit per provider."),
+            ("in_flight", "gauge", "Upstream calls in flight per provider."),
+            ("waiting", "gauge", "Calls queued for a provider slot."),
+            ("throttled", "counter", "429 responses per provider."),
+            ("queue_timeouts", "counter", "Calls that gave up waiting for a provider slot."),
+        ):
+            name = f"polymind_provider_{field}" + ("_total" if kind == "counter" else "")
+            families.append((name, kind, help, [({"provider": p}, stats[field]) for p, stats in limits["providers"].items()]))
+        return families
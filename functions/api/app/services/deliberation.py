@@ -0,0 +1,163 @@
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.core.config import settings
+
+# Word runs and single punctuation marks; a cheap stand-in for a BPE pre-tokenizer
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_THINK_BLOCK = re.compile(r"<think>.*?</think>", re.S | re.I)
+_OPEN_THINK = re.compile(r"<think>.*", re.S | re.I)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Fast local token estimate. BPE vocabularies split long words into roughly
+    4-character pieces, so each word counts ceil(len / 4) and each punctuation mark one.
+    """
+    return sum((len(piece) + 3) // 4 for piece in _PIECES.findall(text))
+
+
+def truncate_to_tokens(text: str, budget: int, keep: str = "head") -> str:
+    """Cuts `text` to about `budget` estimated tokens, keeping its start or its end."""
+    if budget <= 0:
+        return ""
+    pieces = list(_PIECES.finditer(text))
+    if keep == "tail":
+        pieces.reverse()
+    used = 0
+    for match in pieces:
+        used += (len(match.group()) + 3) // 4
+        if used > budget:
+            if keep == "tail":
+                return "[...] " + text[match.end():].lstrip()
+            return text[:match.start()].rstrip() + " [...]"
+    return text
+
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_at_tokens(text: str, budget: int) -> Tuple[str, str]:
+    """Splits `text` before the piece that would exceed `budget` estimated tokens."""
+    used = 0
+    for match in _PIECES.finditer(text):
+        used += (len(match.group()) + 3) // 4
+        if used > budget:
+            if match.start() == 0:
+                # A single piece longer than the budget: cut it by characters
+                return text[:budget * 4], text[budget * 4:]
+            return text[:match.start()], text[match.start():]
+    return text, ""
+
+
+def split_document(text: str, budgets: List[int]) -> List[str]:
+    """
+    Cuts a long document into chunks on paragraph, then sentence, then word
+    boundaries. Chunk i holds at most budgets[i % len(budgets)] estimated
+    tokens, so chunks dealt round-robin to members can each fit their model.
+    """
+    smallest = max(1, min(budgets))
+    units: List[Tuple[str, str]] = []  # (separator before the unit, unit)
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        separator = "\n\n"
+        for sentence in _SENTENCE_END.split(paragraph.strip()):
+            while sentence:
+                head, sentence = _split_at_tokens(sentence, smallest)
+                units.append((separator, head.rstrip()))
+                # Pieces of a cut word or a word and its punctuation rejoin without a space
+                separator = " " if head[-1:].isspace() else ""
+            separator = " "
+
+    chunks: List[str] = []
+    current, used = "", 0
+    for separator, unit in units:
+        cost = estimate_tokens(unit)
+        if current and used + cost > budgets[len(chunks) % len(budgets)]:
+            chunks.append(current)
+            current, used = "", 0
+        current = current + separator + unit if current else unit
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def strip_reasoning(content: str) -> str:
+    """Drops <think> blocks that thinking models leave inline, including one cut off by max_tokens."""
+    stripped = _OPEN_THINK.sub("", _THINK_BLOCK.sub("", content)).strip()
+    return stripped or content
+
+
+def _shingles(text: str, size: int = 3) -> Set[str]:
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _allocate(sizes: List[int], budget: int) -> List[int]:
+    """Water-filling: short answers keep everything, long ones share what is left equally."""
+    allocation = [0] * len(sizes)
+    remaining = budget
+    open_ = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    while open_:
+        share = remaining // len(open_)
+        i = open_[0]
+        if sizes[i] <= share:
+            allocation[i] = sizes[i]
+            remaining -= sizes[i]
+            open_.pop(0)
+        else:
+            for i in open_:
+                allocation[i] = share
+            break
+    return allocation
+
+
+def compact_deliberations(
+    results: List[Dict[str, Any]],
+    budget: Optional[int] = None,
+    dedup_threshold: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Turns member results into a Chairman-sized deliberation list.
+
+    Error placeholders are dropped, inline reasoning is stripped (answers that
+    only exist as a reasoning trace keep its conclusion, i.e. the tail),
+    near-duplicate answers are merged under all their authors, and the rest
+    is trimmed so the total stays within `budget` estimated tokens.
+
+    Returns [{"names": [...], "content": str}, ...] in member order.
+    """
+    budget = settings.DELIBERATION_TOKEN_BUDGET if budget is None else budget
+    dedup_threshold = settings.DELIBERATION_DEDUP_THRESHOLD if dedup_threshold is None else dedup_threshold
+
+    entries: List[Dict[str, Any]] = []
+    for result in results:
+        if not result.get("ok", True):
+            continue
+        content = strip_reasoning(result["content"])
+        shingles = _shingles(content)
+        duplicate = next((e for e in entries if _jaccard(shingles, e["shingles"]) >= dedup_threshold), None)
+        if duplicate is not None:
+            duplicate["names"].append(result["name"])
+            continue
+        entries.append({
+            "names": [result["name"]],
+            "content": content,
+            "keep": "tail" if result.get("reasoning") else "head",
+            "shingles": shingles,
+        })
+
+    sizes = [estimate_tokens(e["content"]) for e in entries]
+    for entry, size, allowed in zip(entries, sizes, _allocate(sizes, budget)):
+        if allowed < size:
+            entry["content"] = truncate_to_tokens(entry["content"], allowed, keep=entry["keep"])
+
+    return [{"names": e["names"], "content": e["content"]} for e in entries]
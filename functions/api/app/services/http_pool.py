@@ -0,0 +1,91 @@
+import asyncio
+import importlib.util
+import httpx
+from typing import Dict, Optional
+from app.core.config import settings
+
+
+def http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the optional `h2` package is installed
+    return importlib.util.find_spec("h2") is not None
+
+
+class ProviderClientPool:
+    """
+    Long-lived httpx clients, one per provider.
+
+    Each provider gets its own connection pool so a burst against one upstream
+    cannot starve keep-alive slots for the others, and every council request
+    reuses already-open TCP/TLS connections instead of handshaking again.
+    """
+
+    def __init__(
+        self,
+        base_urls: Dict[str, str],
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        verify: bool = True,
+    ):
+        self.base_urls = base_urls
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and http2_available()
+        self.transport = transport
+        self.verify = verify
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def from_settings(cls, transport: Optional[httpx.AsyncBaseTransport] = None) -> "ProviderClientPool":
+        return cls(
+            base_urls={
+                "groq": settings.GROQ_BASE_URL,
+                "nvidia": settings.NVIDIA_BASE_URL,
+                "openrouter": settings.OPENROUTER_BASE_URL,
+            },
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+            http2=settings.HTTP2_ENABLED,
+            transport=transport,
+        )
+
+    def url(self, provider: str, path: str = "/chat/completions") -> str:
+        return self.base_urls[provider].rstrip("/") + path
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        """Returns the provider's client, creating it on first use."""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_urls.get(provider, ""),
+                http2=self.http2,
+                limits=self.limits,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                transport=self.transport,
+                verify=self.verify,
+            )
+            self._clients[provider] = client
+        return client
+
+    async def warm_up(self, providers=None, timeout: float = 5.0):
+        """
+        Opens one connection per provider ahead of the first council request.
+        Any response (even 4xx) means the handshake is done; failures are only logged.
+        """
+        async def touch(provider: str):
+            try:
+                await self.get(provider).head(self.base_urls[provider], timeout=timeout)
+            except Exception as e:
+                print(f"Warm-up failed for {provider}: {e}")
+
+        await asyncio.gather(*(touch(p) for p in (providers or self.base_urls)))
+
+    async def close(self):
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(c.aclose() for c in clients), return_exceptions=True)
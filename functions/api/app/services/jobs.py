@@ -0,0 +1,193 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from app.core.config import settings
+
+# queued -> running -> synthesizing -> done | failed
+ACTIVE_STATUSES = ("queued", "running", "synthesizing")
+
+
+class JobQueueFull(Exception):
+    """Raised when accepting another job would exceed the pending-job cap."""
+
+
+class JobStore:
+    """
+    Council jobs and their per-member results in SQLite, so a poll can return
+    whatever has finished so far. Defaults to an in-memory database; point
+    JOBS_SQLITE_PATH at /tmp on Netlify to keep results across invocations
+    of a warm container.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        import sqlite3  # kept off the cold-start path until jobs are used
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False, isolation_level=None)
+        if path and path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, members TEXT NOT NULL, result TEXT, error TEXT, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_members ("
+            "job_id TEXT NOT NULL, idx INTEGER NOT NULL, result TEXT NOT NULL, completed_at REAL NOT NULL, "
+            "PRIMARY KEY (job_id, idx))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated_at)")
+
+    def create(self, job_id: str, members: List[Dict[str, Any]]):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, status, members, created_at, updated_at) VALUES (?, 'queued', ?, ?, ?)",
+                (job_id, json.dumps(members), now, now),
+            )
+
+    def set_status(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id),
+            )
+
+    def record_member(self, job_id: str, index: int, result: Dict[str, Any]):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO job_members (job_id, idx, result, completed_at) VALUES (?, ?, ?, ?)",
+                (job_id, index, json.dumps(result), now),
+            )
+            self._db.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (now, job_id))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, members, result, error, created_at, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            done = dict(self._db.execute("SELECT idx, result FROM job_members WHERE job_id = ?", (job_id,)).fetchall())
+        status, members, result, error, created_at, updated_at = row
+        return {
+            "id": job_id,
+            "status": status,
+            "members": [
+                {**member, "index": i, "result": json.loads(done[i]) if i in done else None}
+                for i, member in enumerate(json.loads(members))
+            ],
+            "result": json.loads(result) if result is not None else None,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def purge(self, older_than: float) -> int:
+        """Drops finished jobs last touched before `older_than` (epoch seconds)."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE updated_at < ? AND status IN ('done', 'failed')", (older_than,)
+            )
+            self._db.execute("DELETE FROM job_members WHERE job_id NOT IN (SELECT id FROM jobs)")
+            return cursor.rowcount
+
+    def fail_active(self, error: str) -> int:
+        """Marks jobs left unfinished by a previous process as failed."""
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE jobs SET status = 'failed', error = ?, updated_at = ? WHERE status IN ({','.join('?' * len(ACTIVE_STATUSES))})",
+                (error, time.time(), *ACTIVE_STATUSES),
+            )
+            return cursor.rowcount
+
+
+class JobManager:
+    """
+    Runs council deliberations in the background. At most `max_concurrent`
+    run at once; the rest wait their turn, and once `max_pending` jobs are
+    queued or running new submissions are refused with JobQueueFull.
+
+    Jobs need a long-running ASGI server (uvicorn and the like). Behind
+    Mangum the event loop only runs while an invocation is being served, so
+    a job would sit frozen between polls; the route refuses them there.
+    """
+
+    def __init__(self, store: JobStore, max_concurrent: int = 4, max_pending: int = 32, retention: float = 3600):
+        self.store = store
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.retention = retention
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.store.fail_active("Interrupted before completion.")
+
+    @classmethod
+    def from_settings(cls) -> "JobManager":
+        return cls(
+            JobStore(settings.JOBS_SQLITE_PATH),
+            max_concurrent=settings.JOBS_MAX_CONCURRENT,
+            max_pending=settings.JOBS_MAX_PENDING,
+            retention=settings.JOBS_RETENTION,
+        )
+
+    def submit(self, members: List[Dict[str, Any]], work: Callable[[str], Awaitable[Dict[str, Any]]]) -> str:
+        """
+        Registers a job for `members` and schedules `work(job_id)`, which
+        returns the final response body and may record members as it goes.
+        """
+        self.store.purge(time.time() - self.retention)
+        if len(self._tasks) >= self.max_pending:
+            self.rejected += 1
+            raise JobQueueFull(f"{len(self._tasks)} council jobs already pending.")
+        if self._semaphore is None:
+            # Created lazily so it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        job_id = uuid.uuid4().hex
+        self.store.create(job_id, members)
+        self.submitted += 1
+        task = asyncio.create_task(self._run(job_id, work))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job_id
+
+    async def _run(self, job_id: str, work: Callable[[str], Awaitable[Dict[str, Any]]]):
+        async with self._semaphore:
+            self._running += 1
+            self.store.set_status(job_id, "running")
+            try:
+                result = await work(job_id)
+            except Exception as e:
+                print(f"Council job {job_id} failed: {e}")
+                self.failed += 1
+                self.store.set_status(job_id, "failed", error=str(e))
+            else:
+                self.completed += 1
+                self.store.set_status(job_id, "done", result=result)
+            finally:
+                self._running -= 1
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "queued": len(self._tasks) - self._running,
+            "max_concurrent": self.max_concurrent,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,203 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Latency buckets in seconds, spanning pooled Groq calls to the 60 s upstream timeout
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]  # (name, type, help, samples)
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{k}="' + str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for k, v in sorted(labels.items())
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{_labels(dict(key))} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series: Dict[Tuple, List[float]] = {}  # key -> bucket counts + [sum, count]
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, series in self._series.items():
+            labels = dict(key)
+            for bound, count in zip(self.buckets, series):
+                lines.append(f"{self.name}_bucket{_labels({**labels, 'le': _number(bound)})} {count}")
+            lines.append(f"{self.name}_sum{_labels(labels)} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{_labels(labels)} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Minimal Prometheus text-format registry; avoids a prometheus_client dependency."""
+
+    def __init__(self):
+        self._metrics: List[Any] = []
+        self._collectors: List[Callable[[], List[Family]]] = []
+
+    def counter(self, name: str, help: str) -> Counter:
+        metric = Counter(name, help)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], List[Family]]):
+        """Collectors turn component stats (cache, limiters, ...) into samples at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+UPSTREAM_SECONDS = metrics.histogram(
+    "polymind_upstream_request_seconds",
+    "Upstream chat completion time per model and phase (connect includes DNS; total includes queueing and retries).",
+)
+UPSTREAM_RESPONSES = metrics.counter("polymind_upstream_responses_total", "Upstream calls by model and final status.")
+UPSTREAM_RETRIES = metrics.counter("polymind_upstream_retries_total", "Retried upstream attempts by model.")
+UPSTREAM_TOKENS = metrics.counter("polymind_upstream_tokens_total", "Tokens reported in the provider usage block.")
+SYNTHESIS_SECONDS = metrics.histogram("polymind_chairman_synthesis_seconds", "Chairman synthesis time.")
+COUNCIL_SECONDS = metrics.histogram("polymind_council_request_seconds", "End-to-end council request time by endpoint.")
+CLIENT_DISCONNECTS = metrics.counter("polymind_client_disconnects_total", "Council requests cancelled because their client went away, by endpoint.")
+
+_request_timings: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_timings", default=None)
+
+
+def collect_request_timings() -> Dict[str, Any]:
+    """
+    Starts collecting per-call timings for the current request. Calls made from
+    this context (including tasks it spawns) add themselves to the returned dict.
+    """
+    timings: Dict[str, Any] = {"members": {}}
+    _request_timings.set(timings)
+    return timings
+
+
+def record_request_timing(key: str, value: Any):
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[key] = value
+
+
+class CallTrace:
+    """
+    Timing of one logical upstream call, fed by httpx's `trace` extension.
+
+    httpcore reports connection and header events per attempt; the last attempt
+    wins, so a call served over a pooled connection has no connect/tls phase.
+    DNS resolution happens inside connect_tcp and is not reported separately.
+    """
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.start = time.perf_counter()
+        # When the last attempt went upstream, after its rate-limiter slot
+        self.sent: Optional[float] = None
+        self.marks: Dict[str, float] = {}
+        self.status = "error"
+        self.retries = 0
+        self.usage: Optional[Dict[str, Any]] = None
+
+    async def __call__(self, event: str, info: Dict[str, Any]):
+        self.marks[event.split(".", 1)[-1] if event.startswith(("http11.", "http2.")) else event] = time.perf_counter()
+
+    def _phase(self, started: str, completed: str) -> Optional[float]:
+        if started in self.marks and completed in self.marks:
+            return self.marks[completed] - self.marks[started]
+        return None
+
+    def phases(self) -> Dict[str, float]:
+        phases = {
+            "connect": self._phase("connection.connect_tcp.started", "connection.connect_tcp.complete"),
+            "tls": self._phase("connection.start_tls.started", "connection.start_tls.complete"),
+            "ttfb": self._phase("send_request_headers.started", "receive_response_headers.complete"),
+            "total": time.perf_counter() - self.start,
+        }
+        return {name: round(value, 4) for name, value in phases.items() if value is not None}
+
+    def upstream_seconds(self) -> Optional[float]:
+        """
+        Time since the last attempt was sent, so neither waiting for a local
+        rate-limiter slot nor retry backoff counts; None if nothing was sent.
+        """
+        return None if self.sent is None else time.perf_counter() - self.sent
+
+    def finish(self):
+        phases = self.phases()
+        for phase, seconds in phases.items():
+            UPSTREAM_SECONDS.observe(seconds, model=self.model_id, phase=phase)
+        UPSTREAM_RESPONSES.inc(model=self.model_id, status=self.status)
+        if self.retries:
+            UPSTREAM_RETRIES.inc(self.retries, model=self.model_id)
+        if self.usage:
+            for kind in ("prompt_tokens", "completion_tokens"):
+                if isinstance(self.usage.get(kind), (int, float)):
+                    UPSTREAM_TOKENS.inc(self.usage[kind], model=self.model_id, kind=kind.split("_")[0])
+            # Prompt tokens the provider served from its prefix cache, where reported
+            cached = (self.usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            if isinstance(cached, (int, float)):
+                UPSTREAM_TOKENS.inc(cached, model=self.model_id, kind="cached")
+
+        timings = _request_timings.get()
+        if timings is not None:
+            entry = {**phases, "status": self.status, "retries": self.retries}
+            if self.usage:
+                entry["usage"] = {k: v for k, v in self.usage.items() if k in ("prompt_tokens", "completion_tokens")}
+            timings["members"][self.model_id] = entry
@@ -0,0 +1,157 @@
+import random
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from app.core.config import settings
+from app.services.circuit import classify
+from app.services.consensus import answer_features, features, similarity_matrix
+from app.services.deliberation import estimate_tokens
+from app.services.stats import RollingWindow
+
+# Member id that asks for an automatically chosen council
+AUTO_COUNCIL = "auto"
+
+
+class ModelProfile:
+    __slots__ = ("latency", "outcomes", "tokens", "agreement")
+
+    def __init__(self, window: int):
+        self.latency = RollingWindow(window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.tokens = RollingWindow(window)
+        self.agreement = RollingWindow(window)
+
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        def rounded(value: Optional[float], digits: int = 3) -> Optional[float]:
+            return None if value is None else round(value, digits)
+
+        return {
+            "calls": len(self.outcomes),
+            "p50_seconds": rounded(self.latency.percentile(50)),
+            "p95_seconds": rounded(self.latency.percentile(95)),
+            "error_rate": round(self.error_rate(), 3),
+            "mean_tokens": rounded(self.tokens.mean(), 1),
+            "agreement": rounded(self.agreement.mean()),
+        }
+
+
+class ModelProfiles:
+    """
+    Rolling per-model profile behind the "auto" council: latency of recent
+    calls (p50/p95), error rate, answer length, and how closely each answer
+    matched the council's final answer (the same n-gram cosine the consensus
+    check uses).
+
+    select() keeps the models whose p95 fits `latency_budget` and takes the
+    `max_members` with the best value: agreement times success rate,
+    discounted by median latency relative to the budget (a model at half the
+    budget keeps two thirds of its value), then the terser. Models with fewer
+    than `min_samples` calls score as perfect so they get measured, and with
+    probability `explore` the last seat goes to a random other model so
+    profiles never go stale.
+    """
+
+    def __init__(self, max_members: int = 3, min_members: int = 2, latency_budget: float = 15.0, min_samples: int = 5, explore: float = 0.1, window: int = 100):
+        self.max_members = max_members
+        self.min_members = min_members
+        self.latency_budget = latency_budget
+        self.min_samples = min_samples
+        self.explore = explore
+        self.window = window
+        self._profiles: Dict[str, ModelProfile] = {}
+        self.selections = 0
+        self.explorations = 0
+
+    @classmethod
+    def from_settings(cls) -> "ModelProfiles":
+        return cls(
+            max_members=settings.AUTO_COUNCIL_MAX_MEMBERS,
+            min_members=settings.AUTO_COUNCIL_MIN_MEMBERS,
+            latency_budget=settings.AUTO_COUNCIL_LATENCY_BUDGET,
+            min_samples=settings.AUTO_COUNCIL_MIN_SAMPLES,
+            explore=settings.AUTO_COUNCIL_EXPLORE,
+        )
+
+    def _profile(self, member: Dict[str, Any]) -> ModelProfile:
+        key = member.get("id", member["model"])
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = ModelProfile(self.window)
+        return profile
+
+    def observe_call(self, member: Dict[str, Any], status: str, seconds: float):
+        """One upstream call, as reported to the circuit breakers."""
+        profile = self._profile(member)
+        if status == "cancelled":
+            # Cut off as a straggler or hedge loser: it took at least this long
+            profile.latency.add(seconds)
+            return
+        healthy = classify(status, seconds, float("inf"))
+        if healthy is None:
+            return
+        profile.outcomes.append(healthy)
+        if healthy:
+            profile.latency.add(seconds)
+
+    def observe_round(self, answers: List[Tuple[Dict[str, Any], Dict[str, Any]]], final_answer: str, vectors: Optional[List[Optional[Set[int]]]] = None):
+        """
+        (member, result) pairs of one deliberation and the answer the council
+        gave; `vectors` are the results' features() from the consensus check,
+        in the same order, so they are not computed twice.
+        """
+        if vectors is None:
+            vectors = answer_features([result for _, result in answers])
+        final = features(final_answer)
+        for (member, result), vector in zip(answers, vectors):
+            if not result["ok"]:
+                continue
+            profile = self._profile(member)
+            profile.tokens.add(estimate_tokens(result["content"]))
+            profile.agreement.add(max(0.0, similarity_matrix([vector, final])[0][1]))
+
+    def _rank(self, member: Dict[str, Any]) -> Tuple[float, float]:
+        profile = self._profiles.get(member["id"])
+        if profile is None or len(profile.outcomes) < self.min_samples:
+            return (-1.0, 0.0)
+        value = (profile.agreement.mean() or 0.0) * (1 - profile.error_rate())
+        if self.latency_budget > 0:
+            value /= 1 + (profile.latency.percentile(50) or 0.0) / self.latency_budget
+        return (-value, profile.tokens.mean() or 0.0)
+
+    def _p95(self, member: Dict[str, Any]) -> Optional[float]:
+        profile = self._profiles.get(member["id"])
+        return profile.latency.percentile(95) if profile is not None else None
+
+    def select(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """The members to ask, in candidate order."""
+        self.selections += 1
+        if len(candidates) <= self.max_members:
+            return candidates
+        budget = self.latency_budget
+
+        def fits(member: Dict[str, Any]) -> bool:
+            p95 = self._p95(member)
+            return budget <= 0 or p95 is None or p95 <= budget
+
+        within = sorted((m for m in candidates if fits(m)), key=self._rank)
+        chosen = within[:self.max_members]
+        if len(chosen) < self.min_members:
+            # Too few fit the budget: fill up with the fastest of the rest
+            slow = sorted((m for m in candidates if not fits(m)), key=lambda m: self._p95(m) or 0.0)
+            chosen += slow[:self.min_members - len(chosen)]
+        others = [m for m in candidates if m not in chosen]
+        if others and chosen and random.random() < self.explore:
+            self.explorations += 1
+            chosen[-1] = random.choice(others)
+        return [m for m in candidates if m in chosen]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_members": self.max_members,
+            "latency_budget": self.latency_budget,
+            "selections": self.selections,
+            "explorations": self.explorations,
+            "models": {key: profile.snapshot() for key, profile in sorted(self._profiles.items())},
+        }
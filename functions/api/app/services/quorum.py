@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+from app.core.config import settings
+
+# Keeps detached stragglers referenced until they finish on their own
+_detached: Set[asyncio.Task] = set()
+
+
+class QuorumPolicy:
+    """
+    Decides when the council has heard from enough members.
+
+    - "all": wait for every member (the per-call timeout still applies).
+    - "first_k": stop as soon as `min_members` members have answered; after
+      `deadline` seconds any single answer is enough.
+    - "deadline": collect whatever arrived within `deadline` seconds, waiting
+      past it only until at least `min_members` (default 1) have answered.
+
+    A quorum that can no longer be reached ends as soon as nothing is pending.
+    """
+
+    MODES = ("all", "first_k", "deadline")
+
+    def __init__(self, mode: str = "all", min_members: int = 0, deadline: Optional[float] = None, detach_stragglers: bool = False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown quorum mode '{mode}'. Expected one of: {', '.join(self.MODES)}")
+        self.mode = mode
+        self.min_members = max(0, min_members)
+        self.deadline = deadline if mode != "all" else None
+        self.detach_stragglers = detach_stragglers
+
+    @classmethod
+    def from_settings(cls) -> "QuorumPolicy":
+        return cls(
+            mode=settings.QUORUM_MODE,
+            min_members=settings.QUORUM_MIN_MEMBERS,
+            deadline=settings.QUORUM_DEADLINE,
+            detach_stragglers=settings.QUORUM_DETACH_STRAGGLERS,
+        )
+
+    def is_met(self, answered: int, pending: int, total: int, elapsed: float) -> bool:
+        if pending == 0:
+            return True
+        past_deadline = self.deadline is not None and elapsed >= self.deadline
+        if self.mode == "first_k":
+            needed = min(self.min_members or total, total)
+            return answered >= needed or (past_deadline and answered > 0)
+        if self.mode == "deadline":
+            return past_deadline and answered >= max(1, min(self.min_members, total))
+        return False
+
+    def time_left(self, elapsed: float) -> Optional[float]:
+        # None once the deadline has passed: from then on only an arrival can change the outcome
+        if self.deadline is None or elapsed >= self.deadline:
+            return None
+        return self.deadline - elapsed
+
+
+async def gather_with_quorum(
+    aws: List[Awaitable[Any]],
+    policy: QuorumPolicy,
+    is_answer: Callable[[Any], bool] = lambda result: True,
+) -> Tuple[List[Optional[Any]], List[int]]:
+    """
+    Like asyncio.gather, but returns once `policy` is met.
+
+    Returns (results, stragglers): results keeps input order with None for
+    members that had not finished, and stragglers lists their indices. Stragglers
+    are cancelled, or left running in the background if the policy detaches them.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    index = {task: i for i, task in enumerate(tasks)}
+    results: List[Optional[Any]] = [None] * len(tasks)
+    pending = set(tasks)
+    answered = 0
+    start = loop.time()
+
+    try:
+        while not policy.is_met(answered, len(pending), len(tasks), loop.time() - start):
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=policy.time_left(loop.time() - start),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                results[index[task]] = task.result()
+                if is_answer(results[index[task]]):
+                    answered += 1
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+
+    for task in pending:
+        if policy.detach_stragglers:
+            _detached.add(task)
+            task.add_done_callback(_detached.discard)
+        else:
+            task.cancel()
+
+    return results, sorted(index[task] for task in pending)
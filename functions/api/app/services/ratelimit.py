@@ -0,0 +1,220 @@
+import asyncio
+import httpx
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from app.core.config import settings
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Failures where the request never reached the model; read timeouts are not retried
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a request could not get a provider slot within the allowed wait."""
+
+
+def parse_delay(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to wait from a rate-limit header value. Understands plain seconds
+    ("2", "0.5"), Go-style durations as sent by Groq ("1m30.5s", "250ms"),
+    epoch timestamps in seconds or milliseconds (OpenRouter) and HTTP dates.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    now = time.time() if now is None else now
+    try:
+        number = float(value)
+    except ValueError:
+        parts = _DURATION.findall(value)
+        if parts and "".join(n + u for n, u in parts) == value:
+            scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+            return sum(float(n) * scale[u] for n, u in parts)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        except (TypeError, ValueError):
+            return None
+    if number > 1e12:
+        return max(0.0, number / 1000 - now)
+    if number > 1e9:
+        return max(0.0, number - now)
+    return max(0.0, number)
+
+
+class ProviderLimiter:
+    """
+    Token bucket plus AIMD concurrency limit for one provider.
+
+    Requests wait (up to `max_wait`) for both a token and a concurrency slot.
+    Successes grow the concurrency limit additively; 429s halve it and pause the
+    bucket until the provider's advertised reset time.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_concurrency: int, min_concurrency: int = 1, max_wait: float = 10.0):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_wait = max_wait
+        self.limit = float(max(min_concurrency, max_concurrency // 2))
+        self.tokens = float(burst)
+        self.in_flight = 0
+        self.waiting = 0
+        self.blocked_until = 0.0
+        self._refilled_at = time.monotonic()
+        self._cond = asyncio.Condition()
+        self.throttled = 0
+        self.timeouts = 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        """0 if a request may start now, seconds until it might, or None to wait for a release."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        self._refill(now)
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0.0
+
+    async def acquire(self):
+        deadline = time.monotonic() + self.max_wait
+        async with self._cond:
+            self.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._wait_time(now)
+                    if wait == 0.0:
+                        self.tokens -= 1
+                        self.in_flight += 1
+                        return
+                    remaining = deadline - now
+                    if remaining <= 0 or (wait is not None and wait > remaining):
+                        self.timeouts += 1
+                        raise RateLimitTimeout(f"{self.name}: no request slot within {self.max_wait:.0f}s")
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout=min(wait, remaining) if wait is not None else remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self.waiting -= 1
+
+    async def release(self):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Adapts to an upstream response; returns the advertised retry delay, if any."""
+        now = time.monotonic()
+        retry_after = parse_delay(headers.get("retry-after"))
+
+        remaining = headers.get("x-ratelimit-remaining-requests", headers.get("x-ratelimit-remaining"))
+        reset = headers.get("x-ratelimit-reset-requests", headers.get("x-ratelimit-reset"))
+        if remaining is not None and remaining.strip() == "0":
+            exhausted_for = parse_delay(reset)
+            if exhausted_for:
+                self.blocked_until = max(self.blocked_until, now + exhausted_for)
+
+        if status == 429:
+            self.throttled += 1
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            self.tokens = 0.0
+            self._refilled_at = now
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+        elif status < 400:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        return retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "tokens": round(self.tokens, 2),
+            "blocked_for": round(max(0.0, self.blocked_until - time.monotonic()), 2),
+            "throttled": self.throttled,
+            "queue_timeouts": self.timeouts,
+        }
+
+
+class RateLimitScheduler:
+    """Owns one ProviderLimiter per provider plus the shared retry/backoff policy."""
+
+    def __init__(self, limiters: Dict[str, ProviderLimiter], max_attempts: int = 3, backoff_base: float = 0.5, backoff_cap: float = 8.0):
+        self.limiters = limiters
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retries = 0
+
+    @classmethod
+    def from_settings(cls) -> "RateLimitScheduler":
+        limiters = {}
+        for provider in ("groq", "nvidia", "openrouter"):
+            prefix = provider.upper()
+            limiters[provider] = ProviderLimiter(
+                provider,
+                rate=getattr(settings, f"{prefix}_RPS"),
+                burst=getattr(settings, f"{prefix}_BURST"),
+                max_concurrency=getattr(settings, f"{prefix}_MAX_CONCURRENCY"),
+                max_wait=settings.RATE_LIMIT_MAX_WAIT,
+            )
+        return cls(limiters, settings.RETRY_MAX_ATTEMPTS, settings.RETRY_BACKOFF_BASE, settings.RETRY_BACKOFF_CAP)
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        if provider not in self.limiters:
+            self.limiters[provider] = ProviderLimiter(provider, rate=5, burst=10, max_concurrency=16, max_wait=settings.RATE_LIMIT_MAX_WAIT)
+        return self.limiters[provider]
+
+    @asynccontextmanager
+    async def slot(self, provider: str):
+        limiter = self.limiter(provider)
+        await limiter.acquire()
+        try:
+            yield limiter
+        finally:
+            await limiter.release()
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        # Full jitter keeps retries from synchronising into another burst
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after or 0.0)
+
+    def retry_delay(self, provider: str, status: int, headers: Mapping[str, str], attempt: int) -> Optional[float]:
+        """Feeds the response to the provider's limiter; returns how long to wait before retrying, or None."""
+        limiter = self.limiter(provider)
+        retry_after = limiter.observe(status, headers)
+        if status not in RETRYABLE_STATUS or attempt + 1 >= self.max_attempts:
+            return None
+        if retry_after and retry_after > limiter.max_wait:
+            # Waiting that long would outlive the request; fail fast instead
+            return None
+        self.retries += 1
+        return self.backoff(attempt, retry_after)
+
+    def error_retry_delay(self, attempt: int) -> Optional[float]:
+        """Backoff before retrying a connection-level failure, or None when out of attempts."""
+        if attempt + 1 >= self.max_attempts:
+            return None
+        self.retries += 1
+        return self.backoff(attempt)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "providers": {name: limiter.stats() for name, limiter in self.limiters.items()},
+        }
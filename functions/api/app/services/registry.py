@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+
+PROVIDERS = ("groq", "nvidia", "openrouter")
+
+# Bundled next to the settings module; MODELS_CONFIG_PATH points elsewhere
+DEFAULT_MODELS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "core", "models.json")
+
+_MEMBER_KEYS = {"name", "provider", "model", "params", "extra_body", "context_tokens", "fallbacks", "hedge"}
+_CHAIRMAN_KEYS = {"name", "provider", "model", "params", "extra_body", "context_tokens"}
+_HEDGE_KEYS = {"percentile", "initial_delay", "min_delay"}
+
+
+class RegistryError(ValueError):
+    pass
+
+
+def payload_template(member: Dict[str, Any]) -> Dict[str, Any]:
+    """The member's request body without "messages" and "stream"."""
+    return {"model": member["model"], **member.get("params", {}), **member.get("extra_body", {})}
+
+
+def is_image_model(member: Dict[str, Any]) -> bool:
+    return "image" in member.get("extra_body", {}).get("modalities", [])
+
+
+def _check_route(where: str, route: Dict[str, Any]):
+    if not isinstance(route.get("model"), str) or not route["model"]:
+        raise RegistryError(f"{where}: 'model' must be a non-empty string")
+    if route.get("provider") not in PROVIDERS:
+        raise RegistryError(f"{where}: 'provider' must be one of {', '.join(PROVIDERS)}")
+    for key in ("params", "extra_body"):
+        if not isinstance(route.get(key, {}), dict):
+            raise RegistryError(f"{where}: '{key}' must be an object")
+
+
+def _check_entry(where: str, entry: Any, keys: set):
+    if not isinstance(entry, dict):
+        raise RegistryError(f"{where}: must be an object")
+    unknown = set(entry) - keys
+    if unknown:
+        raise RegistryError(f"{where}: unknown keys {', '.join(sorted(unknown))}")
+    if not isinstance(entry.get("name"), str) or not entry["name"]:
+        raise RegistryError(f"{where}: 'name' must be a non-empty string")
+    _check_route(where, entry)
+    context_tokens = entry.get("context_tokens", 1)
+    if not isinstance(context_tokens, int) or context_tokens <= 0:
+        raise RegistryError(f"{where}: 'context_tokens' must be a positive integer")
+
+
+def _check_fallback_cycles(models: Dict[str, Dict[str, Any]]):
+    # A hedge joins the fallback's in-flight call, so two members that fall
+    # back on each other could each end up waiting for the other
+    def walk(model_id: str, path: List[str]):
+        for route in models[model_id].get("fallbacks", []):
+            if not isinstance(route, str):
+                continue
+            if route in path:
+                raise RegistryError(f"models.{path[0]}: fallbacks loop back ({' -> '.join(path + [route])})")
+            walk(route, path + [route])
+
+    for model_id in models:
+        walk(model_id, [model_id])
+
+
+def validate_chairmen(data: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    The optional "chairmen" table: Chairman candidates in order of preference,
+    with the same route keys as a member but no fallbacks or hedging (the
+    candidates are each other's fallbacks). Empty when the file has none.
+    """
+    chairmen = data.get("chairmen", {})
+    if not isinstance(chairmen, dict):
+        raise RegistryError("\"chairmen\" must be an object")
+    for chairman_id, chairman in chairmen.items():
+        # Ids key the circuit breakers and latency stats, so they must not collide
+        if chairman_id in data["models"]:
+            raise RegistryError(f"chairmen.{chairman_id}: id is already a model id")
+        _check_entry(f"chairmen.{chairman_id}", chairman, _CHAIRMAN_KEYS)
+    return chairmen
+
+
+def validate(data: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Checks a parsed models file ({"models": {id: member}}) and returns the
+    member table. Members need "name", "provider" and "model"; optional keys:
+      "params" / "extra_body": merged into every request body
+      "context_tokens": context window used to fit conversation history and
+                        long-input chunks (CONVERSATION_CONTEXT_TOKENS when absent)
+      "fallbacks": model ids (or inline {"provider", "model", ...} objects) to
+                   try when this member fails, or to race against it when hedging
+      "hedge": {"percentile", "initial_delay", "min_delay"} launches the first
+               fallback once the member is slower than its own p-th percentile
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("models"), dict) or not data["models"]:
+        raise RegistryError("expected an object with a non-empty \"models\" object")
+    models = data["models"]
+    for model_id, member in models.items():
+        where = f"models.{model_id}"
+        _check_entry(where, member, _MEMBER_KEYS)
+        for route in member.get("fallbacks", []):
+            if isinstance(route, str):
+                if route not in models or route == model_id:
+                    raise RegistryError(f"{where}: fallback '{route}' is not another model id")
+                target = models[route]
+            elif isinstance(route, dict):
+                _check_route(f"{where}.fallbacks", route)
+                target = route
+            else:
+                raise RegistryError(f"{where}: fallbacks must be model ids or objects")
+            # Same model on the same provider shares its rate limit and its failures
+            if isinstance(target, dict) and (target.get("provider"), target.get("model")) == (member["provider"], member["model"]):
+                raise RegistryError(f"{where}: fallback '{route if isinstance(route, str) else route['model']}' is the same provider and model")
+        hedge = member.get("hedge", {})
+        if not isinstance(hedge, dict) or set(hedge) - _HEDGE_KEYS or not all(isinstance(v, (int, float)) for v in hedge.values()):
+            raise RegistryError(f"{where}: 'hedge' takes numeric {', '.join(sorted(_HEDGE_KEYS))}")
+        if hedge and not member.get("fallbacks"):
+            raise RegistryError(f"{where}: 'hedge' needs at least one fallback")
+    _check_fallback_cycles(models)
+    return models
+
+
+class ModelRegistry:
+    """
+    The council's model table, loaded from a JSON file and reloaded when the
+    file changes (checked at most every `check_interval` seconds, on use).
+
+    Members are built once per load, with their "id" and a precomputed
+    "payload" template, so routing a request copies no config. A file that
+    fails validation is reported and the previous table stays in service.
+    """
+
+    def __init__(self, path: str = DEFAULT_MODELS_PATH, check_interval: float = 2.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.members: Dict[str, Dict[str, Any]] = {}
+        # Chairman candidates in order of preference (empty: the built-in one)
+        self.chairmen: List[Dict[str, Any]] = []
+        self.version = ""
+        self.reloads = 0
+        self.errors = 0
+        self._signature: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._load()
+
+    @classmethod
+    def from_settings(cls) -> "ModelRegistry":
+        return cls(settings.MODELS_CONFIG_PATH or DEFAULT_MODELS_PATH, settings.MODELS_RELOAD_INTERVAL)
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        stat = os.stat(self.path)
+        try:
+            data = json.loads(raw)
+            models = validate(data)
+            chairmen = validate_chairmen(data)
+        except json.JSONDecodeError as e:
+            raise RegistryError(f"{self.path}: {e}") from e
+        self.members = {model_id: {"id": model_id, **member, "payload": payload_template(member)} for model_id, member in models.items()}
+        self.chairmen = [{"id": chairman_id, **chairman, "payload": payload_template(chairman)} for chairman_id, chairman in chairmen.items()]
+        self.version = hashlib.sha256(raw).hexdigest()[:16]
+        self._signature = (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self) -> bool:
+        """Reloads the file if it changed since the last load. Returns True on reload."""
+        if self.check_interval < 0:
+            return False
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            self.errors += 1
+            print(f"Model registry check failed, keeping version {self.version}: {e}")
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        try:
+            self._load()
+        except (OSError, RegistryError) as e:
+            self.errors += 1
+            # Remember the broken file so it is reported once, not on every check
+            self._signature = signature
+            print(f"Model registry reload failed, keeping version {self.version}: {e}")
+            return False
+        self.reloads += 1
+        print(f"Model registry reloaded from {self.path} (version {self.version}, {len(self.members)} models)")
+        return True
+
+    def get(self, model_ids: List[str]) -> List[Dict[str, Any]]:
+        return [self.members[model_id] for model_id in model_ids if model_id in self.members]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "version": self.version,
+            "models": len(self.members),
+            "chairmen": [c["id"] for c in self.chairmen],
+            "reloads": self.reloads,
+            "errors": self.errors,
+        }
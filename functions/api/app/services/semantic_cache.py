@@ -0,0 +1,198 @@
+import re
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from app.core.config import settings
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def normalize(text: str) -> str:
+    # Case, punctuation and spacing rarely change what a council answers
+    return _SPACE.sub(" ", _NON_WORD.sub(" ", text.lower())).strip()
+
+
+def shingles(text: str, n: int = 4) -> Set[str]:
+    """Character n-grams of the normalized text (the whole text if shorter)."""
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def signature(text: str, num_hashes: int = 64, n: int = 4) -> array:
+    """
+    One-permutation MinHash: each shingle is hashed once, the top bits pick
+    one of `num_hashes` bins and the rest compete for that bin's minimum.
+    Empty bins borrow from the next filled bin so short prompts still get a
+    full signature. The fraction of equal slots estimates Jaccard similarity.
+    """
+    bits = num_hashes.bit_length() - 1
+    if 1 << bits != num_hashes:
+        raise ValueError("num_hashes must be a power of two")
+    low_mask = (1 << (32 - bits)) - 1
+    empty = 1 << 32
+    bins = [empty] * num_hashes
+    for shingle in shingles(text, n):
+        # crc32 is fast but linear; the multiply spreads it across the top bits
+        h = (zlib.crc32(shingle.encode()) * 0x9E3779B1) & 0xFFFFFFFF
+        slot, value = h >> (32 - bits), h & low_mask
+        if value < bins[slot]:
+            bins[slot] = value
+    for i in range(num_hashes):
+        if bins[i] == empty:
+            for step in range(1, num_hashes):
+                borrowed = bins[(i + step) % num_hashes]
+                if borrowed != empty:
+                    bins[i] = borrowed
+                    break
+            else:
+                bins[i] = 0
+    return array("I", bins)
+
+
+def similarity(a: array, b: array) -> float:
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+class SemanticCache:
+    """
+    Near-duplicate prompt cache for whole council responses.
+
+    Signatures are split into `bands` LSH bands; a lookup only scores entries
+    sharing at least one band with the query, so its cost depends on the
+    number of near neighbours, not on the size of the index. Entries live in
+    a namespace (the council that answered) and expire after `ttl` seconds;
+    the least recently used are evicted past `max_entries`. Prompts whose
+    numbers differ never match, whatever their similarity.
+    """
+
+    def __init__(self, threshold: float = 0.9, max_entries: int = 100_000, ttl: float = 3600, num_hashes: int = 64, bands: int = 8):
+        if num_hashes % bands:
+            raise ValueError("bands must divide num_hashes")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.num_hashes = num_hashes
+        self.bands = bands
+        self.rows = num_hashes // bands
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # id -> (expires_at, namespace, text, numbers, sig, value)
+        # Most buckets hold a single entry, stored as a bare id to save a list per band
+        self._buckets: Dict[int, Union[int, List[int]]] = {}
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lookup_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls) -> Optional["SemanticCache"]:
+        if not settings.SEMANTIC_CACHE_ENABLED:
+            return None
+        return cls(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+            ttl=settings.SEMANTIC_CACHE_TTL,
+        )
+
+    def _band_keys(self, namespace: str, sig: array) -> List[int]:
+        rows = self.rows
+        return [hash((namespace, band, sig[band * rows:(band + 1) * rows].tobytes())) for band in range(self.bands)]
+
+    def lookup(self, namespace: str, prompt: str) -> Optional[Tuple[Any, float]]:
+        """Returns (value, similarity) for the closest live entry above the threshold."""
+        start = time.perf_counter()
+        try:
+            text = normalize(prompt)
+            now = time.time()
+            entry_id = self._exact.get((namespace, text))
+            if entry_id is not None and self._entries[entry_id][0] >= now:
+                return self._hit(entry_id, 1.0)
+
+            sig = signature(text, self.num_hashes)
+            numbers = _NUMBER.findall(text)
+            best_id, best = None, self.threshold
+            seen = set()
+            for key in self._band_keys(namespace, sig):
+                bucket = self._buckets.get(key, ())
+                for candidate in (bucket,) if isinstance(bucket, int) else bucket:
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    expires_at, entry_namespace, _, entry_numbers, entry_sig, _ = self._entries[candidate]
+                    if expires_at < now or entry_namespace != namespace or entry_numbers != numbers:
+                        continue
+                    score = similarity(sig, entry_sig)
+                    if score >= best:
+                        best_id, best = candidate, score
+            if best_id is None:
+                self.misses += 1
+                return None
+            return self._hit(best_id, best)
+        finally:
+            self._lookup_seconds += time.perf_counter() - start
+
+    def _hit(self, entry_id: int, score: float) -> Tuple[Any, float]:
+        self.hits += 1
+        self._entries.move_to_end(entry_id)
+        return self._entries[entry_id][5], round(score, 4)
+
+    def store(self, namespace: str, prompt: str, value: Any):
+        text = normalize(prompt)
+        previous = self._exact.get((namespace, text))
+        if previous is not None:
+            self._remove(previous)
+        sig = signature(text, self.num_hashes)
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (time.time() + self.ttl, namespace, text, _NUMBER.findall(text), sig, value)
+        self._exact[(namespace, text)] = entry_id
+        for key in self._band_keys(namespace, sig):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = entry_id
+            elif isinstance(bucket, int):
+                self._buckets[key] = [bucket, entry_id]
+            else:
+                bucket.append(entry_id)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, entry_id: int):
+        _, namespace, text, _, sig, _ = self._entries.pop(entry_id)
+        self._exact.pop((namespace, text), None)
+        for key in self._band_keys(namespace, sig):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, int):
+                if bucket == entry_id:
+                    del self._buckets[key]
+                continue
+            bucket.remove(entry_id)
+            if len(bucket) == 1:
+                self._buckets[key] = bucket[0]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "buckets": len(self._buckets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "mean_lookup_us": round(self._lookup_seconds / lookups * 1e6, 1) if lookups else 0.0,
+            "threshold": self.threshold,
+        }
@@ -0,0 +1,28 @@
+import math
+from collections import deque
+from typing import Optional
+
+
+class RollingWindow:
+    """The last `size` samples of a measurement, with nearest-rank percentiles."""
+
+    def __init__(self, size: int = 200):
+        self._samples = deque(maxlen=size)
+
+    def add(self, value: float):
+        self._samples.append(value)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def mean(self) -> Optional[float]:
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def __len__(self):
+        return len(self._samples)
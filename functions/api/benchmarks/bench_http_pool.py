@@ -0,0 +1,123 @@
+"""
+Handshake savings of the pooled provider clients versus a client per request.
+
+Starts a local keep-alive HTTP stub (optionally TLS) that sleeps `--handshake-ms`
+on every new connection to stand in for the TCP+TLS round trips to a remote
+provider, then replays N council requests of M parallel member calls twice:
+once opening a fresh httpx.AsyncClient per request (the old route behaviour)
+and once through ProviderClientPool.
+
+    cd functions/api
+    python -m benchmarks.bench_http_pool --requests 50 --members 7 --handshake-ms 40
+"""
+import argparse
+import asyncio
+import ssl
+import statistics
+import time
+import httpx
+from app.services.http_pool import ProviderClientPool
+
+BODY = b'{"choices":[{"message":{"content":"ok"}}]}'
+
+
+class StubServer:
+    def __init__(self, handshake_ms: float, ssl_context=None):
+        self.handshake = handshake_ms / 1000
+        self.ssl_context = ssl_context
+        self.connections = 0
+        self.server = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        await asyncio.sleep(self.handshake)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n"
+                    + (b"" if head.startswith(b"HEAD ") else BODY)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0, ssl=self.ssl_context)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"{'https' if self.ssl_context else 'http'}://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def council_round(client: httpx.AsyncClient, url: str, members: int):
+    await asyncio.gather(*(client.post(url, json={"model": "stub"}) for _ in range(members)))
+
+
+async def run(args):
+    ssl_context = None
+    verify = True
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+        verify = False
+
+    server = StubServer(args.handshake_ms, ssl_context)
+    base_url = await server.start()
+    url = base_url + "/chat/completions"
+
+    # Baseline: a fresh client per council request
+    fresh = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(verify=verify) as client:
+            await council_round(client, url, args.members)
+        fresh.append(time.perf_counter() - start)
+    fresh_connections, server.connections = server.connections, 0
+
+    # Pooled: one long-lived client per provider, warmed up once
+    pool = ProviderClientPool({"stub": base_url}, max_connections=args.members, max_keepalive_connections=args.members, verify=verify)
+    await pool.warm_up()
+    pooled = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        await council_round(pool.get("stub"), url, args.members)
+        pooled.append(time.perf_counter() - start)
+    pooled_connections = server.connections
+    await pool.close()
+    await server.stop()
+
+    def report(label, samples, connections):
+        samples = sorted(samples)
+        p95 = samples[int(0.95 * (len(samples) - 1))]
+        print(f"{label:<8} mean {statistics.mean(samples) * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms   connections {connections}")
+
+    print(f"{args.requests} council requests x {args.members} members, {args.handshake_ms} ms handshake")
+    report("fresh", fresh, fresh_connections)
+    report("pooled", pooled, pooled_connections)
+    print(f"saved    {(statistics.mean(fresh) - statistics.mean(pooled)) * 1000:8.2f} ms per request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--members", type=int, default=7)
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="simulated cost of a new upstream connection")
+    parser.add_argument("--certfile", help="serve TLS with this certificate (self-signed is fine)")
+    parser.add_argument("--keyfile")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Semantic cache scale benchmark: fills the LSH index with synthetic prompts
+and times lookups for near-duplicates (should hit) and unrelated prompts
+(should miss).
+
+    cd functions/api
+    python -m benchmarks.bench_semantic_cache --entries 200000
+"""
+import argparse
+import random
+import resource
+import time
+
+from app.services.semantic_cache import SemanticCache
+
+WORDS = (
+    "explain describe compare summarize list why how what when where which quantum neural network python rust "
+    "database index cache latency throughput protein climate economy history poem haiku recipe travel budget "
+    "algorithm proof theorem galaxy planet ocean forest music painting language grammar startup market contract"
+).split()
+
+
+def prompt(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+
+
+def paraphrase(text: str, rng: random.Random) -> str:
+    # Light edits (casing, punctuation, a trailing word) that still change
+    # the normalized text, so lookups go through the LSH bands
+    return text.capitalize() + rng.choice([" please?", " briefly.", " in detail!", " thanks"])
+
+
+def timed(cache: SemanticCache, prompts):
+    samples, hits = [], 0
+    for text in prompts:
+        start = time.perf_counter()
+        hits += cache.lookup("bench", text) is not None
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return hits, samples[len(samples) // 2] * 1e6, samples[int(len(samples) * 0.99)] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    cache = SemanticCache(threshold=args.threshold, max_entries=args.entries)
+    stored = [prompt(rng) for _ in range(args.entries)]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for i, text in enumerate(stored):
+        cache.store("bench", text, {"unified_response": f"answer {i}"})
+    fill = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    near = [paraphrase(rng.choice(stored), rng) for _ in range(args.lookups)]
+    unrelated = [prompt(rng) + " " + prompt(rng) for _ in range(args.lookups)]
+    near_hits, near_p50, near_p99 = timed(cache, near)
+    far_hits, far_p50, far_p99 = timed(cache, unrelated)
+
+    print(f"{args.entries} entries filled in {fill:.1f} s ({fill / args.entries * 1e6:.0f} us/store), "
+          f"~{(rss_after - rss_before) / 1024:.0f} MiB RSS growth, {cache.stats()['buckets']} LSH buckets")
+    print(f"near-duplicates  hit {near_hits / args.lookups:6.1%}   p50 {near_p50:6.0f} us   p99 {near_p99:6.0f} us")
+    print(f"unrelated        hit {far_hits / args.lookups:6.1%}   p50 {far_p50:6.0f} us   p99 {far_p99:6.0f} us")
+
+
+if __name__ == "__main__":
+    main()
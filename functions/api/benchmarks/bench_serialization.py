@@ -0,0 +1,125 @@
+"""
+Serialization benchmark for council responses.
+
+/council body: FastAPI's response_model rendering against the lean path
+(compact JSON, optional compression), both served through a minimal ASGI
+app so framework overhead is included. Stream: encoding one SSE event per
+member token, with json.dumps against the fast encoder.
+
+    cd functions/api
+    python -m benchmarks.bench_serialization --members 7 --words 400
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from fastapi import FastAPI, Request
+
+from app.api.responses import brotli, dumps, encoded_response, orjson
+from app.models.schemas import ChatResponse
+
+
+def prose(rng: random.Random, vocabulary, weights, words: int) -> str:
+    # Zipf word frequencies, so compression ratios resemble real answers
+    return " ".join(rng.choices(vocabulary, weights, k=words)).capitalize() + "."
+
+
+def deliberation(members: int, words: int):
+    rng = random.Random(7)
+    letters = "etaoinshrdlucmfwypvbgkqjxzé"
+    vocabulary = ["".join(rng.choice(letters) for _ in range(rng.randint(2, 9))) for _ in range(5000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    return {
+        "unified_response": prose(rng, vocabulary, weights, words),
+        "individual_responses": [
+            {"name": f"Model {i} (Provider)", "content": prose(rng, vocabulary, weights, words), "ok": True} for i in range(members)
+        ],
+        "chairman_model": "Llama 3.3 70B (Groq)",
+        "omitted_members": [],
+        "agreement_score": 0.21,
+    }
+
+
+def build_app(body):
+    app = FastAPI()
+
+    # Both take the Request, as /council does (admission control needs it)
+    @app.post("/before", response_model=ChatResponse)
+    async def before(request: Request):
+        response = ChatResponse(**body)
+        response.conversation_id = "bench"
+        return response
+
+    @app.post("/after", response_model=ChatResponse)
+    async def after(request: Request):
+        response = ChatResponse(**body)
+        response.conversation_id = "bench"
+        return encoded_response(request, dumps(response.model_dump()))
+
+    return app
+
+
+def sse_cpu(encode, members: int, words: int) -> float:
+    """CPU seconds to frame one streamed council's member_delta events."""
+    events = [{"index": i % members, "id": f"model-{i % members}", "kind": "content", "delta": " word"} for i in range(members * words)]
+    start = time.process_time()
+    for event in events:
+        f"event: member_delta\ndata: {encode(event)}\n\n"
+    return time.process_time() - start
+
+
+async def call(app: FastAPI, path: str, encoding: str) -> int:
+    """One request straight into the ASGI app; returns the body size as sent."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", encoding.encode())],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return sent
+
+
+async def run(args):
+    app = build_app(deliberation(args.members, args.words))
+    rows = [("before", "/before", "identity"), ("after", "/after", "identity"), ("after gzip", "/after", "gzip")]
+    if brotli is not None:
+        rows.append(("after br", "/after", "br"))
+    print(f"{args.members} members x {args.words} words, orjson {'yes' if orjson else 'no'}, "
+          f"brotli {'yes' if brotli else 'no'}, {args.requests} requests each")
+    for label, path, encoding in rows:
+        wire = await call(app, path, encoding)
+        start = time.process_time()
+        for _ in range(args.requests):
+            await call(app, path, encoding)
+        cpu = (time.process_time() - start) / args.requests * 1e6
+        print(f"{label:12s} {cpu:8.0f} us CPU/request   {wire / 1024:7.1f} KiB on the wire")
+    events = args.members * args.words
+    for label, encode in (("stream json", json.dumps), ("stream fast", lambda event: dumps(event).decode())):
+        cpu = min(sse_cpu(encode, args.members, args.words) for _ in range(5))
+        print(f"{label:12s} {cpu * 1e6:8.0f} us CPU/request   ({events} member_delta events)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=7)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
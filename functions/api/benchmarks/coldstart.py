@@ -0,0 +1,160 @@
+"""
+Cold-start benchmark and import profiler for the Netlify/Mangum entry point.
+
+Every run spawns a fresh interpreter that imports `api` (what Netlify does on
+a cold start) and then invokes the Mangum handler once with a synthetic API
+Gateway event, so both the import cost and the work deferred to the first
+request are measured. Nothing touches the network.
+
+    cd functions/api
+    python -m benchmarks.coldstart --runs 10 --budget-ms 600
+    python -m benchmarks.coldstart --profile --top 25
+    python -m benchmarks.coldstart --save coldstart.json
+    python -m benchmarks.coldstart --baseline coldstart.json
+
+Exits non-zero when the median cold start (import + first request) is over
+--budget-ms, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+API_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter; keep it free of anything not on the
+# cold path itself.
+CHILD = """
+import json, time
+start = time.perf_counter()
+import api
+imported = time.perf_counter()
+event = {
+    "resource": "/{proxy+}", "path": PATH, "httpMethod": "GET",
+    "headers": {"host": "localhost"}, "multiValueHeaders": {},
+    "queryStringParameters": None, "multiValueQueryStringParameters": None,
+    "requestContext": {"resourcePath": "/{proxy+}", "httpMethod": "GET", "path": PATH,
+                       "stage": "prod", "identity": {"sourceIp": "127.0.0.1"}},
+    "body": None, "isBase64Encoded": False,
+}
+response = api.handler(event, type("Context", (), {})())
+done = time.perf_counter()
+print(json.dumps({"status": response["statusCode"],
+                  "import_ms": (imported - start) * 1000, "first_request_ms": (done - imported) * 1000}))
+"""
+
+
+def child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # Placeholder keys keep the missing-key warning out of the output
+    for name in ("GROQ_API_KEY", "NVIDIA_API_KEY", "OPENROUTER_API_KEY"):
+        env.setdefault(name, "bench")
+    env.setdefault("HTTP_WARM_UP", "false")
+    return env
+
+
+def cold_start(path: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", f"PATH = {path!r}\n{CHILD}"],
+        cwd=API_DIR, env=child_env(), capture_output=True, text=True, check=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    sample = json.loads(proc.stdout.strip().splitlines()[-1])
+    if sample["status"] != 200:
+        raise RuntimeError(f"{path} returned {sample['status']}")
+    sample["process_ms"] = wall
+    sample["total_ms"] = sample["import_ms"] + sample["first_request_ms"]
+    return sample
+
+
+def import_profile() -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for every module `import api` loads."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api"],
+        cwd=API_DIR, env=child_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for field in ("import_ms", "first_request_ms", "total_ms", "process_ms"):
+        values = [s[field] for s in samples]
+        summary[field] = {"median": statistics.median(values), "min": min(values), "max": max(values)}
+    return summary
+
+
+def print_profile(rows: List[Tuple[str, int, int]], top: int):
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    total = sum(by_package.values())
+    print(f"import profile: {len(rows)} modules, {total / 1000:.1f} ms self time")
+    print("  by top-level package (self time)")
+    for package, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"    {self_us / 1000:8.1f} ms  {self_us / total:5.1%}  {package}")
+    print("  application modules (cumulative)")
+    for name, _, cumulative_us in rows:
+        if name == "api" or name.startswith("app."):
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/models", help="route hit by the first invocation")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("COLD_START_BUDGET_MS", "1000")),
+                        help="fail if the median import + first request exceeds this")
+    parser.add_argument("--profile", action="store_true", help="also print per-package import costs")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--save", help="write the measurements to this JSON snapshot")
+    parser.add_argument("--baseline", help="compare against a snapshot written with --save")
+    args = parser.parse_args()
+
+    samples = [cold_start(args.path) for _ in range(args.runs)]
+    summary = summarize(samples)
+    print(f"{args.runs} cold starts, first request GET {args.path}")
+    for field, stats in summary.items():
+        print(f"{field:<18} median {stats['median']:8.1f} ms   min {stats['min']:8.1f} ms   max {stats['max']:8.1f} ms")
+
+    rows = import_profile()
+    if args.profile:
+        print_profile(rows, args.top)
+
+    snapshot = {
+        "python": sys.version.split()[0],
+        "summary": summary,
+        "modules": len(rows),
+        "app_modules": {name: cumulative_us for name, _, cumulative_us in rows if name.startswith("app.")},
+    }
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        for field, stats in summary.items():
+            before = baseline["summary"][field]["median"]
+            print(f"vs baseline {field:<18} {before:8.1f} -> {stats['median']:8.1f} ms ({stats['median'] - before:+.1f})")
+        print(f"vs baseline modules loaded {baseline['modules']} -> {len(rows)}")
+    if args.save:
+        Path(args.save).write_text(json.dumps(snapshot, indent=2))
+
+    median = summary["total_ms"]["median"]
+    if median > args.budget_ms:
+        print(f"FAIL cold start {median:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+    print(f"OK cold start {median:.1f} ms within the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
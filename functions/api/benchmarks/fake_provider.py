@@ -0,0 +1,152 @@
+"""
+Local stand-in for the Groq, NVIDIA and OpenRouter chat completion APIs.
+
+One ASGI app serves all three; the provider is picked from the request host
+(groq.fake, nvidia.fake, openrouter.fake), so it can sit behind an
+httpx.ASGITransport with no sockets at all, or be served with uvicorn:
+
+    python -m benchmarks.fake_provider --port 9000
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+import time
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+BASE_URLS = {
+    "groq": "http://groq.fake/openai/v1",
+    "nvidia": "http://nvidia.fake/v1",
+    "openrouter": "http://openrouter.fake/api/v1",
+}
+
+DEFAULT_PROFILE = {
+    "latency_ms": 800.0,      # median time to a complete answer
+    "sigma": 0.5,             # log-normal spread; 0 makes latency fixed
+    "error_rate": 0.0,        # fraction of calls answered with a 500
+    "rate_limit_rate": 0.0,   # fraction of calls answered with a 429
+    "retry_after": 1.0,       # seconds advertised on 429s
+    "tokens": 120,            # completion length in words
+    "image_kb": 256,          # size of Seedream-style base64 image payloads
+    "agreement": 0.0,         # fraction of prompts every model answers identically
+}
+
+
+class ProviderProfile:
+    def __init__(self, **overrides):
+        self.__dict__.update(DEFAULT_PROFILE)
+        self.__dict__.update(overrides)
+
+    def latency(self) -> float:
+        if self.sigma <= 0:
+            return self.latency_ms / 1000
+        return random.lognormvariate(0, self.sigma) * self.latency_ms / 1000
+
+
+def _answer(model: str, prompt: str, words: int, agreement: float = 0.0) -> str:
+    seed = sum(map(ord, prompt)) % 997
+    # Decided per prompt, not per call, so either the whole council agrees or none of it
+    word = "answer" if random.Random(prompt).random() < agreement else model.split("/")[-1]
+    return " ".join(f"{word}-{(seed + i) % 50}" for i in range(words)) + "."
+
+
+def _image_url(kb: int) -> str:
+    return "data:image/png;base64," + base64.b64encode(b"\x89PNG" + bytes(kb * 1024)).decode()
+
+
+def create_app(profiles: Optional[Dict[str, ProviderProfile]] = None) -> FastAPI:
+    profiles = profiles or {}
+    app = FastAPI(title="PolyMind fake providers")
+    app.state.calls = {"groq": 0, "nvidia": 0, "openrouter": 0}
+
+    def profile_for(request: Request):
+        provider = request.url.hostname.split(".")[0] if request.url.hostname else "groq"
+        return provider, profiles.get(provider) or ProviderProfile()
+
+    @app.api_route("/{path:path}", methods=["GET", "HEAD"])
+    async def probe(path: str):
+        # Warm-up and health probes only need a cheap answer
+        return Response(status_code=200)
+
+    @app.post("/{path:path}")
+    async def chat_completions(path: str, request: Request):
+        provider, profile = profile_for(request)
+        app.state.calls[provider] = app.state.calls.get(provider, 0) + 1
+        body: Dict[str, Any] = await request.json()
+        model = body.get("model", "unknown")
+        prompt = body.get("messages", [{}])[-1].get("content", "")
+        latency = profile.latency()
+
+        roll = random.random()
+        if roll < profile.rate_limit_rate:
+            await asyncio.sleep(min(latency, 0.05))
+            return JSONResponse(
+                {"error": {"message": "Rate limit reached", "code": 429}},
+                status_code=429,
+                headers={"retry-after": str(profile.retry_after), "x-ratelimit-remaining-requests": "0",
+                         "x-ratelimit-reset-requests": f"{profile.retry_after}s"},
+            )
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            await asyncio.sleep(latency)
+            return JSONResponse({"error": {"message": "Upstream failure"}}, status_code=500)
+
+        thinking = "thinking" in model
+        text = _answer(model, prompt, profile.tokens, profile.agreement)
+        usage = {"prompt_tokens": len(prompt.split()), "completion_tokens": profile.tokens}
+        message: Dict[str, Any] = {"role": "assistant", "content": text}
+        if "seedream" in model:
+            message = {"role": "assistant", "content": "", "images": [{"type": "image_url", "image_url": {"url": _image_url(profile.image_kb)}}]}
+        elif thinking:
+            message = {"role": "assistant", "content": "", "reasoning": text}
+
+        if not body.get("stream"):
+            await asyncio.sleep(latency)
+            return JSONResponse({
+                "id": f"fake-{time.time_ns()}",
+                "object": "chat.completion",
+                "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+
+        async def chunks():
+            # A third of the latency before the first token, the rest spread over the answer
+            await asyncio.sleep(latency / 3)
+            yield b": OPENROUTER PROCESSING\n\n"
+            # Image models send no text, only the final images delta
+            words = [] if "images" in message else text.split(" ")
+            field = "reasoning" if thinking else "content"
+            step = (latency * 2 / 3) / max(1, len(words) // 8)
+            for i in range(0, len(words), 8):
+                delta = {field: " ".join(words[i:i + 8]) + " "}
+                yield f"data: {json.dumps({'choices': [{'index': 0, 'delta': delta}]})}\n\n".encode()
+                await asyncio.sleep(step)
+            if "images" in message:
+                yield f"data: {json.dumps({'choices': [{'index': 0, 'delta': {'images': message['images']}}]})}\n\n".encode()
+            yield f"data: {json.dumps({'choices': [], 'usage': usage})}\n\n".encode()
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_PROFILE["latency_ms"])
+    parser.add_argument("--sigma", type=float, default=DEFAULT_PROFILE["sigma"])
+    args = parser.parse_args()
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("Serving over a socket needs uvicorn (pip install uvicorn).")
+    profile = ProviderProfile(latency_ms=args.latency_ms, sigma=args.sigma)
+    uvicorn.run(create_app({p: profile for p in BASE_URLS}), port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Offline load test for /api/council.
+
+Drives the real FastAPI app in-process while CouncilService talks to
+benchmarks.fake_provider the same way, so nothing touches the network. Both
+go through StreamingASGITransport, which delivers bodies as they are sent,
+so SSE pacing and time to first token are what a socket client would see.
+Reports throughput, latency percentiles and memory.
+
+    cd functions/api
+    python -m benchmarks.loadtest --requests 200 --concurrency 20
+    python -m benchmarks.loadtest --stream --latency-ms 1500 --sigma 0.8
+    python -m benchmarks.loadtest --rate-limit-rate 0.1 --error-rate 0.05
+    python -m benchmarks.loadtest --agreement 0.5
+"""
+import argparse
+import asyncio
+import math
+import os
+import resource
+import time
+import tracemalloc
+from typing import List
+
+# Benchmarks measure the council, not the production rate limits or cache:
+# both are opened up unless the caller's environment says otherwise.
+for name, value in {
+    "GROQ_API_KEY": "bench", "NVIDIA_API_KEY": "bench", "OPENROUTER_API_KEY": "bench",
+    "CACHE_ENABLED": "false", "HTTP_WARM_UP": "false",
+    "GROQ_RPS": "1000", "NVIDIA_RPS": "1000", "OPENROUTER_RPS": "1000",
+    "GROQ_BURST": "1000", "NVIDIA_BURST": "1000", "OPENROUTER_BURST": "1000",
+    "GROQ_MAX_CONCURRENCY": "256", "NVIDIA_MAX_CONCURRENCY": "256", "OPENROUTER_MAX_CONCURRENCY": "256",
+}.items():
+    os.environ.setdefault(name, value)
+
+import httpx
+from app.main import app
+from app.api.routes import get_council_service
+from app.services.http_pool import ProviderClientPool
+from benchmarks.fake_provider import BASE_URLS, ProviderProfile, create_app
+from benchmarks.streaming import StreamingASGITransport
+
+DEFAULT_MODELS = ["groq-qwen", "groq-versatile", "groq-gptoss", "nvidia-deepseek", "or-aurora", "or-trinity", "or-liquid"]
+
+
+def percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+async def one_request(client: httpx.AsyncClient, i: int, args) -> dict:
+    prompt = f"Benchmark prompt {i % args.distinct_prompts}: what is {i % args.distinct_prompts} squared?"
+    body = {"prompt": prompt, "active_models": args.models, "dream_mode": args.dream}
+    start = time.perf_counter()
+    first_token = None
+    status = 0
+    if args.stream:
+        async with client.stream("POST", "/api/council/stream", json=body) as response:
+            status = response.status_code
+            async for line in response.aiter_lines():
+                if first_token is None and line.startswith("event: member_delta"):
+                    first_token = time.perf_counter() - start
+            size = response.num_bytes_downloaded
+    else:
+        response = await client.post("/api/council", json=body)
+        status = response.status_code
+        size = len(response.content)
+    return {"status": status, "latency": time.perf_counter() - start, "ttft": first_token, "bytes": size}
+
+
+async def run(args):
+    profile = ProviderProfile(
+        latency_ms=args.latency_ms, sigma=args.sigma, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after, tokens=args.tokens, image_kb=args.image_kb,
+        agreement=args.agreement,
+    )
+    fake = create_app({provider: profile for provider in BASE_URLS})
+    pool = ProviderClientPool(BASE_URLS, max_connections=args.concurrency * 4, transport=StreamingASGITransport(fake))
+    get_council_service().attach_pool(pool)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    transport = StreamingASGITransport(app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://polymind.bench", timeout=300) as client:
+        async def bounded(i):
+            async with semaphore:
+                return await one_request(client, i, args)
+
+        # Warm-up request so imports and first-use setup do not skew the percentiles
+        await one_request(client, -1, args)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = await asyncio.gather(*(bounded(i) for i in range(args.requests)))
+        wall = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    await pool.close()
+
+    latencies = [r["latency"] for r in results]
+    failures = sum(1 for r in results if r["status"] != 200)
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {len(args.models)} members, "
+          f"{'stream' if args.stream else 'council'}{' dream' if args.dream else ''}")
+    print(f"upstream  median {args.latency_ms:.0f} ms, sigma {args.sigma}, errors {args.error_rate:.0%}, 429s {args.rate_limit_rate:.0%}")
+    print(f"throughput {args.requests / wall:8.2f} req/s   wall {wall:.2f} s   non-200 {failures}")
+    print(f"latency    p50 {percentile(latencies, 50) * 1000:8.1f} ms   p95 {percentile(latencies, 95) * 1000:8.1f} ms   "
+          f"p99 {percentile(latencies, 99) * 1000:8.1f} ms")
+    ttfts = [r["ttft"] for r in results if r["ttft"] is not None]
+    if ttfts:
+        print(f"first tok  p50 {percentile(ttfts, 50) * 1000:8.1f} ms   p95 {percentile(ttfts, 95) * 1000:8.1f} ms")
+    print(f"response   mean {sum(r['bytes'] for r in results) / len(results) / 1024:8.1f} KiB")
+    print(f"memory     traced peak {peak / 2**20:8.1f} MiB   max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:8.1f} MiB")
+    print(f"upstream calls {fake.state.calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--models", nargs="+", default=DEFAULT_MODELS)
+    parser.add_argument("--stream", action="store_true", help="drive /api/council/stream and report time to first token")
+    parser.add_argument("--dream", action="store_true", help="dream mode (Seedream image responses)")
+    parser.add_argument("--distinct-prompts", type=int, default=10**9, help="repeat prompts to exercise caching/coalescing")
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--tokens", type=int, default=120)
+    parser.add_argument("--image-kb", type=int, default=256)
+    parser.add_argument("--agreement", type=float, default=0.0, help="fraction of prompts the members all answer alike")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
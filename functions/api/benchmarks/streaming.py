@@ -0,0 +1,105 @@
+"""
+An httpx transport that calls an ASGI app in-process like httpx.ASGITransport,
+but returns the response as soon as the app starts it and streams the body
+as the app sends it. httpx.ASGITransport buffers the whole body first, so
+time to first token through it equals total latency.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+
+# How long a closed response gives the app to notice the disconnect and return
+_CLOSE_GRACE_SECONDS = 1.0
+
+
+class _StreamedBody(httpx.AsyncByteStream):
+    def __init__(self, chunks: asyncio.Queue, closed: asyncio.Event, task: asyncio.Task):
+        self._chunks = chunks
+        self._closed = closed
+        self._task = task
+
+    async def __aiter__(self):
+        while True:
+            chunk = await self._chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+
+    async def aclose(self):
+        # The app sees http.disconnect, as it would when a socket client hangs up
+        self._closed.set()
+        if not self._task.done():
+            await asyncio.wait({self._task}, timeout=_CLOSE_GRACE_SECONDS)
+            self._task.cancel()
+
+
+class StreamingASGITransport(httpx.AsyncBaseTransport):
+    def __init__(self, app: Any, client=("127.0.0.1", 123)):
+        self.app = app
+        self.client = client
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = b"".join([chunk async for chunk in request.stream])
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "headers": [(k.lower(), v) for (k, v) in request.headers.raw],
+            "scheme": request.url.scheme,
+            "path": request.url.path,
+            "raw_path": request.url.raw_path.split(b"?")[0],
+            "query_string": request.url.query,
+            "server": (request.url.host, request.url.port),
+            "client": self.client,
+            "root_path": "",
+        }
+        loop = asyncio.get_running_loop()
+        started: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        chunks: asyncio.Queue = asyncio.Queue()
+        closed = asyncio.Event()
+        request_sent = False
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await closed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]):
+            if message["type"] == "http.response.start":
+                started.set_result(message)
+            elif message["type"] == "http.response.body":
+                if message.get("body") and request.method != "HEAD":
+                    chunks.put_nowait(message["body"])
+                if not message.get("more_body", False):
+                    chunks.put_nowait(None)
+
+        async def run():
+            error: Optional[Exception] = None
+            try:
+                await self.app(scope, receive, send)
+            except Exception as e:
+                # Raised to the caller before the response starts; after that
+                # the body just ends, as a dropped connection would
+                error = e
+            finally:
+                chunks.put_nowait(None)
+                if not started.done():
+                    started.set_exception(error or RuntimeError("The app returned without starting a response."))
+
+        task = asyncio.create_task(run())
+        try:
+            message = await started
+        except BaseException:
+            task.cancel()
+            raise
+        return httpx.Response(
+            message["status"],
+            headers=message.get("headers", []),
+            stream=_StreamedBody(chunks, closed, task),
+            request=request,
+        )
@@ -0,0 +1,56 @@
+"""
+Settings are read from the environment when app.core.config is imported, so
+the test environment is pinned here, before any test module imports the app.
+
+    cd functions/api
+    python -m pytest -q
+"""
+import importlib.util
+import json
+import os
+import tempfile
+
+import pytest
+
+_scratch = tempfile.mkdtemp(prefix="polymind-tests-")
+
+for name, value in {
+    "GROQ_API_KEY": "test",
+    "NVIDIA_API_KEY": "test",
+    "OPENROUTER_API_KEY": "test",
+    "HTTP_WARM_UP": "false",
+    "CACHE_ENABLED": "false",
+    "BLOB_DIR": os.path.join(_scratch, "blobs"),
+    "BATCH_CHECKPOINT_DIR": os.path.join(_scratch, "batches"),
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def apigw_event():
+    """Builds an API Gateway (REST) event, as Netlify hands to the Mangum handler."""
+    def build(method: str, path: str, body=None, headers=None):
+        headers = {"host": "polymind.test", "content-type": "application/json", **(headers or {})}
+        return {
+            "resource": "/{proxy+}",
+            "path": path,
+            "httpMethod": method,
+            "headers": headers,
+            "multiValueHeaders": {k: [v] for k, v in headers.items()},
+            "queryStringParameters": None,
+            "multiValueQueryStringParameters": None,
+            "requestContext": {"resourcePath": "/{proxy+}", "httpMethod": method, "path": path, "identity": {"sourceIp": "203.0.113.9"}},
+            "body": json.dumps(body) if body is not None else None,
+            "isBase64Encoded": False,
+        }
+    return build
+
+
+@pytest.fixture
+def mangum_handler():
+    """The Netlify entry point (api.py), loaded by path: "api" is also this package's name."""
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "api.py")
+    spec = importlib.util.spec_from_file_location("netlify_entry", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.handler
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from app.services.admission import AdmissionController, AdmissionRejected, client_id
+
+
+def test_client_id_ignores_headers_the_caller_chooses():
+    spoofed = {
+        "x-api-key": "fresh-every-time",
+        "authorization": "Bearer x",
+        "x-forwarded-for": "198.51.100.1",
+        "x-nf-client-connection-ip": "203.0.113.9",
+    }
+    # Straight to uvicorn, Netlify's header is just another forgeable header
+    assert client_id(spoofed, "10.0.0.5") == "ip:10.0.0.5"
+    assert client_id(spoofed, "10.0.0.5", behind_netlify=True) == "ip:203.0.113.9"
+    assert client_id({}, "10.0.0.5", behind_netlify=True) == "ip:10.0.0.5"
+    assert client_id({}, None) == "ip:unknown"
+
+
+async def enqueue(admission: AdmissionController, client: str, cost: int, granted: list) -> asyncio.Task:
+    async def request():
+        ticket = await admission.acquire(client, cost)
+        granted.append(client)
+        return ticket
+
+    task = asyncio.create_task(request())
+    # Let it reach the queue before the next one arrives
+    await settle()
+    return task
+
+
+async def settle():
+    # Granted waiters resume through wait_for, a few loop turns later
+    await asyncio.sleep(0.01)
+
+
+def test_a_busy_client_cannot_starve_a_newcomer():
+    async def scenario():
+        admission = AdmissionController(max_inflight=2, max_queue=8)
+        holder = await admission.acquire("heavy", 2)
+        granted = []
+        tasks = [await enqueue(admission, "heavy", 1, granted) for _ in range(3)]
+        tasks.append(await enqueue(admission, "light", 1, granted))
+        assert admission.queued == 4 and granted == []
+
+        admission.release(holder)
+        await settle()
+        # The newcomer's tag is behind heavy's backlog, so it goes first
+        assert granted == ["light", "heavy"]
+        for task in tasks[:2] + tasks[3:]:
+            admission.release(await task)
+        await settle()
+        assert granted == ["light", "heavy", "heavy", "heavy"]
+        admission.release(await tasks[2])
+        assert admission.inflight == 0 and admission.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_a_request_queued_past_the_timeout_is_turned_away():
+    async def scenario():
+        admission = AdmissionController(max_inflight=1, max_queue=8, queue_timeout=0.05)
+        holder = await admission.acquire("a", 1)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire("b", 1)
+        assert rejected.value.reason == "deadline" and rejected.value.retry_after >= 1
+        assert admission.queued == 0 and admission.rejected["deadline"] == 1
+        admission.release(holder)
+        assert admission.inflight == 0
+
+    asyncio.run(scenario())
+
+
+def test_a_full_queue_pushes_out_the_client_over_its_share():
+    async def scenario():
+        admission = AdmissionController(max_inflight=1, max_queue=1)
+        holder = await admission.acquire("heavy", 1)
+        granted = []
+        pushed = await enqueue(admission, "heavy", 1, granted)
+        with pytest.raises(AdmissionRejected):
+            # Heavy again: nothing queued is behind it
+            await admission.acquire("heavy", 1)
+        light = await enqueue(admission, "light", 1, granted)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await pushed
+        assert rejected.value.reason == "queue_full"
+        assert admission.rejected["queue_full"] == 2
+
+        admission.release(holder)
+        admission.release(await light)
+        assert granted == ["light"] and admission.inflight == 0 and admission.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_release_is_idempotent_and_cancelled_waiters_leave_the_queue():
+    async def scenario():
+        admission = AdmissionController(max_inflight=1, max_queue=8)
+        holder = await admission.acquire("a", 1)
+        waiter = await enqueue(admission, "b", 1, [])
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert admission.queued == 0
+
+        admission.release(holder)
+        admission.release(holder)
+        assert admission.inflight == 0
+        assert await admission.acquire("c", 1) is not None
+        assert admission.inflight == 1
+
+    asyncio.run(scenario())
+
+
+def test_disabled_admission_admits_everything():
+    async def scenario():
+        admission = AdmissionController(max_inflight=1, enabled=False)
+        assert await admission.acquire("a", 5) is None
+        admission.release(None)
+        assert admission.inflight == 0
+
+    asyncio.run(scenario())
+
+
+def test_removing_the_head_of_the_queue_lets_the_next_one_in():
+    async def scenario():
+        admission = AdmissionController(max_inflight=2, max_queue=8)
+        holder = await admission.acquire("a", 1)
+        granted = []
+        # Needs the whole capacity, so it holds back the small request behind it
+        large = await enqueue(admission, "b", 2, granted)
+        small = await enqueue(admission, "c", 1, granted)
+        assert granted == []
+        large.cancel()
+        await settle()
+        assert granted == ["c"] and admission.inflight == 2
+        admission.release(await small)
+        admission.release(holder)
+        assert admission.inflight == 0 and admission.queued == 0
+
+    asyncio.run(scenario())
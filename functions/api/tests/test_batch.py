@@ -0,0 +1,95 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.services.batch import BatchCheckpoint
+from app.services.chairman import ChairmanSelector
+from app.services.council import CouncilService
+
+PROMPTS = ["What is the capital of France?", "What is the capital of Peru?", "What is the capital of Chad?"]
+
+
+def test_checkpoint_keeps_matching_records_and_skips_a_torn_line(tmp_path):
+    path = str(tmp_path / "nested" / "batch.jsonl")
+    checkpoint = BatchCheckpoint(path)
+    checkpoint.append({"index": 0, "prompt": PROMPTS[0], "ok": True, "response": {"unified_response": "Paris."}})
+    checkpoint.append({"index": 1, "prompt": "A prompt that was since edited", "ok": True})
+    checkpoint.append({"index": 7, "prompt": PROMPTS[2], "ok": True})
+    with open(path, "a") as f:
+        f.write('{"index": 2, "prompt": "What is the capital')
+    finished = checkpoint.load(PROMPTS)
+    assert list(finished) == [0]
+    assert finished[0]["response"]["unified_response"] == "Paris."
+    assert BatchCheckpoint(str(tmp_path / "missing.jsonl")).load(PROMPTS) == {}
+
+
+@pytest.fixture
+def council(monkeypatch):
+    service = CouncilService()
+    service.chairmen = ChairmanSelector(timeout=5)
+    service.up = True
+    service.calls = Counter()
+    service.active = Counter()
+    service.peak = Counter()
+
+    async def fetch(member, prompt, on_upstream=None):
+        provider = member["provider"]
+        service.calls[member["id"]] += 1
+        service.active[provider] += 1
+        service.peak[provider] = max(service.peak[provider], service.active[provider])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            service.active[provider] -= 1
+        if not service.up:
+            return service._result(member, f"Model '{member['name']}' encountered an error. Please try again.", ok=False)
+        # Members disagree, so every prompt goes to the Chairman
+        return service._result(member, f"{member['id']} thinks {len(member['id']) * 'very '}differently.")
+
+    monkeypatch.setattr(service, "fetch_model_response", fetch)
+    return service
+
+
+async def collect(council, members, checkpoint=None, **options):
+    return [record async for record in council.run_batch(PROMPTS, members, checkpoint_path=checkpoint, **options)]
+
+
+def test_failed_prompts_are_not_checkpointed_and_run_again(council, tmp_path):
+    members = council.registry.get(["groq-qwen", "or-aurora"])
+    checkpoint = str(tmp_path / "batch.jsonl")
+
+    council.up = False
+    records = asyncio.run(collect(council, members, checkpoint))
+    assert [r["ok"] for r in records] == [False] * 3
+    assert all(r["error"] == "No council member answered." for r in records)
+    assert BatchCheckpoint(checkpoint).load(PROMPTS) == {}
+
+    council.up = True
+    records = asyncio.run(collect(council, members, checkpoint))
+    assert all(r["ok"] and not r.get("resumed") for r in records)
+    assert len(open(checkpoint).read().splitlines()) == 3
+
+    calls = sum(council.calls.values())
+    records = asyncio.run(collect(council, members, checkpoint))
+    assert all(r["resumed"] for r in records) and sum(council.calls.values()) == calls
+    assert sorted(r["index"] for r in records) == [0, 1, 2]
+
+
+def test_a_failed_synthesis_fails_the_record(council, monkeypatch):
+    members = council.registry.get(["groq-qwen", "or-aurora"])
+
+    async def synthesize(*args, **kwargs):
+        return council._result(council.chairman_candidates()[0], "The Chairman is unavailable.", ok=False)
+
+    monkeypatch.setattr(council, "synthesize_responses", synthesize)
+    records = asyncio.run(collect(council, members))
+    assert [r["ok"] for r in records] == [False] * 3
+    assert records[0]["error"] == "The Chairman is unavailable."
+
+
+def test_member_calls_share_the_provider_caps(council):
+    members = council.registry.get(["groq-qwen", "groq-versatile", "groq-gptoss"])
+    records = asyncio.run(collect(council, members, max_concurrent_prompts=3, provider_concurrency=2))
+    assert all(r["ok"] for r in records)
+    assert council.peak["groq"] == 2
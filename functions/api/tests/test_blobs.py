@@ -0,0 +1,90 @@
+import asyncio
+import base64
+
+import httpx
+import pytest
+
+from app.api import routes
+from app.core.config import settings
+from app.main import app
+from app.services.blobs import BlobStore
+from app.services.cache import MemoryCache, ResponseCache
+from app.services.council import CouncilService
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+@pytest.fixture
+def blobs(tmp_path, monkeypatch):
+    store = BlobStore(str(tmp_path / "blobs"))
+    monkeypatch.setattr(routes, "_blob_store", store)
+    return store
+
+
+def get(path: str, headers=None) -> httpx.Response:
+    async def request():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://polymind.test") as client:
+            return await client.get(path, headers=headers)
+
+    return asyncio.run(request())
+
+
+def test_images_are_served_whole_and_by_range(blobs):
+    digest = blobs.put(PNG)
+    whole = get(f"/api/images/{digest}")
+    assert whole.status_code == 200
+    assert whole.content == PNG
+    assert whole.headers["content-type"] == "image/png"
+    assert whole.headers["etag"] == f'"{digest}"'
+    assert "immutable" in whole.headers["cache-control"]
+
+    part = get(f"/api/images/{digest}", {"Range": "bytes=8-263"})
+    assert part.status_code == 206
+    assert part.content == PNG[8:264]
+    assert part.headers["content-range"] == f"bytes 8-263/{len(PNG)}"
+
+    tail = get(f"/api/images/{digest}", {"Range": "bytes=-16"})
+    assert tail.status_code == 206 and tail.content == PNG[-16:]
+
+    assert get(f"/api/images/{digest}", {"If-None-Match": f'"{digest}"'}).status_code == 304
+
+
+def test_unknown_malformed_and_unconfigured_images_are_404(blobs, monkeypatch):
+    assert get("/api/images/" + "0" * 64).status_code == 404
+    assert get("/api/images/not-a-digest").status_code == 404
+    digest = blobs.put(PNG)
+    monkeypatch.setattr(routes, "_blob_store", None)
+    monkeypatch.setattr(settings, "BLOB_DIR", "")
+    assert get(f"/api/images/{digest}").status_code == 404
+
+
+def test_store_evicts_the_oldest_blobs_past_its_budget(tmp_path):
+    store = BlobStore(str(tmp_path), max_bytes=2500)
+    first = store.put(b"a" * 1000)
+    second = store.put(b"b" * 1000)
+    assert store.put(b"b" * 1000) == second and store.writes == 2
+    third = store.put(b"c" * 1000)
+    assert store.open_path(first) is None
+    assert store.open_path(second) and store.open_path(third)
+    assert store.stats()["evictions"] == 1
+    # A fresh instance finds what is on disk
+    assert BlobStore(str(tmp_path)).stats()["blobs"] == 2
+
+
+def test_images_stay_inline_without_a_shared_store(monkeypatch):
+    monkeypatch.setattr(settings, "BLOB_DIR", "")
+    council = CouncilService()
+    assert council.blobs is None
+    data_url = "data:image/png;base64," + base64.b64encode(PNG).decode()
+    assert council._image_link(data_url) == data_url
+
+
+def test_image_links_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BLOB_DIR", str(tmp_path))
+    council = CouncilService(cache=ResponseCache(MemoryCache(10, 60)))
+    link = council._image_link("data:image/png;base64," + base64.b64encode(PNG).decode())
+    assert link.startswith(settings.IMAGE_BASE_URL + "/")
+    council._cache_store("image", {"content": f"![Dream Generated]({link})", "ok": True})
+    council._cache_store("text", {"content": "An answer.", "ok": True})
+    assert council.cache.get("image") is None
+    assert council.cache.get("text") is not None
@@ -0,0 +1,71 @@
+import pytest
+
+from app.services import cache as cache_module
+from app.services.cache import MemoryCache, ResponseCache, SQLiteCache, member_cache_key
+
+MEMBER = {"provider": "groq", "model": "llama-3.3-70b-versatile", "params": {"temperature": 0.7}}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def tier(request, tmp_path, clock):
+    def make(max_entries, ttl):
+        if request.param == "memory":
+            return MemoryCache(max_entries, ttl)
+        return SQLiteCache(str(tmp_path / "cache.db"), max_entries, ttl)
+
+    return make
+
+
+def test_entries_expire_after_their_ttl(tier, clock):
+    store = tier(10, ttl=60)
+    store.set("a", {"content": "Paris"})
+    clock[0] += 59
+    assert store.get("a") == {"content": "Paris"}
+    clock[0] += 2
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_the_least_recently_used_entry_is_evicted(tier, clock):
+    store = tier(2, ttl=60)
+    store.set("a", 1)
+    clock[0] += 1
+    store.set("b", 2)
+    clock[0] += 1
+    assert store.get("a") == 1
+    clock[0] += 1
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1 and store.get("c") == 3
+    assert len(store) == 2
+
+
+def test_the_disk_tier_refills_memory_after_a_cold_start(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    ResponseCache(MemoryCache(10, 60), SQLiteCache(path, 10, 60)).set("a", {"content": "Paris"})
+    cold = ResponseCache(MemoryCache(10, 60), SQLiteCache(path, 10, 60))
+    assert cold.get("a") == {"content": "Paris"}
+    assert cold.get("a") == {"content": "Paris"}
+    assert cold.get("b") is None
+    stats = cold.stats()
+    assert (stats["hits"], stats["disk_hits"], stats["misses"], stats["memory_entries"]) == (2, 1, 1, 1)
+
+
+def test_keys_change_with_anything_sent_upstream_and_nothing_else():
+    key = member_cache_key(MEMBER, "What is  the capital\nof France?")
+    assert key == member_cache_key(MEMBER, "What is the capital of France?")
+    assert key == member_cache_key({**MEMBER, "name": "Renamed", "weight": 2}, "What is the capital of France?")
+    assert key != member_cache_key(MEMBER, "what is the capital of france?")
+    assert key != member_cache_key({**MEMBER, "params": {"temperature": 0.2}}, "What is the capital of France?")
+    assert key != member_cache_key({**MEMBER, "extra_body": {"reasoning": {"effort": "low"}}}, "What is the capital of France?")
+    assert key != member_cache_key({**MEMBER, "provider": "openrouter"}, "What is the capital of France?")
+    history = [{"role": "user", "content": "What is the capital of France?"}]
+    assert key != member_cache_key(MEMBER, history)
+    assert member_cache_key(MEMBER, history) != member_cache_key(MEMBER, [{"role": "user", "content": "What is the capital of  France?"}])
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from app.services.cache import MemoryCache, ResponseCache
+from app.services.chairman import ChairmanSelector
+from app.services.council import CouncilService
+
+PRIMARY = {"id": "primary", "name": "Primary", "provider": "groq", "model": "primary"}
+BACKUP = {"id": "backup", "name": "Backup", "provider": "openrouter", "model": "backup"}
+ANSWERS = [{"name": "A", "content": "Paris.", "ok": True}, {"name": "B", "content": "Paris, France.", "ok": True}]
+
+
+def idle(candidate):
+    return 0.0, 0.0
+
+
+def test_a_healthy_primary_keeps_the_job_within_the_slack():
+    selector = ChairmanSelector(slack=0.5)
+    selector.record(PRIMARY, 3.0, True)
+    selector.record(BACKUP, 2.5, True)
+    assert selector.order([PRIMARY, BACKUP], lambda c: True, idle) == [PRIMARY, BACKUP]
+    selector.record(PRIMARY, 30.0, True)
+    selector.record(PRIMARY, 30.0, True)
+    assert selector.order([PRIMARY, BACKUP], lambda c: True, idle) == [BACKUP, PRIMARY]
+    # Ruled out (breaker open, no key) unless nobody else is left
+    assert selector.order([PRIMARY, BACKUP], lambda c: c is PRIMARY, idle) == [PRIMARY]
+
+
+def test_a_passed_over_primary_gets_a_trial_and_recovers():
+    selector = ChairmanSelector(timeout=20.0, retry_seconds=0.0)
+    selector.record(PRIMARY, 20.0, False)
+    selector.record(BACKUP, 2.0, True)
+    # A trial is due at once, so the primary is asked again...
+    assert selector.order([PRIMARY, BACKUP], lambda c: True, idle)[0] is PRIMARY
+    selector.record(PRIMARY, 1.0, True)
+    # ...and, having answered, competes on its new record alone
+    assert selector.expected_seconds(PRIMARY) == 1.0
+
+
+@pytest.fixture
+def council(monkeypatch):
+    service = CouncilService()
+    service.chairmen = ChairmanSelector(timeout=0.05)
+    monkeypatch.setattr(service, "chairman_candidates", lambda: [PRIMARY, BACKUP])
+    return service
+
+
+def test_synthesis_fails_over_when_the_chairman_times_out(council, monkeypatch):
+    async def fetch(member, prompt, on_upstream=None):
+        on_upstream()
+        if member is PRIMARY:
+            await asyncio.sleep(1)
+        return council._result(member, f"{member['name']} says Paris.")
+
+    monkeypatch.setattr(council, "fetch_model_response", fetch)
+    result = asyncio.run(council.synthesize_responses("Capital of France?", ANSWERS))
+    assert result["content"] == "Backup says Paris."
+    assert council.chairmen.failovers == 1
+    assert council.chairmen.selected == {"backup": 1}
+
+
+def test_synthesis_fails_over_when_the_chairman_errors(council, monkeypatch):
+    async def fetch(member, prompt, on_upstream=None):
+        on_upstream()
+        if member is PRIMARY:
+            return council._result(member, "Model 'Primary' encountered an error.", ok=False)
+        return council._result(member, "Backup says Paris.")
+
+    monkeypatch.setattr(council, "fetch_model_response", fetch)
+    result = asyncio.run(council.synthesize_responses("Capital of France?", ANSWERS))
+    assert result["ok"] and result["name"] == "Backup"
+    assert council.chairmen.stats([PRIMARY, BACKUP])["candidates"][0]["failure_rate"] == 1.0
+
+
+def test_streamed_synthesis_fails_over_before_the_first_token(council, monkeypatch):
+    async def stream(member, prompt, on_upstream=None):
+        on_upstream()
+        if member is PRIMARY:
+            await asyncio.sleep(1)
+        for word in ("Backup ", "says ", "Paris."):
+            yield {"type": "delta", "kind": "content", "delta": word}
+        yield {"type": "done", "result": council._result(member, "Backup says Paris.")}
+
+    monkeypatch.setattr(council, "stream_model_response", stream)
+
+    async def collect():
+        return [event async for event in council.stream_synthesis("Capital of France?", ANSWERS)]
+
+    events = asyncio.run(collect())
+    assert "".join(e["delta"] for e in events if e["type"] == "delta") == "Backup says Paris."
+    assert events[-1]["result"]["name"] == "Backup"
+    assert council.chairmen.failovers == 1
+
+
+def test_the_last_candidate_is_not_cut_off(council, monkeypatch):
+    async def fetch(member, prompt, on_upstream=None):
+        on_upstream()
+        await asyncio.sleep(0.1)
+        return council._result(member, f"{member['name']} says Paris.")
+
+    monkeypatch.setattr(council, "fetch_model_response", fetch)
+    result = asyncio.run(council.synthesize_responses("Capital of France?", ANSWERS))
+    assert result["content"] == "Backup says Paris."
+
+
+def test_only_upstream_syntheses_are_timed(monkeypatch):
+    council = CouncilService(cache=ResponseCache(MemoryCache(10, 60)))
+    council.chairmen = ChairmanSelector(timeout=5)
+    monkeypatch.setattr(council, "chairman_candidates", lambda: [PRIMARY, BACKUP])
+
+    async def routed(member, prompt):
+        await asyncio.sleep(0.05)
+        return council._result(member, "Paris.")
+
+    monkeypatch.setattr(council, "_fetch_routed", routed)
+
+    async def three_syntheses():
+        # Two at once share one call, then the third is answered from the cache
+        await asyncio.gather(*(council.synthesize_responses("Capital of France?", ANSWERS) for _ in range(2)))
+        return await council.synthesize_responses("Capital of France?", ANSWERS)
+
+    assert asyncio.run(three_syntheses())["content"] == "Paris."
+    assert len(council.chairmen._latency["primary"]) == 1
+    assert council.chairmen.expected_seconds(PRIMARY) >= 0.05
@@ -0,0 +1,109 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from app.services.circuit import CircuitBreaker, CircuitBreakers, classify, http_status
+from app.services.council import CouncilService
+
+MEMBER = {"id": "or-aurora", "name": "Aurora", "provider": "openrouter", "model": "aurora"}
+SIBLING = {"id": "or-liquid", "name": "Liquid", "provider": "openrouter", "model": "liquid"}
+
+
+@pytest.mark.parametrize("status, seconds, verdict", [
+    ("200", 1.0, True),
+    ("200", 45.0, False),
+    ("503", 1.0, False),
+    ("404", 1.0, False),
+    ("model_not_found", 1.0, False),
+    ("stream_error", 1.0, False),
+    ("429", 1.0, None),
+    ("400", 1.0, None),
+    ("queue_timeout", 1.0, None),
+    ("cancelled", 1.0, None),
+])
+def test_classify(status, seconds, verdict):
+    assert classify(status, seconds, slow_call_seconds=30) is verdict
+
+
+def test_http_status_spots_an_unknown_model():
+    assert http_status(400, '{"error": {"message": "The model `aurora-alpha` does not exist"}}') == "model_not_found"
+    assert http_status(400, '{"error": {"message": "aurora-alpha is not a valid model ID"}}') == "model_not_found"
+    assert http_status(400, '{"error": {"message": "Context length exceeded"}}') == "400"
+    assert http_status(500, "model not found") == "500"
+
+
+def test_breaker_opens_then_trials_and_recovers():
+    breaker = CircuitBreaker(window=10, min_calls=4, failure_rate=0.5, open_seconds=10, max_open_seconds=25)
+    for healthy in (True, False, True):
+        breaker.record(healthy, now=1)
+    assert breaker.state == "closed"
+    breaker.record(False, now=1)
+    assert breaker.state == "open" and not breaker.acquire(now=5)
+
+    # One trial after the cooldown; its failure doubles the next one
+    assert breaker.acquire(now=11) and breaker.state == "half_open"
+    assert not breaker.acquire(now=11)
+    breaker.record(False, now=12)
+    assert breaker.state == "open" and breaker.retry_at == 32
+    assert breaker.acquire(now=32)
+    breaker.record(False, now=33)
+    assert breaker.retry_at == 33 + 25
+
+    assert breaker.acquire(now=60)
+    breaker.record(True, now=61)
+    assert breaker.state == "closed" and breaker.cooldown == 10 and breaker.error_rate() == 0.0
+
+
+def test_a_half_open_trial_that_says_nothing_frees_the_slot():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=10)
+    breaker.record(False, now=1)
+    assert breaker.acquire(now=11)
+    breaker.record(None, now=11)
+    assert breaker.state == "half_open" and breaker.acquire(now=11)
+
+
+def breakers() -> CircuitBreakers:
+    return CircuitBreakers(window=10, min_calls=3, failure_rate=0.5, open_seconds=30)
+
+
+def test_a_retired_model_leaves_its_provider_alone():
+    scoped = breakers()
+    for _ in range(3):
+        assert scoped.acquire(MEMBER)
+        scoped.record(MEMBER, "404", 0.2)
+    assert scoped.health(MEMBER) == "down"
+    assert scoped.health(SIBLING) == "healthy"
+    assert scoped.stats()["breakers"]["provider:openrouter"]["calls"] == 0
+
+
+def test_a_provider_outage_trips_every_model():
+    scoped = breakers()
+    for _ in range(3):
+        assert scoped.acquire(MEMBER)
+        scoped.record(MEMBER, "503", 0.2)
+    assert scoped.health(MEMBER) == "down"
+    assert scoped.health(SIBLING) == "down"
+    assert not scoped.acquire(SIBLING) and scoped.rejected == 1
+
+
+def test_waiting_for_a_local_rate_limit_slot_is_not_a_slow_call(monkeypatch):
+    council = CouncilService()
+    council.breakers = CircuitBreakers(slow_call_seconds=0.1, min_calls=1)
+
+    @asynccontextmanager
+    async def congested_slot(provider):
+        await asyncio.sleep(0.2)
+        yield None
+
+    monkeypatch.setattr(council.scheduler, "slot", congested_slot)
+
+    class Upstream:
+        async def post(self, url, **kwargs):
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Paris."}}]}, request=httpx.Request("POST", url))
+
+    result = asyncio.run(council._call_provider(Upstream(), "https://upstream.test/chat", "key", MEMBER, "Capital of France?"))
+    assert result["ok"]
+    assert council.breakers.stats()["breakers"]["model:or-aurora"]["failure_rate"] == 0.0
+    assert council.profiles.stats()["models"]["or-aurora"]["p95_seconds"] < 0.1
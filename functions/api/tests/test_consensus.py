@@ -0,0 +1,46 @@
+from app.services.consensus import ConsensusDetector, answer_features
+from app.services.profiles import ModelProfiles
+
+PARIS = "The capital of France is Paris, on the Seine."
+MEMBERS = [{"id": "a", "model": "a"}, {"id": "b", "model": "b"}, {"id": "c", "model": "c"}]
+
+
+def result(content: str, ok: bool = True, **extra):
+    return {"name": content[:8], "content": content, "ok": ok, **extra}
+
+
+def test_agreeing_members_skip_the_chairman():
+    results = [result(PARIS), result(PARIS + " "), result("Paris is the capital of France, on the Seine.")]
+    best, agreement = ConsensusDetector(threshold=0.5).evaluate(results)
+    assert best is not None and agreement >= 0.5
+    assert ConsensusDetector(threshold=0.99).evaluate(results)[0] is None
+
+
+def test_different_numbers_are_not_consensus():
+    results = [result("The answer is 42."), result("The answer is 41.")]
+    best, agreement = ConsensusDetector(threshold=0.5).evaluate(results)
+    assert best is None and agreement > 0.5
+
+
+def test_profiles_reuse_the_consensus_features():
+    results = [result(PARIS), result("Error", ok=False), result("Berlin is the capital of Germany.")]
+    vectors = answer_features(results)
+    assert vectors[1] is None
+    assert ConsensusDetector().evaluate(results, vectors) == ConsensusDetector().evaluate(results)
+
+    reused, recomputed = ModelProfiles(), ModelProfiles()
+    answers = list(zip(MEMBERS, results))
+    reused.observe_round(answers, PARIS, vectors)
+    recomputed.observe_round(answers, PARIS)
+    assert reused.stats()["models"] == recomputed.stats()["models"]
+    assert reused.stats()["models"]["a"]["agreement"] == 1.0
+    assert "b" not in reused.stats()["models"]
+
+
+def test_a_reasoning_trace_never_stands_in_for_the_answer():
+    trace = result(PARIS, reasoning=True)
+    answer = result(PARIS + " ")
+    best, _ = ConsensusDetector(threshold=0.5).evaluate([trace, answer, result(PARIS, reasoning=True)])
+    assert best is answer
+    best, agreement = ConsensusDetector(threshold=0.5).evaluate([trace, result(PARIS, reasoning=True)])
+    assert best is None and agreement == 1.0
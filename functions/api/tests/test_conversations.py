@@ -0,0 +1,36 @@
+from app.services.conversations import fit_history
+
+
+def conversation(turns: int):
+    # Every message costs 1 token plus 4 of overhead, so a turn costs 10
+    messages = []
+    for i in range(turns):
+        messages += [{"role": "user", "content": f"q{i}"}, {"role": "assistant", "content": f"a{i}"}]
+    return messages
+
+
+def turns_kept(history):
+    return [m["content"] for m in history if m["role"] == "user"]
+
+
+def test_history_that_fits_is_kept_whole():
+    history = conversation(10)
+    assert fit_history(history, 100) == history
+    assert fit_history(history, 0) == []
+    assert fit_history([], 100) == []
+
+
+def test_old_turns_go_a_block_at_a_time():
+    assert turns_kept(fit_history(conversation(10), 95)) == ["q4", "q5", "q6", "q7", "q8", "q9"]
+    # Follow-ups keep the same first message, so the cached prefix still matches
+    assert turns_kept(fit_history(conversation(11), 95)) == ["q4", "q5", "q6", "q7", "q8", "q9", "q10"]
+    assert turns_kept(fit_history(conversation(13), 95))[0] == "q4"
+    assert turns_kept(fit_history(conversation(15), 95))[0] == "q8"
+
+
+def test_the_latest_block_is_trimmed_turn_by_turn():
+    assert turns_kept(fit_history(conversation(10), 25)) == ["q8", "q9"]
+    assert turns_kept(fit_history(conversation(10), 15)) == ["q9"]
+    assert fit_history(conversation(10), 9) == []
+    # Messages stay in order and in pairs
+    assert fit_history(conversation(3), 15) == [{"role": "user", "content": "q2"}, {"role": "assistant", "content": "a2"}]
@@ -0,0 +1,99 @@
+import pytest
+
+from app.core.config import settings
+from app.services.council import CouncilService
+from app.services.deliberation import compact_deliberations, estimate_tokens, split_document, strip_reasoning
+
+PARIS = "The capital of France is Paris, which sits on the Seine and has been the capital since the tenth century."
+
+
+def result(name: str, content: str, ok: bool = True, **extra):
+    return {"name": name, "content": content, "ok": ok, **extra}
+
+
+def test_strip_reasoning_drops_think_blocks():
+    assert strip_reasoning("<think>France... Paris.</think>\nParis.") == "Paris."
+    assert strip_reasoning("<THINK>a</THINK>Paris<think>b</think> is the capital.") == "Paris is the capital."
+    # Cut off by max_tokens before the answer
+    assert strip_reasoning("Paris.<think>Now let me double-check") == "Paris."
+    # Nothing but reasoning: keep it rather than send nothing
+    assert strip_reasoning("<think>Paris.</think>") == "<think>Paris.</think>"
+
+
+def test_errors_are_dropped_and_near_duplicates_merged():
+    entries = compact_deliberations([
+        result("A", PARIS),
+        result("B", "Error: upstream overloaded", ok=False),
+        result("C", "<think>Recall.</think>" + PARIS.replace("tenth", "10th")),
+        result("D", "Berlin is the capital of Germany."),
+    ], budget=10_000, dedup_threshold=0.6)
+    assert entries == [
+        {"names": ["A", "C"], "content": PARIS},
+        {"names": ["D"], "content": "Berlin is the capital of Germany."},
+    ]
+    assert len(compact_deliberations([result("A", PARIS), result("C", PARIS.replace("tenth", "10th"))], budget=10_000, dedup_threshold=1.0)) == 2
+
+
+def test_long_answers_share_what_short_ones_leave():
+    short = "Paris."
+    long_answer = " ".join(f"Point {i} about Paris." for i in range(200))
+    trace = " ".join(f"Step {i} of thinking." for i in range(200)) + " So the answer is Paris."
+    entries = compact_deliberations([
+        result("A", short),
+        result("B", long_answer),
+        result("C", trace, reasoning=True),
+    ], budget=200, dedup_threshold=1.0)
+    assert entries[0]["content"] == short
+    assert sum(estimate_tokens(e["content"]) for e in entries) <= 200 + 2 * estimate_tokens("[...]")
+    # Answers keep their opening, reasoning traces their conclusion
+    assert entries[1]["content"].startswith("Point 0") and entries[1]["content"].endswith("[...]")
+    assert entries[2]["content"].startswith("[...]") and entries[2]["content"].endswith("the answer is Paris.")
+
+
+DOCUMENT = "\n\n".join(
+    " ".join(f"Paragraph {p} makes point {s} about the river Seine." for s in range(6))
+    for p in range(8)
+) + "\n\nAppendix: " + "x" * 120
+
+
+def test_documents_are_split_on_boundaries_within_each_budget():
+    budgets = [40, 25]
+    chunks = split_document(DOCUMENT, budgets)
+    assert len(chunks) > 8
+    for index, chunk in enumerate(chunks):
+        assert estimate_tokens(chunk) <= budgets[index % len(budgets)]
+    # Nothing is lost or invented at the cuts
+    assert " ".join(" ".join(chunks).split()) == " ".join(DOCUMENT.split())
+    assert all(chunk.endswith(".") for chunk in chunks[:-3])
+    assert chunks[:3] == [
+        "Paragraph 0 makes point 0 about the river Seine. Paragraph 0 makes point 1 about the river Seine.",
+        "Paragraph 0 makes point 2 about the river Seine.",
+        "Paragraph 0 makes point 3 about the river Seine. Paragraph 0 makes point 4 about the river Seine.",
+    ]
+
+
+def test_words_longer_than_the_budget_are_cut_by_characters():
+    assert split_document("tiny " + "y" * 100, [5]) == ["tiny"] + ["y" * 20] * 5
+    # A roomier chunk puts the pieces back together without inventing spaces
+    assert split_document("tiny " + "y" * 100, [5, 50]) == ["tiny", "y" * 100]
+    assert split_document("Hi. It has two sentences.", [6, 30]) == ["Hi.", "It has two sentences."]
+
+
+def note(tokens: int, ok: bool = True):
+    return {"name": "Member", "content": " ".join(["word"] * tokens), "ok": ok}
+
+
+@pytest.mark.parametrize("sizes, expected", [
+    ([30, 30, 30, 30], [[0, 1, 2], [3]]),
+    ([90, 90, 90], [[0, 1], [2]]),
+    ([30, 30], [[0, 1]]),
+])
+def test_reduction_groups_pack_notes_within_the_chairman_budget(monkeypatch, sizes, expected):
+    monkeypatch.setattr(settings, "DELIBERATION_TOKEN_BUDGET", 100)
+    assert CouncilService()._reduction_groups([note(size) for size in sizes]) == expected
+
+
+def test_failed_notes_cost_nothing_in_a_group(monkeypatch):
+    monkeypatch.setattr(settings, "DELIBERATION_TOKEN_BUDGET", 100)
+    notes = [note(60), note(500, ok=False), note(30), note(60)]
+    assert CouncilService()._reduction_groups(notes) == [[0, 1, 2], [3]]
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+
+from app.api import routes
+from app.main import app
+from app.services.council import CouncilService
+from app.services.metrics import CLIENT_DISCONNECTS
+
+REQUEST = {"prompt": "What is the capital of France?", "active_models": ["groq-versatile"]}
+
+
+def disconnects(endpoint: str) -> float:
+    return CLIENT_DISCONNECTS._values.get((("endpoint", endpoint),), 0)
+
+
+async def call_and_leave(path: str, leave_after: float):
+    """Posts REQUEST straight to the ASGI app and disconnects `leave_after` seconds later."""
+    gone = asyncio.Event()
+    body = [{"type": "http.request", "body": json.dumps(REQUEST).encode(), "more_body": False}]
+
+    async def receive():
+        if body:
+            return body.pop()
+        await gone.wait()
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"polymind.test"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("polymind.test", 80),
+    }
+    asyncio.get_running_loop().call_later(leave_after, gone.set)
+    await asyncio.wait_for(app(scope, receive, send), 2.0)
+    return sent
+
+
+@pytest.fixture
+def council(monkeypatch):
+    service = CouncilService()
+    service.semantic_cache = None
+    service.upstream = {"started": 0, "cancelled": 0}
+    monkeypatch.setattr(routes, "_council_service", service)
+    return service
+
+
+async def upstream_call(service: CouncilService):
+    service.upstream["started"] += 1
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        service.upstream["cancelled"] += 1
+        raise
+
+
+def test_a_client_leaving_mid_deliberation_cancels_it(council, monkeypatch):
+    async def deliberate(*args, **kwargs):
+        await upstream_call(council)
+
+    monkeypatch.setattr(council, "deliberate", deliberate)
+    before = disconnects("council")
+
+    sent = asyncio.run(call_and_leave("/api/council", 0.05))
+    assert council.upstream == {"started": 1, "cancelled": 1}
+    assert sent[0]["status"] == 499
+    assert disconnects("council") == before + 1
+    assert routes.get_admission_controller().inflight == 0
+
+
+def test_a_client_leaving_a_stream_cancels_the_members_still_answering(council, monkeypatch):
+    async def stream_members(members, prompt, history=None):
+        yield 0, {"type": "delta", "kind": "content", "delta": "Par"}
+        await upstream_call(council)
+
+    monkeypatch.setattr(council, "stream_members", stream_members)
+
+    sent = asyncio.run(call_and_leave("/api/council/stream", 0.05))
+    assert council.upstream == {"started": 1, "cancelled": 1}
+    assert sent[0]["status"] == 200
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    assert b"event: member_delta" in body and b"event: done" not in body
+    assert routes.get_admission_controller().inflight == 0
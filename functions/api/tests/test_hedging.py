@@ -0,0 +1,63 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.services.consensus import ConsensusDetector
+from app.services.council import CouncilService
+from app.services.quorum import QuorumPolicy
+
+PROMPT = "What is the capital of France?"
+
+
+@pytest.fixture
+def council(monkeypatch):
+    service = CouncilService(quorum=QuorumPolicy("all"))
+    calls = Counter()
+
+    async def fetch_uncached(member, prompt):
+        calls[member["id"]] += 1
+        await asyncio.sleep(1.0 if member["id"] == "or-aurora" else 0.1)
+        return service._result(member, f"{member['id']} says Paris.")
+
+    monkeypatch.setattr(service, "_fetch_uncached", fetch_uncached)
+    service.calls = calls
+    return service
+
+
+def eager(member):
+    # Hedge after 10 ms instead of the configured seconds
+    return {**member, "hedge": {**member["hedge"], "initial_delay": 0.01}}
+
+
+def test_a_fallback_already_seated_is_not_asked_again(council):
+    aurora, qwen = council.registry.get(["or-aurora", "groq-qwen"])
+    assert aurora["fallbacks"] == ["groq-qwen"]
+    results, _ = asyncio.run(council.gather_responses([eager(aurora), qwen], PROMPT))
+    assert council.calls == {"or-aurora": 1, "groq-qwen": 1}
+    assert not any("fallback" in r for r in results)
+    assert council.hedge_stats["hedged"] == 0
+
+
+def test_a_hedge_joins_the_same_call_in_flight(council):
+    aurora, qwen = council.registry.get(["or-aurora", "groq-qwen"])
+
+    async def two_councils():
+        return await asyncio.gather(
+            council.fetch_model_response(qwen, PROMPT),
+            council.fetch_model_response(eager(aurora), PROMPT),
+        )
+
+    direct, hedged = asyncio.run(two_councils())
+    assert council.calls["groq-qwen"] == 1
+    assert hedged["fallback"] == qwen["name"] and hedged["content"] == direct["content"]
+    assert council.hedge_stats["fallback_wins"] == 1
+
+
+def test_fallback_answers_do_not_count_towards_consensus():
+    answer = {"name": "Qwen", "content": "Paris is the capital of France.", "ok": True}
+    echo = {**answer, "name": "Aurora", "fallback": "Qwen"}
+    other = {"name": "Llama", "content": "It is Lyon, I believe, not Paris.", "ok": True}
+    best, agreement = ConsensusDetector(threshold=0.5).evaluate([answer, echo, other])
+    assert best is None and agreement < 0.5
+    assert ConsensusDetector(threshold=0.5).evaluate([answer, echo]) == (None, None)
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from app.services.jobs import JobManager, JobQueueFull, JobStore
+
+
+async def wait_for_status(jobs: JobManager, job_id: str, status: str, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while jobs.get(job_id)["status"] != status:
+        assert asyncio.get_running_loop().time() < deadline, jobs.get(job_id)
+        await asyncio.sleep(0.01)
+    return jobs.get(job_id)
+
+
+def test_job_reports_members_as_they_finish_then_the_result():
+    async def scenario():
+        jobs = JobManager(JobStore())
+        release = asyncio.Event()
+
+        async def work(job_id):
+            jobs.store.record_member(job_id, 0, {"name": "A", "content": "a", "ok": True})
+            await release.wait()
+            jobs.store.set_status(job_id, "synthesizing")
+            return {"unified_response": "done"}
+
+        job_id = jobs.submit([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}], work)
+        assert jobs.get(job_id)["status"] == "queued"
+        partial = await wait_for_status(jobs, job_id, "running")
+        while partial["members"][0]["result"] is None:
+            await asyncio.sleep(0.01)
+            partial = jobs.get(job_id)
+        assert partial["members"][0]["result"]["content"] == "a"
+        assert partial["members"][1]["result"] is None
+        release.set()
+        done = await wait_for_status(jobs, job_id, "done")
+        assert done["result"] == {"unified_response": "done"}
+        assert jobs.stats()["completed"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_work_marks_the_job_failed():
+    async def scenario():
+        jobs = JobManager(JobStore())
+
+        async def work(job_id):
+            raise RuntimeError("provider exploded")
+
+        job_id = jobs.submit([], work)
+        failed = await wait_for_status(jobs, job_id, "failed")
+        assert failed["error"] == "provider exploded"
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_cap_queues_and_pending_cap_rejects():
+    async def scenario():
+        jobs = JobManager(JobStore(), max_concurrent=1, max_pending=2)
+        release = asyncio.Event()
+
+        async def work(job_id):
+            await release.wait()
+            return {}
+
+        first = jobs.submit([], work)
+        second = jobs.submit([], work)
+        await wait_for_status(jobs, first, "running")
+        await asyncio.sleep(0.05)
+        assert jobs.get(second)["status"] == "queued"
+        with pytest.raises(JobQueueFull):
+            jobs.submit([], work)
+        release.set()
+        await wait_for_status(jobs, second, "done")
+
+    asyncio.run(scenario())
+
+
+def test_restart_fails_jobs_left_unfinished():
+    store = JobStore()
+    store.create("stale", [])
+    store.set_status("stale", "running")
+    JobManager(store)
+    assert store.get("stale")["status"] == "failed"
+
+
+def test_jobs_are_refused_under_mangum(apigw_event, mangum_handler):
+    response = mangum_handler(apigw_event("POST", "/api/council/jobs", {"prompt": "hi", "active_models": ["groq-qwen"]}), None)
+    assert response["statusCode"] == 501
+    assert "long-running server" in response["body"]
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.services.quorum import QuorumPolicy, gather_with_quorum
+
+
+async def member(delay: float, content: str = "answer", ok: bool = True):
+    await asyncio.sleep(delay)
+    return {"content": content, "ok": ok}
+
+
+def gather(policy: QuorumPolicy, *calls):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tasks = [asyncio.ensure_future(call) for call in calls]
+        results, stragglers = await gather_with_quorum(tasks, policy, is_answer=lambda r: r["ok"])
+        await asyncio.sleep(0)
+        return results, stragglers, loop.time() - start, tasks
+
+    return asyncio.run(scenario())
+
+
+def test_first_k_returns_once_k_members_answered_and_cancels_the_rest():
+    results, stragglers, elapsed, tasks = gather(
+        QuorumPolicy("first_k", min_members=2), member(0.01), member(0.02), member(1.0)
+    )
+    assert stragglers == [2] and results[2] is None
+    assert elapsed < 0.5
+    assert tasks[2].cancelled()
+
+
+def test_first_k_does_not_count_errors():
+    results, stragglers, _, _ = gather(
+        QuorumPolicy("first_k", min_members=2), member(0.01, ok=False), member(0.02), member(0.05)
+    )
+    assert stragglers == []
+    assert [r["ok"] for r in results] == [False, True, True]
+
+
+def test_first_k_settles_for_one_answer_past_the_deadline():
+    _, stragglers, elapsed, _ = gather(
+        QuorumPolicy("first_k", min_members=3, deadline=0.1), member(0.01), member(1.0), member(1.0)
+    )
+    assert stragglers == [1, 2]
+    assert 0.1 <= elapsed < 0.5
+
+
+def test_deadline_mode_collects_what_arrived_in_time():
+    results, stragglers, elapsed, _ = gather(
+        QuorumPolicy("deadline", deadline=0.1), member(0.01), member(0.02), member(1.0)
+    )
+    assert stragglers == [2] and results[0] and results[1]
+    assert 0.1 <= elapsed < 0.5
+
+
+def test_all_waits_for_everyone():
+    _, stragglers, elapsed, _ = gather(QuorumPolicy("all"), member(0.01), member(0.1))
+    assert stragglers == [] and elapsed >= 0.1
+
+
+def test_detached_stragglers_run_to_completion():
+    async def scenario():
+        late = asyncio.ensure_future(member(0.05, "late"))
+        _, stragglers = await gather_with_quorum(
+            [member(0.01), late], QuorumPolicy("first_k", min_members=1, detach_stragglers=True)
+        )
+        assert stragglers == [1]
+        assert (await late)["content"] == "late"
+
+    asyncio.run(scenario())
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        QuorumPolicy("most")
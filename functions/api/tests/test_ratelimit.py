@@ -0,0 +1,91 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from app.services.ratelimit import ProviderLimiter, RateLimitTimeout, parse_delay
+
+NOW = 1_700_000_000.0
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2", 2.0),
+    ("0.5", 0.5),
+    ("-3", 0.0),
+    ("250ms", 0.25),
+    ("1m30.5s", 90.5),
+    ("1h", 3600.0),
+    (str(NOW + 7), 7.0),
+    (str(int((NOW + 7) * 1000)), 7.0),
+    (str(NOW - 7), 0.0),
+    (formatdate(NOW + 30, usegmt=True), 30.0),
+    ("", None),
+    (None, None),
+    ("soon", None),
+    ("2s later", None),
+])
+def test_parse_delay(value, expected):
+    assert parse_delay(value, now=NOW) == expected
+
+
+def limiter(**overrides) -> ProviderLimiter:
+    options = {"rate": 100.0, "burst": 10, "max_concurrency": 8, "max_wait": 0.2}
+    options.update(overrides)
+    return ProviderLimiter("groq", **options)
+
+
+def test_successes_grow_the_limit_and_429s_halve_it():
+    provider = limiter()
+    assert provider.limit == 4
+    for _ in range(4):
+        provider.observe(200, {})
+    assert provider.limit == pytest.approx(5, abs=0.1)
+    for _ in range(100):
+        provider.observe(200, {})
+    assert provider.limit == 8
+
+    assert provider.observe(429, {"retry-after": "2"}) == 2.0
+    assert provider.limit == 4 and provider.tokens == 0 and provider.throttled == 1
+    assert provider.blocked_until == pytest.approx(time.monotonic() + 2, abs=0.1)
+    for _ in range(5):
+        provider.observe(429, {})
+    assert provider.limit == provider.min_concurrency == 1
+
+    # Other errors leave the limit alone
+    provider.observe(500, {})
+    assert provider.limit == 1
+
+
+def test_an_exhausted_quota_blocks_until_its_reset():
+    provider = limiter()
+    provider.observe(200, {"x-ratelimit-remaining-requests": "5", "x-ratelimit-reset-requests": "30s"})
+    assert provider.blocked_until == 0.0
+    provider.observe(200, {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "30s"})
+    assert provider.blocked_until == pytest.approx(time.monotonic() + 30, abs=0.1)
+
+    async def scenario():
+        with pytest.raises(RateLimitTimeout):
+            await provider.acquire()
+
+    asyncio.run(scenario())
+    assert provider.timeouts == 1 and provider.in_flight == 0
+
+
+def test_requests_past_the_limit_wait_for_a_release():
+    async def scenario():
+        provider = limiter(max_concurrency=2)
+        assert provider.limit == 1
+        await provider.acquire()
+        waiter = asyncio.create_task(provider.acquire())
+        await asyncio.sleep(0.02)
+        assert not waiter.done() and provider.waiting == 1
+        await provider.release()
+        await asyncio.wait_for(waiter, 0.1)
+        assert provider.in_flight == 1 and provider.waiting == 0
+
+        # Nobody releases this time
+        with pytest.raises(RateLimitTimeout):
+            await provider.acquire()
+
+    asyncio.run(scenario())
@@ -0,0 +1,31 @@
+import copy
+import json
+
+import pytest
+
+from app.services.registry import DEFAULT_MODELS_PATH, RegistryError, validate
+
+
+@pytest.fixture
+def bundled():
+    with open(DEFAULT_MODELS_PATH) as f:
+        return json.load(f)
+
+
+def test_bundled_models_file_is_valid(bundled):
+    assert "groq-qwen" in validate(bundled)
+
+
+def test_fallback_to_the_same_provider_and_model_is_rejected(bundled):
+    data = copy.deepcopy(bundled)
+    data["models"]["or-aurora"]["fallbacks"] = ["or-liquid"]
+    with pytest.raises(RegistryError, match="same provider and model"):
+        validate(data)
+
+
+
+def test_fallbacks_that_loop_back_are_rejected(bundled):
+    data = copy.deepcopy(bundled)
+    data["models"]["groq-qwen"]["fallbacks"] = ["or-aurora"]
+    with pytest.raises(RegistryError, match="loop back"):
+        validate(data)
@@ -0,0 +1,57 @@
+import asyncio
+import base64
+import gzip
+import json
+
+import httpx
+import pytest
+
+from app.api import routes
+from app.main import app
+from app.services.council import CouncilService
+
+DELIBERATION = {
+    "unified_response": "Paris. " * 400,
+    "individual_responses": [{"name": "Llama 3.3 70B (Groq)", "content": "Paris. " * 400, "ok": True}],
+    "chairman_model": "Llama 3.3 70B (Groq)",
+    "omitted_members": [],
+    "agreement_score": None,
+}
+REQUEST = {"prompt": "What is the capital of France?", "active_models": ["groq-versatile"]}
+
+
+@pytest.fixture
+def council(monkeypatch):
+    service = CouncilService()
+    service.semantic_cache = None
+
+    async def deliberate(*args, **kwargs):
+        return dict(DELIBERATION)
+
+    monkeypatch.setattr(service, "deliberate", deliberate)
+    monkeypatch.setattr(routes, "_council_service", service)
+    return service
+
+
+def test_council_responses_are_gzipped_for_clients_that_accept_it(council):
+    async def request():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://polymind.test") as client:
+            return await client.post("/api/council", json=REQUEST, headers={"Accept-Encoding": "gzip"})
+
+    response = asyncio.run(request())
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["unified_response"] == DELIBERATION["unified_response"]
+
+
+def test_council_responses_pass_mangum_uncompressed(council, apigw_event, mangum_handler):
+    reply = mangum_handler(apigw_event("POST", "/api/council", REQUEST, {"accept-encoding": "gzip, br"}), {})
+    assert reply["statusCode"] == 200
+    headers = {k.lower(): v for k, v in reply.get("multiValueHeaders", {}).items()}
+    headers.update({k.lower(): [v] for k, v in reply.get("headers", {}).items()})
+    assert "content-encoding" not in headers
+    body = base64.b64decode(reply["body"]) if reply["isBase64Encoded"] else reply["body"].encode()
+    with pytest.raises(gzip.BadGzipFile):
+        gzip.decompress(body)
+    assert json.loads(body)["unified_response"] == DELIBERATION["unified_response"]
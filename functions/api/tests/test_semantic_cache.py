@@ -0,0 +1,59 @@
+from app.services import semantic_cache as semantic_module
+from app.services.council import CouncilService
+from app.services.semantic_cache import SemanticCache, normalize, signature, similarity
+
+PROMPT = "What is the capital city of France and what river runs through it?"
+REWORDED = "What is the capital city of France and which river runs through it?"
+COUNCIL = "groq-qwen,groq-versatile"
+
+
+def test_near_duplicates_hit_only_above_the_threshold():
+    score = similarity(signature(normalize(PROMPT)), signature(normalize(REWORDED)))
+    assert 0.5 < score < 1.0
+
+    strict = SemanticCache(threshold=score + 0.01)
+    strict.store(COUNCIL, PROMPT, "Paris, on the Seine.")
+    assert strict.lookup(COUNCIL, REWORDED) is None
+
+    loose = SemanticCache(threshold=score - 0.01)
+    loose.store(COUNCIL, PROMPT, "Paris, on the Seine.")
+    assert loose.lookup(COUNCIL, REWORDED) == ("Paris, on the Seine.", round(score, 4))
+    # Case, punctuation and spacing are not differences at all
+    assert strict.lookup(COUNCIL, "what is the capital city of France,  and what river runs through it") == ("Paris, on the Seine.", 1.0)
+    assert loose.lookup(COUNCIL, "What is the capital of Germany?") is None
+    assert (loose.hits, loose.misses) == (1, 1)
+
+
+def test_prompts_with_different_numbers_never_match():
+    cache = SemanticCache(threshold=0.5)
+    cache.store(COUNCIL, "Summarise the events of the year 1789 in France.", "The Revolution.")
+    assert cache.lookup(COUNCIL, "Summarise the events of the year 1799 in France.") is None
+    assert cache.lookup(COUNCIL, "Summarise the events of the year 1789 in France!") is not None
+
+
+def test_entries_are_scoped_to_the_council_that_answered():
+    cache = SemanticCache(threshold=0.5)
+    cache.store(COUNCIL, PROMPT, "Paris, on the Seine.")
+    assert cache.lookup("groq-versatile", PROMPT) is None
+    assert cache.lookup("groq-versatile", REWORDED) is None
+
+    service = CouncilService()
+    service.semantic_cache = cache
+    members = service.registry.get(["groq-versatile", "groq-qwen"])
+    assert service._semantic_namespace(members) == service._semantic_namespace(members[::-1]) == COUNCIL
+    assert service.semantic_lookup(members, REWORDED)[0] == "Paris, on the Seine."
+    assert service.semantic_lookup(members[:1], REWORDED) is None
+
+
+def test_entries_expire_and_the_oldest_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_module.time, "time", lambda: now[0])
+    cache = SemanticCache(threshold=0.9, max_entries=2, ttl=60)
+    cache.store(COUNCIL, "first question", 1)
+    cache.store(COUNCIL, "second question", 2)
+    assert cache.lookup(COUNCIL, "first question") == (1, 1.0)
+    cache.store(COUNCIL, "third question", 3)
+    assert cache.evictions == 1 and len(cache) == 2
+    assert cache.lookup(COUNCIL, "second question") is None
+    now[0] += 61
+    assert cache.lookup(COUNCIL, "first question") is None
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.services.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"content": "shared"}
+
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert flights.stats() == {"executed": 1, "deduplicated": 4, "dedup_ratio": 0.8, "in_flight": 0}
+        # Finished flights are forgotten: the next call runs again
+        await flights.do("key", fetch)
+        assert calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_waiters_share_the_exception():
+    async def scenario():
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        outcomes = await asyncio.gather(flights.do("key", fail), flights.do("key", fail), return_exceptions=True)
+        assert [str(e) for e in outcomes] == ["upstream down", "upstream down"]
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_the_call_is_cancelled_only_with_its_last_waiter():
+    async def scenario():
+        flights = SingleFlight()
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "late"
+
+        first = asyncio.create_task(flights.do("key", slow))
+        second = asyncio.create_task(flights.do("key", slow))
+        await started.wait()
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    asyncio.run(scenario())
+
+
+def test_a_caller_arriving_as_the_last_waiter_leaves_starts_afresh():
+    async def scenario():
+        flights = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "fresh"
+
+        leaving = asyncio.create_task(flights.do("key", slow))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leaving
+        # The abandoned flight is cancelled but may not have finished yet
+        assert await flights.do("key", fast) == "fresh"
+        assert flights.stats()["executed"] == 2
+
+    asyncio.run(scenario())
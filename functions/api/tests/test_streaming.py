@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import httpx
+
+from app.services.council import CouncilService
+
+PROMPT = "What is the capital of France?"
+
+
+def sse(*chunks) -> bytes:
+    lines = [": OPENROUTER PROCESSING", ""]
+    for chunk in chunks:
+        lines += ["data: " + (chunk if isinstance(chunk, str) else json.dumps(chunk)), ""]
+    return "\n".join(lines).encode()
+
+
+def delta(**fields):
+    return {"choices": [{"delta": fields}]}
+
+
+def stream(body: bytes, member_id: str = "groq-versatile"):
+    service = CouncilService()
+    member = service.registry.get([member_id])[0]
+
+    async def scenario():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body, headers={"content-type": "text/event-stream"}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [event async for event in service._stream_provider(client, "http://provider.test/chat", "key", member, PROMPT)]
+
+    return asyncio.run(scenario())
+
+
+def test_deltas_are_forwarded_and_assembled_into_the_answer():
+    events = stream(sse(
+        delta(role="assistant"),
+        delta(content="The capital "),
+        delta(content="is Paris."),
+        {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 5}},
+        "[DONE]",
+        delta(content="ignored after DONE"),
+    ))
+    assert [e["delta"] for e in events if e["type"] == "delta"] == ["The capital ", "is Paris."]
+    assert {e["kind"] for e in events if e["type"] == "delta"} == {"content"}
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["result"]["content"] == "The capital is Paris." and done["result"]["ok"]
+    assert "reasoning" not in done["result"]
+
+
+def test_reasoning_only_streams_fall_back_to_the_trace():
+    events = stream(sse(delta(reasoning_content="Thinking about France. "), delta(reasoning="Paris."), "[DONE]"))
+    assert [(e["kind"], e["delta"]) for e in events if e["type"] == "delta"] == [
+        ("reasoning", "Thinking about France. "),
+        ("reasoning", "Paris."),
+    ]
+    result = events[-1]["result"]
+    assert result["content"] == "Thinking about France." and result["reasoning"] is True
+
+
+def test_an_error_chunk_ends_the_stream_as_a_failure():
+    events = stream(sse(delta(content="Par"), {"error": {"message": "Upstream overloaded"}}, delta(content="is")))
+    assert [e["type"] for e in events] == ["delta", "done"]
+    assert events[-1]["result"] == {"name": events[-1]["result"]["name"], "content": "Error: Upstream overloaded", "ok": False}
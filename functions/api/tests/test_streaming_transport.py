@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from benchmarks.streaming import StreamingASGITransport
+
+
+def slow_stream_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/events")
+    async def events():
+        async def body():
+            yield b"data: first\n\n"
+            await asyncio.sleep(0.3)
+            yield b"data: last\n\n"
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    return app
+
+
+def test_first_chunk_arrives_before_the_body_completes():
+    async def scenario():
+        transport = StreamingASGITransport(slow_stream_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            start = time.perf_counter()
+            async with client.stream("GET", "/events") as response:
+                arrivals = [(line, time.perf_counter() - start) async for line in response.aiter_lines() if line]
+        return arrivals
+
+    arrivals = asyncio.run(scenario())
+    assert [line for line, _ in arrivals] == ["data: first", "data: last"]
+    assert arrivals[0][1] < 0.15 <= arrivals[1][1]
+
+
+def test_closing_early_disconnects_the_app():
+    async def scenario():
+        transport = StreamingASGITransport(slow_stream_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            start = time.perf_counter()
+            async with client.stream("GET", "/events") as response:
+                async for _ in response.aiter_lines():
+                    break
+            return time.perf_counter() - start
+
+    # Well before the 1 s grace period: the app saw http.disconnect and stopped
+    assert asyncio.run(scenario()) < 0.5
@@ -33,6 +33,7 @@ function App() {
   
   const {
     activeModels,
+    autoCouncil,
     availableModels,
     messages,
     input,
@@ -41,6 +42,7 @@ function App() {
     messageListRef,
     setInput,
     toggleModel,
+    toggleAutoCouncil,
     toggleDreamMode,
     sendMessage,
     conversations,
@@ -81,6 +83,8 @@ function App() {
           availableModels={availableModels}
           activeModels={activeModels}
           toggleModel={toggleModel}
+          autoCouncil={autoCouncil}
+          toggleAutoCouncil={toggleAutoCouncil}
         />
 
         <MainDisplay>
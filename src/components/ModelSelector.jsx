@@ -1,9 +1,9 @@
 import React from 'react';
 import styled, { keyframes, css } from 'styled-components';
-import { X, Cpu, Zap, Brain, Shield, Sparkles, Box } from 'lucide-react';
+import { X, Cpu, Zap, Brain, Shield, Sparkles, Box, Gauge } from 'lucide-react';
 import Switch from './Switch';
 
-const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleModel }) => {
+const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleModel, autoCouncil, toggleAutoCouncil }) => {
   if (!isOpen) return null;
 
   const getModelIcon = (id) => {
@@ -46,6 +46,26 @@ const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleM
         </PanelHeader>
 
         <ModelList>
+          <ModelRow
+            $isActive={autoCouncil}
+            $color={AUTO_COLOR}
+            $index={0}
+            onClick={toggleAutoCouncil}
+          >
+            <ModelLeft>
+              <IconCircle $isActive={autoCouncil} $color={AUTO_COLOR}>
+                <Gauge size={20} />
+              </IconCircle>
+              <ModelInfo>
+                <ModelName $isActive={autoCouncil}>Auto council</ModelName>
+                <ModelIdText>picks the fastest, most useful of the active models</ModelIdText>
+              </ModelInfo>
+            </ModelLeft>
+            <Switch
+              checked={autoCouncil}
+              onChange={toggleAutoCouncil}
+            />
+          </ModelRow>
           {availableModels.map((model, index) => {
             const isActive = activeModels.includes(model.id);
             const color = getModelColor(model.id);
@@ -54,7 +74,7 @@ const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleM
                 key={model.id} 
                 $isActive={isActive}
                 $color={color}
-                $index={index}
+                $index={index + 1}
                 onClick={() => toggleModel(model.id)}
               >
                 <ModelLeft>
@@ -63,7 +83,12 @@ const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleM
                   </IconCircle>
                   <ModelInfo>
                     <ModelName $isActive={isActive}>{model.name}</ModelName>
-                    <ModelIdText>{model.id}</ModelIdText>
+                    <ModelIdText>
+                      {model.id}
+                      {model.health && model.health !== 'healthy' && (
+                        <HealthTag $health={model.health}>{model.health}</HealthTag>
+                      )}
+                    </ModelIdText>
                   </ModelInfo>
                 </ModelLeft>
                 <Switch 
@@ -79,6 +104,8 @@ const ModelSelector = ({ isOpen, onClose, availableModels, activeModels, toggleM
   );
 };
 
+const AUTO_COLOR = '#00cec9';
+
 // Animations
 const fadeIn = keyframes`
   from { opacity: 0; }
@@ -264,4 +291,11 @@ const ModelIdText = styled.span`
   opacity: 0.6;
 `;
 
+const HealthTag = styled.span`
+  margin-left: 6px;
+  text-transform: uppercase;
+  letter-spacing: 0.5px;
+  color: ${props => props.$health === 'down' ? '#ff7675' : '#fdcb6e'};
+`;
+
 export default ModelSelector;
@@ -2,23 +2,17 @@
 import { useState, useRef, useEffect, useCallback } from 'react';
 import axios from 'axios';
 
-const AVAILABLE_MODELS = [
-  { id: 'groq-qwen', name: 'Qwen 3 32B (Groq)' },
-  { id: 'groq-gptoss', name: 'GPT OSS 20B (Groq)' },
-  { id: 'groq-versatile', name: 'Llama 3.3 70B (Groq)' },
-  { id: 'nvidia-deepseek', name: 'DeepSeek V3.1 (Nvidia)' },
-  { id: 'or-aurora', name: 'Liquid LFM 2.5 (OpenRouter)' },
-  { id: 'or-trinity', name: 'Trinity Large Preview (OpenRouter)' },
-  { id: 'or-liquid', name: 'Liquid LFM 2.5 (OpenRouter)' },
-  { id: 'or-seed', name: 'Seedream 4.5 (OpenRouter)' },
-];
-
 const DEFAULT_ACTIVE_MODELS = ['groq-qwen', 'groq-versatile', 'groq-gptoss', 'nvidia-deepseek', 'or-aurora', 'or-trinity', 'or-liquid'];
 
 let nextConversationId = 1;
 
+// Server-side id under which the backend keeps this conversation's history
+const newServerId = () =>
+  (globalThis.crypto?.randomUUID?.() || `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`);
+
 const createConversation = () => ({
   id: nextConversationId++,
+  serverId: newServerId(),
   title: 'New Chat',
   messages: [],
   createdAt: Date.now(),
@@ -27,11 +21,16 @@ const createConversation = () => ({
 export const useChat = () => {
   const [conversations, setConversations] = useState(() => [createConversation()]);
   const [activeConversationId, setActiveConversationId] = useState(1);
+  const [availableModels, setAvailableModels] = useState([]);
   const [activeModels, setActiveModels] = useState(DEFAULT_ACTIVE_MODELS);
+  // Let the backend pick the members from the active models, by their track record
+  const [autoCouncil, setAutoCouncil] = useState(false);
   const [dreamMode, setDreamMode] = useState(false);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
   const messageListRef = useRef(null);
+  // In-flight council request, so the backend can stop its work when we no longer want the answer
+  const pendingRequest = useRef(null);
 
   // Derived: current conversation's messages
   const activeConversation = conversations.find(c => c.id === activeConversationId);
@@ -43,8 +42,25 @@ export const useChat = () => {
     );
   };
 
+  const toggleAutoCouncil = () => setAutoCouncil(prev => !prev);
+
   const toggleDreamMode = () => setDreamMode(prev => !prev);
 
+  // Model list comes from the backend registry; the browser revalidates it with its ETag
+  useEffect(() => {
+    const apiUrl = import.meta.env.VITE_API_URL || '/api';
+    axios.get(`${apiUrl}/models`)
+      .then(response => {
+        setAvailableModels(response.data);
+        const known = new Set(response.data.map(m => m.id));
+        setActiveModels(prev => prev.filter(id => known.has(id)));
+      })
+      .catch(error => console.error("Error loading council models:", error));
+  }, []);
+
+  // Leaving the page abandons the request
+  useEffect(() => () => pendingRequest.current?.controller.abort(), []);
+
   // Auto-scroll on new messages
   useEffect(() => {
     if (messageListRef.current) {
@@ -87,13 +103,17 @@ export const useChat = () => {
     setInput('');
     setLoading(true);
 
+    const controller = new AbortController();
+    pendingRequest.current = { controller, conversationId: activeConversationId };
+
     try {
       const apiUrl = import.meta.env.VITE_API_URL || '/api';
       const response = await axios.post(`${apiUrl}/council`, {
         prompt: userMessage.content,
-        active_models: activeModels,
-        dream_mode: dreamMode
-      });
+        active_models: autoCouncil ? ['auto', ...activeModels] : activeModels,
+        dream_mode: dreamMode,
+        conversation_id: activeConversation?.serverId
+      }, { signal: controller.signal });
 
       const aiMessage = {
         role: 'assistant',
@@ -104,6 +124,9 @@ export const useChat = () => {
 
       updateActiveMessages(prev => [...prev, aiMessage]);
     } catch (error) {
+      // Aborted on purpose: the conversation is gone, nothing to report
+      if (axios.isCancel(error)) return;
+
       console.error("Error communicating with council:", error);
       
       // Detailed logging for debugging
@@ -136,6 +159,9 @@ export const useChat = () => {
         content: errorMessage
       }]);
     } finally {
+      if (pendingRequest.current?.controller === controller) {
+        pendingRequest.current = null;
+      }
       setLoading(false);
     }
   };
@@ -160,6 +186,15 @@ export const useChat = () => {
 
   // Delete a conversation
   const deleteConversation = useCallback((id) => {
+    const deleted = conversations.find(c => c.id === id);
+    if (pendingRequest.current?.conversationId === id) {
+      pendingRequest.current.controller.abort();
+    }
+    if (deleted) {
+      const apiUrl = import.meta.env.VITE_API_URL || '/api';
+      // Best effort: the server forgets idle conversations on its own anyway
+      axios.delete(`${apiUrl}/conversations/${deleted.serverId}`).catch(() => {});
+    }
     setConversations(prev => {
       const remaining = prev.filter(c => c.id !== id);
       // If deleting the active one, switch to the first remaining or create new
@@ -173,12 +208,13 @@ export const useChat = () => {
       }
       return remaining;
     });
-  }, [activeConversationId]);
+  }, [activeConversationId, conversations]);
 
   return {
     // Current chat
     activeModels,
-    availableModels: AVAILABLE_MODELS,
+    autoCouncil,
+    availableModels,
     messages,
     input,
     loading,
@@ -186,6 +222,7 @@ export const useChat = () => {
     messageListRef,
     setInput,
     toggleModel,
+    toggleAutoCouncil,
     toggleDreamMode,
     sendMessage,
     // Multi-conversation